@@ -0,0 +1,54 @@
+"""
+Measure `tl check` on a synthetic project of many languages with many keys
+each, once with a single worker and once with the default worker count.
+
+```bash
+$ python -m benchmarks.bench_check --languages 80 --keys 50000
+```
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_toml_backends import write_language_file
+from tl.utils import config_utils
+from tl.utils.check_utils import check_languages
+from tl.utils.config_utils import CONFIG_ENV, reload
+
+KEYS_PER_SECTION: int = 100
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--languages", type=int, default=80)
+    _ = parser.add_argument("--keys", type=int, default=50_000)
+    args = parser.parse_args()
+
+    sections = max(args.keys // KEYS_PER_SECTION, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        (i18n_dir := Path(tmp) / "i18n").mkdir()
+        config = ['[paths]\ni18n_dir = "i18n"\n\n[languages]\nfallback = "l0"\n']
+        for i in range(args.languages):
+            write_language_file(i18n_dir / f"l{i}.toml", sections, KEYS_PER_SECTION)
+            config.append(f'\n[languages.l{i}]\nfile = "l{i}.toml"\n')
+        _ = (Path(tmp) / "config.toml").write_text("".join(config))
+
+        os.environ[CONFIG_ENV] = str(Path(tmp) / "config.toml")
+        config_utils._resolve_config_file_path.cache_clear()
+        _ = reload()
+
+        keys = sections * KEYS_PER_SECTION
+        print(f"{args.languages} languages x {keys:,} keys")
+        for workers in (1, os.cpu_count() or 1):
+            start = time.perf_counter()
+            report = check_languages(workers=workers)
+            elapsed = time.perf_counter() - start
+            assert report.ok
+            print(f"{workers:>3} workers: {elapsed:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Measure lookup throughput through the shared catalog cache as the number of
+threads grows, and how many parses a burst of concurrent cold misses causes.
+Throughput only scales past one thread on a free-threaded build.
+
+```bash
+$ python -m benchmarks.bench_concurrency --lookups 20000
+```
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks.bench_toml_backends import write_language_file
+from tl.utils.toml_utils import CATALOG_CACHE, _get_value_from_key
+
+THREAD_COUNTS: tuple[int, ...] = (1, 2, 4, 8, 16, 32, 64)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "language.toml"
+        write_language_file(path, 50, 100)
+
+        CATALOG_CACHE.clear()
+        with ThreadPoolExecutor(max_workers=64) as pool:
+            _ = list(
+                pool.map(lambda _: _get_value_from_key(path, "section_0"), range(64))
+            )
+        print(f"64 concurrent cold misses: {CATALOG_CACHE.misses} parse(s)")
+
+        def work(thread: int) -> None:
+            key_path = f"section_{thread % 50}.key_0"
+            for _ in range(args.lookups):
+                _ = _get_value_from_key(path, key_path)
+
+        single = 0.0
+        for threads in THREAD_COUNTS:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                _ = list(pool.map(work, range(threads)))
+            rate = threads * args.lookups / (time.perf_counter() - start)
+            single = single or rate
+            print(
+                f"{threads:>3} threads: {rate:12,.0f} lookups/s  x{rate / single:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
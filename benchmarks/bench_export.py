@@ -0,0 +1,73 @@
+"""
+Compare the peak memory and time of exporting a synthetic language file with
+`tomlkit.dumps()` against streaming it to a file with `export_catalog()`,
+from a TOML-compiled catalog and from a binary catalog.
+
+```bash
+$ python -m benchmarks.bench_export --keys 10000 100000 500000
+```
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from benchmarks.synthetic import write_catalog
+from tl.utils.catalog_utils import Catalog
+from tl.utils.compile_utils import open_compiled_catalog, write_compiled_catalog
+from tl.utils.export_utils import EXPORT_FORMATS, export_catalog
+from tl.utils.toml_utils import parse_toml_file
+
+
+def _measure(func: Callable[[], object]) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    _ = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--keys", type=int, nargs="+", default=[10_000, 100_000])
+    _ = parser.add_argument("--depth", type=int, default=2)
+    args = parser.parse_args()
+
+    import tomlkit
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "en.toml"
+        out_path = Path(tmp) / "out"
+        for keys in args.keys:
+            _ = write_catalog(path, keys, args.depth)
+            toml_dict = parse_toml_file(path)
+            catalog = Catalog(toml_dict)
+            _ = write_compiled_catalog(toml_dict, path)
+            binary_catalog = open_compiled_catalog(path)
+            assert binary_catalog is not None
+            del toml_dict
+
+            print(f"{keys:,} keys, {path.stat().st_size / 2**20:.1f} MiB of TOML")
+            elapsed, peak = _measure(lambda: tomlkit.dumps(catalog.tree))
+            print(f"  {'tomlkit.dumps':<22} {elapsed:7.2f}s  peak {peak:8.1f} MiB")
+            for export_format in EXPORT_FORMATS:
+                for name, source in (("catalog", catalog), ("binary", binary_catalog)):
+
+                    def export() -> None:
+                        with open(out_path, "w", encoding="utf-8") as f:
+                            _ = export_catalog(source, f, export_format)  # type: ignore[arg-type]
+
+                    elapsed, peak = _measure(export)
+                    label = f"{export_format} ({name})"
+                    print(f"  {label:<22} {elapsed:7.2f}s  peak {peak:8.1f} MiB")
+            os.unlink(path.with_suffix(".tlc"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Measure the per-lookup cost of logging when it is off (the library default),
+on at INFO, and on at DEBUG, both written inline and through the queued sink.
+
+```bash
+$ python -m benchmarks.bench_logging --number 20000
+```
+"""
+
+import argparse
+import logging
+import tempfile
+import timeit
+from pathlib import Path
+
+from benchmarks.bench_toml_backends import write_language_file
+from tl.utils.log_utils import configure_logging, reset_logging
+from tl.utils.toml_utils import get_value_from_key
+
+# level and whether records are written from a background thread, or None to
+# leave logging unconfigured
+MODES: dict[str, tuple[int, bool] | None] = {
+    "off": None,
+    "INFO": (logging.INFO, False),
+    "DEBUG": (logging.DEBUG, False),
+    "DEBUG queued": (logging.DEBUG, True),
+}
+
+KEY_PATHS: tuple[str, ...] = ("section_0.key_0", "section_0", "section_0.*")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--number", type=int, default=20_000)
+    _ = parser.add_argument("--keys", type=int, default=1_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "language.toml"
+        write_language_file(path, 10, args.keys)
+        _ = get_value_from_key(path, KEY_PATHS[0])  # warm the catalog cache
+
+        for mode, config in MODES.items():
+            if config is not None:
+                level, queued = config
+                configure_logging(level, Path(tmp) / f"{mode}.log", queued=queued)
+            timings = "".join(
+                f"  {key_path} "
+                f"{timeit.timeit(lambda: get_value_from_key(path, key_path), number=args.number) / args.number * 1e6:6.2f} us"
+                for key_path in KEY_PATHS
+            )
+            reset_logging()
+            print(f"{mode:>12}:{timings}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Report the resident size per language of the runtime catalogs compared to
+parsed tomlkit documents and tomllib dicts, with many languages resident in
+one process. Each representation is measured in a fresh interpreter.
+
+```bash
+$ python -m benchmarks.bench_memory --languages 10 --keys 50000
+```
+"""
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.synthetic import write_project
+
+REPRESENTATIONS: tuple[str, ...] = ("tomlkit", "tomllib", "catalog")
+
+
+def _rss() -> int:
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) * 1024
+    import resource
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def measure(representation: str, paths: list[Path]) -> dict[str, float]:
+    """
+    Load every language file into one representation and keep them all
+    resident, like a worker serving every language.
+
+    Returns:
+        dict[str, float]: the traced and resident bytes per language
+    """
+    import tomlkit
+
+    from tl.utils.catalog_utils import Catalog
+    from tl.utils.toml_utils import parse_toml_file
+
+    loaders = {
+        "tomlkit": lambda path: tomlkit.parse(path.read_text(encoding="utf-8")),
+        "tomllib": lambda path: parse_toml_file(path, "tomllib"),
+        "catalog": lambda path: Catalog(parse_toml_file(path, "tomllib")),
+    }
+    load = loaders[representation]
+    gc.collect()
+    rss = _rss()
+    tracemalloc.start()
+    resident = [load(path) for path in paths]
+    gc.collect()
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = _rss() - rss
+    del resident
+    return {"traced_bytes": traced / len(paths), "rss_bytes": rss / len(paths)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--languages", type=int, default=10)
+    _ = parser.add_argument("--keys", type=int, default=50_000)
+    _ = parser.add_argument("--json", action="store_true", help="print JSON")
+    _ = parser.add_argument(
+        "--measure", choices=REPRESENTATIONS, help=argparse.SUPPRESS
+    )
+    _ = parser.add_argument("paths", nargs="*", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:  # in a fresh interpreter started below
+        print(json.dumps(measure(args.measure, args.paths)))
+        return
+
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        _ = write_project(Path(tmp), args.keys, args.languages)
+        paths = sorted(str(path) for path in (Path(tmp) / "i18n").glob("*.toml"))
+        for representation in REPRESENTATIONS:
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_memory"]
+                + ["--measure", representation, *paths],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results[representation] = json.loads(output)
+
+    if args.json:
+        print(json.dumps({"languages": args.languages, "keys": args.keys, **results}))
+        return
+    print(f"{args.languages} languages x {args.keys:,} keys, per language:")
+    baseline = results["tomlkit"]["traced_bytes"]
+    for representation, result in results.items():
+        print(
+            f"{representation:>8}: {result['traced_bytes'] / 2**20:8.1f} MiB traced"
+            f"  {result['rss_bytes'] / 2**20:8.1f} MiB RSS"
+            f"  x{result['traced_bytes'] / baseline:.2f} of tomlkit"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Measure the main code paths on synthetic catalogs of growing size and emit the
+results as JSON, so runs on different commits can be compared. For each
+catalog size this measures:
+
+- cold start: a fresh interpreter importing the package and answering its
+  first lookup, with its resident memory before and after
+- first lookup: loading and merging a language's catalogs in a warm process
+- warm lookups: the latency of `get_i18n_obj()` and `Translator.get()`
+- glob queries: `section.*`, `*` and a glom-walked `*.group` pattern
+- export: `into_toml_str()` of the fallback language
+
+1M keys takes several minutes, mostly spent parsing and exporting.
+
+```bash
+$ python -m benchmarks.bench_suite --sizes 1000 10000 100000 -o results.json
+$ python -m benchmarks.bench_suite --sizes 1000000 --compiled
+```
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from benchmarks.synthetic import key_path, use_project, write_project
+from tl.utils.config_utils import CONFIG_ENV
+from tl.utils.language_utils import compile_language_files, into_toml_str
+from tl.utils.toml_utils import CATALOG_CACHE, TOML_CACHE
+from tl.utils.translation_utils import Translator, get_i18n_obj
+
+PROJECT_ROOT: Path = Path(__file__).resolve().parent.parent
+
+# Run in a fresh interpreter. Prints the import and first lookup times, and
+# the resident memory after the import and after the lookup.
+COLD_START_SCRIPT: str = """
+import json, sys, time
+from pathlib import Path
+
+def rss():
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) * 1024
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+start = time.perf_counter()
+from tl.utils.translation_utils import get_i18n_obj
+imported = time.perf_counter()
+rss_imported = rss()
+get_i18n_obj(sys.argv[1], sys.argv[2])
+looked_up = time.perf_counter()
+print(json.dumps({
+    "import_s": imported - start,
+    "first_lookup_s": looked_up - imported,
+    "rss_imported_bytes": rss_imported,
+    "rss_loaded_bytes": rss(),
+}))
+"""
+
+
+def _percentiles(samples_ns: list[int]) -> dict[str, float]:
+    samples_ns.sort()
+    return {
+        "p50_ns": samples_ns[len(samples_ns) // 2],
+        "p99_ns": samples_ns[int(len(samples_ns) * 0.99)],
+        "mean_ns": statistics.fmean(samples_ns),
+    }
+
+
+def _latency(func: Callable[[str], object], key_paths: list[str]) -> dict[str, float]:
+    samples: list[int] = []
+    for key_path in key_paths:
+        start = time.perf_counter_ns()
+        _ = func(key_path)
+        samples.append(time.perf_counter_ns() - start)
+    return _percentiles(samples)
+
+
+def _best_of(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _ = func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_cold_start(
+    config_file_path: Path, language_code: str, key: str
+) -> dict[str, float]:
+    env = {**os.environ, CONFIG_ENV: str(config_file_path)}
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")])
+    )
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", COLD_START_SCRIPT, language_code, key],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return {"total_s": time.perf_counter() - start, **json.loads(output)}
+
+
+def measure_size(args: argparse.Namespace, keys: int) -> dict[str, object]:
+    with tempfile.TemporaryDirectory() as tmp:
+        config_file_path = write_project(
+            Path(tmp), keys, args.languages, args.depth, seed=args.seed
+        )
+        language_code = f"l{args.languages - 1}"
+        rng = random.Random(args.seed)
+        key_paths = [
+            key_path(rng.randrange(keys), args.depth) for _ in range(args.lookups)
+        ]
+        result: dict[str, object] = {
+            "keys": keys,
+            "languages": args.languages,
+            "depth": args.depth,
+            "file_bytes": (Path(tmp) / "i18n" / "l0.toml").stat().st_size,
+        }
+
+        with use_project(config_file_path):
+            if args.compiled:
+                _ = compile_language_files()
+            result["cold_start"] = measure_cold_start(
+                config_file_path, language_code, key_paths[0]
+            )
+
+            CATALOG_CACHE.clear()
+            TOML_CACHE.clear()
+            start = time.perf_counter()
+            _ = get_i18n_obj(language_code, key_paths[0])
+            result["first_lookup_s"] = time.perf_counter() - start
+
+            translator = Translator(language_code)
+            result["warm_lookup"] = {
+                "get_i18n_obj": _latency(
+                    lambda key: get_i18n_obj(language_code, key), key_paths
+                ),
+                "translator": _latency(translator.get, key_paths),
+            }
+
+            section = key_paths[0].partition(".")[0]
+            result["glob_s"] = {
+                pattern: _best_of(lambda: translator.get(pattern), args.repeat)
+                for pattern in (f"{section}.*", "*", "*.group_0")
+                if args.depth > 1 or pattern != "*.group_0"
+            }
+            result["into_toml_str_s"] = _best_of(
+                lambda: into_toml_str("l0"), args.repeat
+            )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    _ = parser.add_argument("--languages", type=int, default=3)
+    _ = parser.add_argument("--depth", type=int, default=2)
+    _ = parser.add_argument("--lookups", type=int, default=10_000)
+    _ = parser.add_argument("--repeat", type=int, default=3)
+    _ = parser.add_argument("--seed", type=int, default=0)
+    _ = parser.add_argument(
+        "--compiled", action="store_true", help="compile binary catalogs first"
+    )
+    _ = parser.add_argument("-o", "--output", type=Path, help="defaults to stdout")
+    args = parser.parse_args()
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+
+    results: list[dict[str, object]] = []
+    for keys in args.sizes:
+        print(f"Measuring {keys:,} keys", file=sys.stderr)
+        results.append(measure_size(args, keys))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+            "commit": commit or None,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "gil": getattr(sys, "_is_gil_enabled", lambda: True)(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "compiled": args.compiled,
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        _ = args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
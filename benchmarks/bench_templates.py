@@ -0,0 +1,56 @@
+"""
+Compare rendering compiled templates against plain `str.format` for i18n
+strings with zero, one and many placeholder fields.
+
+```bash
+$ python -m benchmarks.bench_templates --number 200000
+```
+"""
+
+import argparse
+import timeit
+
+from tl.utils.template_utils import compile_template
+
+CASES: dict[str, tuple[str, dict[str, object]]] = {
+    "zero fields": ("This is the English language file", {}),
+    "one field": ("Welcome {name}!", {"name": "Blake"}),
+    "many fields": (
+        "{greeting} {name}, you have {count} new {kind} from {sender} since {date}",
+        {
+            "greeting": "Hi",
+            "name": "Blake",
+            "count": 3,
+            "kind": "messages",
+            "sender": "Alex",
+            "date": "Monday",
+        },
+    ),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+
+    for name, (source, placeholder_args) in CASES.items():
+        template = compile_template(source)
+        fmt = timeit.timeit(
+            lambda: source.format(**placeholder_args), number=args.number
+        )
+        rendered = timeit.timeit(
+            lambda: template.render(**placeholder_args), number=args.number
+        )
+        rendered_map = timeit.timeit(
+            lambda: template.render_map(placeholder_args), number=args.number
+        )
+        print(
+            f"{name:>12}: str.format {fmt / args.number * 1e9:7.0f} ns"
+            f"  render {rendered / args.number * 1e9:7.0f} ns"
+            f"  render_map {rendered_map / args.number * 1e9:7.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
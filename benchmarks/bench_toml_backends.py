@@ -0,0 +1,70 @@
+"""
+Compare load time and retained memory of the tomllib and tomlkit read backends
+on a large, synthetic language file.
+
+```bash
+$ python -m benchmarks.bench_toml_backends --sections 500 --keys 100
+```
+"""
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from tl.utils.toml_utils import TomlBackend, parse_toml_file
+
+
+def write_language_file(path: Path, sections: int, keys: int) -> None:
+    """
+    Write a synthetic language file with `sections` tables of `keys` strings.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for s in range(sections):
+            _ = f.write(f"[section_{s}]\n")
+            for k in range(keys):
+                _ = f.write(f'key_{k} = "Message {k} of section {s} for {{name}}"\n')
+            _ = f.write("\n")
+
+
+def measure(path: Path, backend: TomlBackend, repeat: int) -> tuple[float, int]:
+    """
+    Returns:
+        tuple[float, int]: the best load time in seconds and the retained bytes
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _ = parse_toml_file(path, backend)
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    toml_dict = parse_toml_file(path, backend)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del toml_dict
+    return best, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--sections", type=int, default=200)
+    _ = parser.add_argument("--keys", type=int, default=100)
+    _ = parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "large.toml"
+        write_language_file(path, args.sections, args.keys)
+        print(f"{args.sections * args.keys} keys, {path.stat().st_size / 1024:.0f} KiB")
+        for backend in ("tomllib", "tomlkit"):
+            seconds, retained = measure(path, backend, args.repeat)
+            print(f"{backend:>8}: {seconds * 1000:9.1f} ms  {retained / 1024:9.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Measure the per-lookup cost of argument validation at the public entry points
+in "strict" and "fast" mode, next to the unvalidated internal path.
+
+```bash
+$ python -m benchmarks.bench_validation --number 50000
+```
+"""
+
+import argparse
+import tempfile
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+from benchmarks.bench_toml_backends import write_language_file
+from tl.utils.toml_utils import _get_value_from_key, get_value_from_key
+from tl.utils.translation_utils import Translator, get_i18n_obj
+from tl.utils.validation_utils import ValidationMode, set_validation_mode
+
+KEY_PATH: str = "section_0.key_0"
+
+
+def per_call_us(func: Callable[[], object], number: int) -> float:
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("--number", type=int, default=50_000)
+    _ = parser.add_argument(
+        "--language", default="en", help="a configured language for get_i18n_obj"
+    )
+    _ = parser.add_argument("--key", default="*", help="a key of that language")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "language.toml"
+        write_language_file(path, 10, 100)
+
+        print(
+            f"{'internal':>8}: get_value_from_key "
+            f"{per_call_us(lambda: _get_value_from_key(path, KEY_PATH), args.number):6.2f} us"
+        )
+        modes: tuple[ValidationMode, ...] = ("strict", "fast")
+        for mode in modes:
+            set_validation_mode(mode)
+            by_path = per_call_us(
+                lambda: get_value_from_key(path, KEY_PATH), args.number
+            )
+            by_code = per_call_us(
+                lambda: get_i18n_obj(args.language, args.key), args.number
+            )
+            print(
+                f"{mode:>8}: get_value_from_key {by_path:6.2f} us"
+                f"  get_i18n_obj {by_code:6.2f} us"
+            )
+
+    translator = Translator(args.language)
+    print(
+        f"{'resident':>8}: Translator.get "
+        f"{per_call_us(lambda: translator.get(args.key), args.number):6.2f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
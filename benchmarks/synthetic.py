@@ -0,0 +1,198 @@
+"""
+Generate synthetic projects for the benchmarks: a `config.toml` and one
+language file per language, with nested sections and placeholder-heavy
+strings, from 1k up to millions of keys. Output is deterministic for a given
+seed, so runs on different commits measure the same catalogs.
+
+```bash
+$ python -m benchmarks.synthetic /tmp/tl-bench --keys 100000 --languages 3
+```
+"""
+
+import argparse
+import os
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from tl.utils import config_utils
+from tl.utils.config_utils import CONFIG_ENV, reload
+
+KEYS_PER_TABLE: int = 50
+
+TABLES_PER_LEVEL: int = 10
+
+# Names of the nested table levels, outermost first
+LEVEL_NAMES: tuple[str, ...] = ("section", "group", "part", "item")
+
+PLACEHOLDERS: tuple[str, ...] = ("name", "count", "place", "date", "user.name")
+
+WORDS: tuple[str, ...] = (
+    "welcome",
+    "settings",
+    "message",
+    "account",
+    "update",
+    "download",
+    "window",
+    "library",
+    "profile",
+    "network",
+)
+
+
+def table_path(table: int, depth: int) -> str:
+    """
+    The dotted path of the `table`-th leaf table, nested `depth` levels deep.
+    Every level but the outermost holds `TABLES_PER_LEVEL` tables.
+    """
+    parts: list[str] = []
+    for level in reversed(range(1, depth)):
+        table, index = divmod(table, TABLES_PER_LEVEL)
+        parts.append(f"{LEVEL_NAMES[level]}_{index}")
+    parts.append(f"{LEVEL_NAMES[0]}_{table}")
+    return ".".join(reversed(parts))
+
+
+def key_path(i: int, depth: int) -> str:
+    """
+    The dotted key path of the `i`-th key of a synthetic catalog.
+    """
+    table, key = divmod(i, KEYS_PER_TABLE)
+    return f"{table_path(table, depth)}.key_{key}"
+
+
+def _message(rng: random.Random, language_code: str, i: int) -> str:
+    words = " ".join(rng.choices(WORDS, k=rng.randint(2, 8)))
+    fields = rng.sample(PLACEHOLDERS, k=rng.randint(0, 3))
+    placeholders = " ".join(f"{{{field}}}" for field in fields)
+    return f"{language_code} {words} {i} {placeholders}".rstrip()
+
+
+def write_catalog(
+    path: Path,
+    keys: int,
+    depth: int = 2,
+    language_code: str = "en",
+    missing: float = 0.0,
+    seed: int = 0,
+) -> int:
+    """
+    Write a synthetic language file.
+
+    Args:
+        path (Path): the path of the language file to write
+        keys (int): the number of keys of a complete catalog
+        depth (int, optional): how many table levels keys are nested in. Defaults to 2.
+        language_code (str, optional): prefixed to every string. Defaults to "en".
+        missing (float, optional): the share of keys to leave out, e.g. for a partially
+            translated language. Defaults to 0.0.
+        seed (int, optional): the random seed. Defaults to 0.
+
+    Returns:
+        int: the number of keys written
+    """
+    if not 1 <= depth <= len(LEVEL_NAMES):
+        raise ValueError(f"depth must be between 1 and {len(LEVEL_NAMES)}")
+    rng = random.Random(f"{seed}:{language_code}")
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for table in range(-(-keys // KEYS_PER_TABLE)):
+            _ = f.write(f"[{table_path(table, depth)}]\n")
+            for i in range(
+                table * KEYS_PER_TABLE, min(keys, (table + 1) * KEYS_PER_TABLE)
+            ):
+                if missing and rng.random() < missing:
+                    continue
+                value = _message(rng, language_code, i).replace('"', '\\"')
+                _ = f.write(f'key_{i % KEYS_PER_TABLE} = "{value}"\n')
+                written += 1
+            _ = f.write("\n")
+    return written
+
+
+def write_project(
+    root: Path,
+    keys: int,
+    languages: int = 3,
+    depth: int = 2,
+    missing: float = 0.05,
+    seed: int = 0,
+) -> Path:
+    """
+    Write a synthetic project: a config file and a language file per language.
+    The fallback language "l0" is complete; the others miss some keys.
+
+    Args:
+        root (Path): the directory to write the project into
+        keys (int): the number of keys of the fallback language
+        languages (int, optional): the number of languages. Defaults to 3.
+        depth (int, optional): how many table levels keys are nested in. Defaults to 2.
+        missing (float, optional): the share of keys the other languages leave out.
+            Defaults to 0.05.
+        seed (int, optional): the random seed. Defaults to 0.
+
+    Returns:
+        Path: the path of the config file
+    """
+    (i18n_dir := root / "i18n").mkdir(parents=True, exist_ok=True)
+    config = ['[paths]\ni18n_dir = "i18n"\n\n[languages]\nfallback = "l0"\n']
+    for n in range(languages):
+        code = f"l{n}"
+        _ = write_catalog(
+            i18n_dir / f"{code}.toml",
+            keys,
+            depth,
+            code,
+            missing if n else 0.0,
+            seed,
+        )
+        config.append(
+            f'\n[languages.{code}]\nenglish_name = "Language {n}"\n'
+            f'native_name = "Language {n}"\nfile = "{code}.toml"\n'
+        )
+    config_file_path = root / "config.toml"
+    _ = config_file_path.write_text("".join(config), encoding="utf-8")
+    return config_file_path
+
+
+@contextmanager
+def use_project(config_file_path: Path) -> Iterator[None]:
+    """
+    Point the package at a synthetic project's config file, restoring the
+    previous config on exit.
+    """
+    previous = os.environ.get(CONFIG_ENV)
+    os.environ[CONFIG_ENV] = str(config_file_path)
+    config_utils._resolve_config_file_path.cache_clear()
+    _ = reload()
+    try:
+        yield
+    finally:
+        if previous is None:
+            _ = os.environ.pop(CONFIG_ENV, None)
+        else:
+            os.environ[CONFIG_ENV] = previous
+        config_utils._resolve_config_file_path.cache_clear()
+        _ = reload()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _ = parser.add_argument("root", type=Path)
+    _ = parser.add_argument("--keys", type=int, default=10_000)
+    _ = parser.add_argument("--languages", type=int, default=3)
+    _ = parser.add_argument("--depth", type=int, default=2)
+    _ = parser.add_argument("--missing", type=float, default=0.05)
+    _ = parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config_file_path = write_project(
+        args.root, args.keys, args.languages, args.depth, args.missing, args.seed
+    )
+    print(config_file_path)
+
+
+if __name__ == "__main__":
+    main()
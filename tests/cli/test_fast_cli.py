@@ -0,0 +1,111 @@
+import subprocess
+import sys
+
+import pytest
+
+from resources.constants.values import (
+    EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+    EXAMPLE_UNSUPPORTED_LANGUAGE_CODE,
+)
+from tl.cli import fast_cli
+from tl.utils.path_utils import get_project_root
+from tl.utils.translation_utils import get_i18n_obj
+
+# Cumulative import time of the fast path's top level modules. pydantic is most
+# of it (about 150 ms), so this fails if another heavy dependency sneaks onto the
+# fast path.
+IMPORT_TIME_BUDGET_US: int = 400_000
+
+FAST_PATH_MODULES: tuple[str, ...] = (
+    "tl.cli.fast_cli",
+    "tl.utils.translation_utils",
+    "tl.utils.template_utils",
+)
+
+DEFERRED_MODULES: tuple[str, ...] = ("typer", "tomlkit", "glom")
+
+
+def _import_times(modules: tuple[str, ...]) -> dict[str, int]:
+    """
+    Returns:
+        dict[str, int]: the cumulative import time (in us) of each imported module
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        text=True,
+        cwd=get_project_root(),
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_fast_path_import_budget() -> None:
+    times = _import_times(FAST_PATH_MODULES)
+    for module in DEFERRED_MODULES:
+        assert module not in times, f"'{module}' is imported on the fast path"
+    total = sum(times[module] for module in FAST_PATH_MODULES if module in times)
+    assert total < IMPORT_TIME_BUDGET_US, f"fast path imports took {total} us"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["translate", "-l", EXAMPLE_SUPPORTED_LANGUAGE_CODE, "-k", "*"],
+        ["translate", "-l", EXAMPLE_SUPPORTED_LANGUAGE_CODE, "-k", "hello", "name=x"],
+        ["supported", "-l", EXAMPLE_UNSUPPORTED_LANGUAGE_CODE],
+    ],
+)
+def test_fast_path_leaves_deferred_modules_unloaded(argv: list[str]) -> None:
+    code = (
+        "import sys\n"
+        "from tl.cli import fast_cli\n"
+        f"assert fast_cli.run({argv!r})\n"
+        f"print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=get_project_root(),
+        check=True,
+    )
+    # Running the command, not just importing the fast path, must not load them
+    assert result.stdout.splitlines()[-1] == "[]"
+
+
+def test_run_translate(capsys: pytest.CaptureFixture[str]) -> None:
+    assert fast_cli.run(["translate", "-l", EXAMPLE_SUPPORTED_LANGUAGE_CODE, "-k", "*"])
+    assert (
+        capsys.readouterr().out
+        == f"{get_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, '*')}\n"
+    )
+
+
+def test_run_supported(capsys: pytest.CaptureFixture[str]) -> None:
+    assert fast_cli.run(
+        ["supported", f"--language={EXAMPLE_UNSUPPORTED_LANGUAGE_CODE}"]
+    )
+    assert capsys.readouterr().out == "False\n"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["list"],
+        ["translate", "--batch"],
+        ["translate", "--help"],
+        ["translate", "-l", EXAMPLE_SUPPORTED_LANGUAGE_CODE],
+        ["translate", "-l", EXAMPLE_SUPPORTED_LANGUAGE_CODE, "-k", "missing.key"],
+        ["supported", "-l"],
+    ],
+)
+def test_run_defers_to_full_cli(argv: list[str]) -> None:
+    assert not fast_cli.run(argv)
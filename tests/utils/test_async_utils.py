@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from pydantic_core import ValidationError
+
+from resources.constants.values import (
+    EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+    EXAMPLE_UNSUPPORTED_LANGUAGE_CODE,
+)
+from tl.utils import async_utils, config_utils
+from tl.utils.async_utils import aget_i18n_obj, apreload
+from tl.utils.config_utils import (
+    ConfigSnapshot,
+    get_all_language_codes,
+    get_fallback_language_code,
+)
+from tl.utils.toml_utils import CATALOG_CACHE
+from tl.utils.translation_utils import _resolve_catalog, get_i18n_obj
+
+
+def test_aget_i18n_obj() -> None:
+    value = asyncio.run(aget_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*"))
+    assert value == get_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*")
+
+
+def test_aget_i18n_obj_missing_key_fail() -> None:
+    with pytest.raises(KeyError):
+        _ = asyncio.run(aget_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "missing"))
+
+
+def test_aget_i18n_obj_empty_key_fail() -> None:
+    async def lookup() -> object:
+        return await aget_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "")
+
+    with pytest.raises(ValidationError):
+        _ = asyncio.run(lookup())
+
+
+def test_apreload() -> None:
+    CATALOG_CACHE.clear()
+    resolved = asyncio.run(apreload())
+    assert list(resolved) == get_all_language_codes()
+    assert resolved[EXAMPLE_SUPPORTED_LANGUAGE_CODE] == EXAMPLE_SUPPORTED_LANGUAGE_CODE
+    assert asyncio.run(apreload([EXAMPLE_UNSUPPORTED_LANGUAGE_CODE])) == {
+        EXAMPLE_UNSUPPORTED_LANGUAGE_CODE: get_fallback_language_code()
+    }
+
+
+def test_concurrent_awaits_share_one_load(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def slow_resolve(language_code: str) -> object:
+        calls.append(language_code)
+        time.sleep(0.05)
+        return _resolve_catalog(language_code)
+
+    async def lookups() -> list[object]:
+        return await asyncio.gather(
+            *(aget_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*") for _ in range(20))
+        )
+
+    CATALOG_CACHE.clear()
+    monkeypatch.setattr(async_utils, "_resolve_catalog", slow_resolve)
+    values = asyncio.run(lookups())
+    assert calls == [EXAMPLE_SUPPORTED_LANGUAGE_CODE]
+    assert all(value == values[0] for value in values)
+
+
+def test_codes_resolving_alike_share_one_load(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def slow_resolve(language_code: str) -> object:
+        calls.append(language_code)
+        time.sleep(0.05)
+        return _resolve_catalog(language_code)
+
+    async def lookups() -> list[object]:
+        codes = [get_fallback_language_code(), EXAMPLE_UNSUPPORTED_LANGUAGE_CODE]
+        return await asyncio.gather(*(aget_i18n_obj(code, "*") for code in codes))
+
+    CATALOG_CACHE.clear()
+    monkeypatch.setattr(async_utils, "_resolve_catalog", slow_resolve)
+    fallback, unsupported = asyncio.run(lookups())
+    assert calls == [get_fallback_language_code()]
+    assert fallback == unsupported
+
+
+def test_loads_do_not_block_the_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    def slow_resolve(language_code: str) -> object:
+        time.sleep(0.2)
+        return _resolve_catalog(language_code)
+
+    async def count_ticks_during_preload() -> int:
+        ticks = 0
+        preload = asyncio.ensure_future(apreload())
+        while not preload.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        _ = preload.result()
+        return ticks
+
+    CATALOG_CACHE.clear()
+    monkeypatch.setattr(async_utils, "_resolve_catalog", slow_resolve)
+    start = time.perf_counter()
+    assert asyncio.run(count_ticks_during_preload()) > 5
+    # The languages were loaded in parallel, not one after another
+    assert time.perf_counter() - start < 0.2 * len(get_all_language_codes())
+
+
+def test_config_is_parsed_off_the_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    threads: list[threading.Thread] = []
+    from_toml_dict = ConfigSnapshot.from_toml_dict
+
+    def recording_from_toml_dict(*args: object) -> ConfigSnapshot:
+        threads.append(threading.current_thread())
+        return from_toml_dict(*args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(config_utils, "_snapshot", None)
+    monkeypatch.setattr(ConfigSnapshot, "from_toml_dict", recording_from_toml_dict)
+    _ = asyncio.run(aget_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*"))
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
@@ -0,0 +1,247 @@
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from resources.constants.values import (
+    EXAMPLE_ENGLISH_TOML_DICT,
+    EXAMPLE_ENGLISH_TOML_PATH,
+    EXAMPLE_UNSUPPORTED_LANGUAGE_TOML_PATH,
+)
+from tl.utils.cache_utils import FileCache, MissCache
+from tl.utils.toml_utils import TOML_CACHE, serialize_toml_dict
+
+
+def _write(path: Path, text: str, mtime_ns: int) -> None:
+    _ = path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_file_cache_hit() -> None:
+    cache = FileCache(lambda p: p.read_text())
+    assert cache.get(EXAMPLE_ENGLISH_TOML_PATH) is cache.get(EXAMPLE_ENGLISH_TOML_PATH)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_file_cache_reloads_changed_file(tmp_path: Path) -> None:
+    path = tmp_path / "a.txt"
+    cache = FileCache(lambda p: p.read_text())
+    _write(path, "one", 1_000_000_000)
+    assert cache.get(path) == "one"
+    _write(path, "two", 2_000_000_000)
+    assert cache.get(path) == "two"
+    assert cache.misses == 2
+
+
+def test_file_cache_follows_symlink_swap(tmp_path: Path) -> None:
+    for release, text in (("1", "one"), ("2", "two!")):
+        (tmp_path / release).mkdir()
+        _write(tmp_path / release / "a.txt", text, 1_000_000_000)
+    current = tmp_path / "current"
+    current.symlink_to(tmp_path / "1")
+    cache = FileCache(lambda p: p.read_text())
+    assert cache.get(current / "a.txt") == "one"
+    (tmp_path / "next").symlink_to(tmp_path / "2")
+    os.replace(tmp_path / "next", current)
+    assert cache.get(current / "a.txt") == "two!"
+
+
+def test_file_cache_lru_eviction(tmp_path: Path) -> None:
+    cache = FileCache(lambda p: p.read_text(), max_entries=2)
+    for name in ("a", "b", "c"):
+        _ = (tmp_path / name).write_text(name)
+    _ = cache.get(tmp_path / "a")
+    _ = cache.get(tmp_path / "b")
+    _ = cache.get(tmp_path / "a")
+    _ = cache.get(tmp_path / "c")
+    assert cache.stats().evictions == 1
+    _ = cache.get(tmp_path / "a")
+    assert cache.hits == 2
+
+
+def test_file_cache_byte_budget(tmp_path: Path) -> None:
+    cache = FileCache(lambda p: p.read_text(), max_bytes=5)
+    _ = (tmp_path / "a").write_text("aaaa")
+    _ = (tmp_path / "b").write_text("bbbb")
+    _ = cache.get(tmp_path / "a")
+    _ = cache.get(tmp_path / "b")
+    assert len(cache) == 1
+    assert cache.stats().size_bytes == 4
+
+
+def test_file_cache_invalidate_and_clear() -> None:
+    cache = FileCache(lambda p: p.read_text())
+    _ = cache.get(EXAMPLE_ENGLISH_TOML_PATH)
+    assert cache.invalidate(EXAMPLE_ENGLISH_TOML_PATH)
+    assert not cache.invalidate(EXAMPLE_ENGLISH_TOML_PATH)
+    _ = cache.get(EXAMPLE_ENGLISH_TOML_PATH)
+    cache.clear()
+    assert cache.stats() == (0, 0, 0, 0, 0)
+
+
+def test_file_cache_pin(tmp_path: Path) -> None:
+    path = tmp_path / "a.txt"
+    cache = FileCache(lambda p: p.read_text())
+    _write(path, "one", 1_000_000_000)
+    assert not cache.pin(path)
+    assert cache.get(path) == "one"
+    _write(path, "broken", 2_000_000_000)
+    assert cache.pin(path)
+    assert cache.get(path) == "one"
+    assert cache.stats().size_bytes == len("broken")
+    _write(path, "two", 3_000_000_000)
+    assert cache.get(path) == "two"
+
+
+def test_file_cache_watched(tmp_path: Path) -> None:
+    path = tmp_path / "a.txt"
+    cache = FileCache(lambda p: p.read_text())
+    _write(path, "one", 1_000_000_000)
+    assert cache.get(path) == "one"
+    cache.attach_watcher()
+    _write(path, "two", 2_000_000_000)
+    assert cache.get(path) == cache.peek(path) == "one"
+    assert cache.refresh(path) == "two"
+    cache.detach_watcher()
+    _write(path, "three", 3_000_000_000)
+    assert cache.get(path) == "three"
+
+
+def test_file_cache_missing_file_fail() -> None:
+    cache = FileCache(lambda p: p.read_text())
+    with pytest.raises(FileNotFoundError):
+        _ = cache.get(EXAMPLE_UNSUPPORTED_LANGUAGE_TOML_PATH)
+
+
+def test_serialize_toml_dict_uses_cache() -> None:
+    TOML_CACHE.clear()
+    assert serialize_toml_dict(EXAMPLE_ENGLISH_TOML_PATH) == EXAMPLE_ENGLISH_TOML_DICT
+    assert serialize_toml_dict(EXAMPLE_ENGLISH_TOML_PATH) == EXAMPLE_ENGLISH_TOML_DICT
+    assert TOML_CACHE.hits == 1
+
+
+def _slow_loader(calls: list[Path], seconds: float = 0.05) -> Callable[[Path], str]:
+    lock = threading.Lock()
+
+    def load(path: Path) -> str:
+        with lock:
+            calls.append(path)
+        time.sleep(seconds)  # keep the load in flight while other threads miss
+        return path.read_text()
+
+    return load
+
+
+def test_file_cache_dedups_concurrent_loads(tmp_path: Path) -> None:
+    _ = (path := tmp_path / "a.toml").write_text("a")
+    calls: list[Path] = []
+    cache = FileCache(_slow_loader(calls))
+    with ThreadPoolExecutor(max_workers=64) as pool:
+        values = list(pool.map(lambda _: cache.get(path), range(64)))
+    assert len(calls) == 1
+    assert cache.misses == 1
+    assert all(value is values[0] for value in values)
+
+
+def test_file_cache_shares_load_errors(tmp_path: Path) -> None:
+    calls: list[Path] = []
+    slow_load = _slow_loader(calls)
+
+    def load(path: Path) -> str:
+        if (value := slow_load(path)) == "invalid":
+            raise ValueError(value)
+        return value
+
+    cache = FileCache(load)
+    _ = (path := tmp_path / "a.toml").write_text("invalid")
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        futures = [pool.submit(cache.get, path) for _ in range(16)]
+    assert all(isinstance(f.exception(), ValueError) for f in futures)
+    assert len(calls) == 1
+    _ = path.write_text("valid")
+    assert cache.get(path) == "valid"  # failed loads are not cached
+
+
+def test_file_cache_concurrent_reads_during_reloads(tmp_path: Path) -> None:
+    versions = ("one", "two!")  # different sizes, so every write is a change
+    _ = (path := tmp_path / "a.toml").write_text(versions[0])
+    cache = FileCache(lambda p: p.read_text())
+    stop = threading.Event()
+
+    def read() -> set[object]:
+        seen: set[object] = set()
+        while not stop.is_set():
+            seen.add(cache.get(path))
+        return seen
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        readers = [pool.submit(read) for _ in range(8)]
+        for i in range(50):
+            _ = (tmp := tmp_path / "a.tmp").write_text(versions[i % 2])
+            _ = tmp.replace(path)
+            if i % 5 == 0:
+                _ = cache.invalidate(path)
+        stop.set()
+    assert set().union(*(reader.result() for reader in readers)) <= set(versions)
+    assert len(cache) == 1
+
+
+@pytest.mark.skipif(
+    getattr(sys, "_is_gil_enabled", lambda: True)(),
+    reason="reads only scale on a free-threaded build",
+)
+def test_file_cache_reads_scale_with_threads(tmp_path: Path) -> None:
+    _ = (path := tmp_path / "a.toml").write_text("a")
+    cache = FileCache(lambda p: p.read_text())
+    _ = cache.get(path)
+
+    def throughput(threads: int, reads: int = 20_000) -> float:
+        def work(thread: int) -> None:
+            for _ in range(reads):
+                _ = cache.get(path)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            _ = list(pool.map(work, range(threads)))
+        return threads * reads / (time.perf_counter() - start)
+
+    assert throughput(4) > 2 * throughput(1)
+
+
+class _Owner:
+    """
+    A weakly referenceable stand-in for a catalog.
+    """
+
+
+def test_miss_cache_is_per_owner() -> None:
+    cache = MissCache()
+    owner, reloaded = _Owner(), _Owner()
+    cache.add("missing", owner)
+    assert cache.has("missing", owner)
+    assert not cache.has("missing", reloaded)
+    assert not cache.has("other", owner)
+    assert cache.hits == 1
+
+
+def test_miss_cache_is_bounded() -> None:
+    cache = MissCache(max_entries=2)
+    owner = _Owner()
+    for key in ("a", "b", "c"):
+        cache.add(key, owner)
+    assert len(cache) == 2
+    assert not cache.has("a", owner)
+    assert cache.has("c", owner)
+
+
+def test_miss_cache_does_not_keep_owners_alive() -> None:
+    cache = MissCache()
+    owner = _Owner()
+    cache.add("missing", owner)
+    del owner
+    assert not cache.has("missing", _Owner())
@@ -0,0 +1,114 @@
+import pytest
+from glom import glom  # type: ignore
+
+from resources.constants.values import EXAMPLE_ENGLISH_TOML_DICT
+from tl.utils.catalog_utils import Catalog, ChainedCatalog
+
+NESTED_TOML_DICT: dict[str, object] = {
+    "title": "Settings",
+    "settings": {
+        "volume": "Volume",
+        "display": {"brightness": "Brightness", "contrast": "Contrast"},
+    },
+    "other": {"volume": "Other volume"},
+    "numbers": [1, 2, 3],
+}
+
+
+def test_catalog_exact_key() -> None:
+    catalog = Catalog(EXAMPLE_ENGLISH_TOML_DICT)
+    assert catalog.lookup("start.welcome") == "Welcome {name}!"
+    assert type(catalog.lookup("start.welcome")) is str
+
+
+def test_catalog_section_key() -> None:
+    catalog = Catalog(EXAMPLE_ENGLISH_TOML_DICT)
+    assert catalog.lookup("start") == EXAMPLE_ENGLISH_TOML_DICT["start"]
+
+
+@pytest.mark.parametrize(
+    "key_path",
+    ["*", "settings.*", "settings.display.*", "*.volume", "numbers.*", "title.*"],
+)
+def test_catalog_wildcard_matches_glom(key_path: str) -> None:
+    assert Catalog(NESTED_TOML_DICT).lookup(key_path) == glom(
+        NESTED_TOML_DICT, key_path
+    )
+
+
+def test_catalog_missing_key_fail() -> None:
+    with pytest.raises(KeyError):
+        _ = Catalog(EXAMPLE_ENGLISH_TOML_DICT).lookup("welcome")
+
+
+def test_catalog_missing_wildcard_prefix_fail() -> None:
+    with pytest.raises(KeyError):
+        _ = Catalog(EXAMPLE_ENGLISH_TOML_DICT).lookup("missing.*")
+
+
+@pytest.mark.parametrize(
+    ("key_path", "expected"),
+    [
+        ("settings.**", ["Volume", "Brightness", "Contrast"]),
+        ("settings.display.**", ["Brightness", "Contrast"]),
+        ("numbers.**", [1, 2, 3]),
+        ("title.**", []),
+    ],
+)
+def test_catalog_recursive_wildcard(key_path: str, expected: list[object]) -> None:
+    assert Catalog(NESTED_TOML_DICT).lookup(key_path) == expected
+
+
+def test_catalog_keys() -> None:
+    catalog = Catalog(NESTED_TOML_DICT)
+    keys = catalog.keys()
+    assert next(keys) == "title"
+    assert list(keys) == [
+        "settings.volume",
+        "settings.display.brightness",
+        "settings.display.contrast",
+        "other.volume",
+        "numbers",
+    ]
+    assert list(catalog.keys("settings", recursive=False)) == [
+        "settings.volume",
+        "settings.display",
+    ]
+    assert dict(catalog.items("settings.display")) == {
+        "settings.display.brightness": "Brightness",
+        "settings.display.contrast": "Contrast",
+    }
+    assert list(catalog.keys("title")) == list(catalog.keys("missing")) == []
+
+
+def test_chained_catalog() -> None:
+    own = Catalog({"title": "Einstellungen", "settings": {"volume": "Lautstärke"}})
+    fallback = Catalog(NESTED_TOML_DICT)
+    merged = ChainedCatalog([own, fallback])
+    assert merged.lookup("title") == "Einstellungen"
+    assert merged.lookup("settings.display.brightness") == "Brightness"
+    assert merged.lookup("settings.*") == [
+        "Lautstärke",
+        {"brightness": "Brightness", "contrast": "Contrast"},
+    ]
+    # Values and tables that are not overlaid are shared, not copied
+    assert merged.lookup("settings.volume") is own.lookup("settings.volume")
+    assert merged.lookup("settings.display") is fallback.lookup("settings.display")
+    assert merged.lookup("numbers") is fallback.lookup("numbers")
+    with pytest.raises(KeyError):
+        _ = merged.lookup("missing")
+    assert list(merged.keys("settings", recursive=False)) == [
+        "settings.volume",
+        "settings.display",
+    ]
+    assert "settings.display.contrast" in merged
+
+
+def test_catalogs_share_interned_strings() -> None:
+    # Equal but distinct strings, as two separately parsed files would have
+    first = Catalog({"start": {"welcome": "".join(["Wel", "come"])}})
+    second = Catalog({"start": {"welcome": "".join(["Wel", "come"])}})
+    assert first.lookup("start.welcome") is second.lookup("start.welcome")
+    [first_path] = [path for path in first.index if path != "start"]
+    [second_path] = [path for path in second.index if path != "start"]
+    assert first_path is second_path
@@ -0,0 +1,107 @@
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from tl.cli.tl_cli import cli
+from tl.utils import config_utils
+from tl.utils.check_utils import check_languages
+from tl.utils.config_utils import CONFIG_ENV, reload
+from tl.utils.toml_utils import TOML_CACHE
+
+
+@pytest.fixture
+def i18n_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    (i18n_dir := tmp_path / "i18n").mkdir()
+    _ = (i18n_dir / "en.toml").write_text(
+        'count = 3\n\n[start]\nhello = "Hello {name}"\nbye = "Bye"\n'
+    )
+    _ = (i18n_dir / "de.toml").write_text(
+        'count = 3\n\n[start]\nhello = "Hallo {nom}"\nextra = "Extra"\n'
+    )
+    _ = (tmp_path / "config.toml").write_text(
+        '[paths]\ni18n_dir = "i18n"\n\n'
+        '[languages]\nfallback = "en"\n\n'
+        '[languages.en]\nfile = "en.toml"\n\n'
+        '[languages.de]\nfile = "de.toml"\n\n'
+        '[languages.fr]\nfile = "fr.toml"\n'
+    )
+    monkeypatch.setenv(CONFIG_ENV, str(tmp_path / "config.toml"))
+    config_utils._resolve_config_file_path.cache_clear()
+    _ = reload()
+    yield i18n_dir
+    monkeypatch.undo()
+    config_utils._resolve_config_file_path.cache_clear()
+    _ = reload()
+
+
+def test_check_languages(i18n_dir: Path) -> None:
+    report = check_languages(workers=2)
+    assert not report.ok
+    assert report.fallback_code == "en"
+    en, de, fr = report.languages
+    assert en.ok
+    assert de.missing == ["start.bye"]
+    assert de.extra == ["start.extra"]
+    assert de.placeholders == [
+        {"key": "start.hello", "expected": ["name"], "found": ["nom"]}
+    ]
+    assert fr.errors == ["file not found"]
+
+
+def test_check_languages_ok(i18n_dir: Path) -> None:
+    _ = (i18n_dir / "de.toml").write_text(
+        'count = 4\n\n[start]\nhello = "Hallo {name}!"\nbye = "Tschüss"\n'
+    )
+    report = check_languages(["de"])
+    assert report.ok
+    assert [language.code for language in report.languages] == ["en", "de"]
+
+
+def test_check_languages_inherited_keys(i18n_dir: Path) -> None:
+    config_file = i18n_dir.parent / "config.toml"
+    _ = config_file.write_text(
+        config_file.read_text() + '\n[languages.de-at]\nfile = "de-at.toml"\n'
+    )
+    _ = reload()
+    _ = (i18n_dir / "de-at.toml").write_text('[start]\nhello = "Servus {name}"\n')
+    _, de_at = check_languages(["de-at"], workers=1).languages
+    # "count" comes from "de", only "start.bye" would fall back to "en"
+    assert de_at.missing == ["start.bye"]
+    assert de_at.errors == []
+
+
+def test_check_languages_leaves_toml_cache_alone(i18n_dir: Path) -> None:
+    TOML_CACHE.clear()
+    _ = check_languages(["de"], workers=1)
+    assert str(i18n_dir / "en.toml") not in TOML_CACHE
+
+
+def test_check_languages_invalid_files(i18n_dir: Path) -> None:
+    _ = (i18n_dir / "de.toml").write_text('[start\nhello = "Hallo {name"\n')
+    report = check_languages(["de", "xx"])
+    _, de, xx = report.languages
+    assert de.errors[0].startswith("invalid TOML")
+    assert xx.errors == ["not a language in the config file"]
+
+
+def test_check_languages_broken_fallback(i18n_dir: Path) -> None:
+    _ = (i18n_dir / "en.toml").write_text('[start]\nhello = "Hello {name"\n')
+    en, de, _ = check_languages().languages
+    assert en.errors[0].startswith("malformed placeholders in 'start.hello'")
+    # The reference is still usable, minus the malformed string's placeholders
+    assert de.placeholders[0]["key"] == "start.hello"
+
+
+def test_check_cli_json(i18n_dir: Path) -> None:
+    result = CliRunner().invoke(cli, ["check", "--json", "-w", "1"])
+    assert result.exit_code == 1
+    report = json.loads(result.stdout)
+    assert report["ok"] is False
+    assert [language["code"] for language in report["languages"]] == [
+        "en",
+        "de",
+        "fr",
+    ]
@@ -0,0 +1,169 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from resources.constants.values import EXAMPLE_ENGLISH_TOML_PATH
+from tl.utils.catalog_utils import Catalog
+from tl.utils.compile_utils import (
+    BinaryCatalog,
+    get_compiled_path,
+    open_compiled_catalog,
+    share_compiled_catalog,
+    write_compiled_catalog,
+)
+from tl.utils.toml_utils import compile_toml_file, load_catalog, parse_toml_file
+
+NESTED_TOML_DICT: dict[str, object] = {
+    "title": "Einstellungen",
+    "settings": {
+        "volume": "Lautstärke",
+        "display": {"brightness": "Helligkeit", "contrast": "Kontrast"},
+        "empty": {},
+    },
+    "settings_extra": {"volume": "Other volume"},
+    "numbers": [1, 2, 3],
+}
+
+
+@pytest.fixture
+def compiled(tmp_path: Path) -> tuple[Catalog, BinaryCatalog]:
+    toml_file_path = tmp_path / "de.toml"
+    _ = toml_file_path.write_text("")
+    _ = write_compiled_catalog(NESTED_TOML_DICT, toml_file_path)
+    binary_catalog = open_compiled_catalog(toml_file_path)
+    assert binary_catalog is not None
+    return Catalog(NESTED_TOML_DICT), binary_catalog
+
+
+@pytest.mark.parametrize(
+    "key_path",
+    [
+        "title",
+        "settings.volume",
+        "settings.display",
+        "settings",
+        "settings.empty",
+        "numbers",
+        "*",
+        "settings.*",
+        "*.volume",
+        "**",
+        "settings.**",
+        "settings.empty.**",
+        "numbers.**",
+    ],
+)
+def test_binary_catalog_matches_catalog(
+    compiled: tuple[Catalog, BinaryCatalog], key_path: str
+) -> None:
+    catalog, binary_catalog = compiled
+    assert binary_catalog.lookup(key_path) == catalog.lookup(key_path)
+
+
+def test_binary_catalog_tree(compiled: tuple[Catalog, BinaryCatalog]) -> None:
+    catalog, binary_catalog = compiled
+    assert binary_catalog.tree == catalog.tree
+    assert list(binary_catalog.tree) == list(catalog.tree)
+
+
+@pytest.mark.parametrize("prefix", ["", "settings", "settings.display", "title"])
+@pytest.mark.parametrize("recursive", [True, False])
+def test_binary_catalog_items(
+    compiled: tuple[Catalog, BinaryCatalog], prefix: str, recursive: bool
+) -> None:
+    catalog, binary_catalog = compiled
+    assert list(binary_catalog.items(prefix, recursive)) == list(
+        catalog.items(prefix, recursive)
+    )
+
+
+def test_binary_catalog_missing_key_fail(
+    compiled: tuple[Catalog, BinaryCatalog],
+) -> None:
+    with pytest.raises(KeyError):
+        _ = compiled[1].lookup("settings.missing")
+
+
+@pytest.mark.parametrize(
+    "key_path", ["settings.missing", "missing.*", "settings.missing.*", "missing.*.x"]
+)
+def test_binary_catalog_get_default(
+    compiled: tuple[Catalog, BinaryCatalog], key_path: str
+) -> None:
+    catalog, binary_catalog = compiled
+    default = object()
+    assert binary_catalog.get(key_path, default) is default
+    assert catalog.get(key_path, default) is default
+    assert binary_catalog.get("settings.volume") == catalog.get("settings.volume")
+
+
+def test_share_compiled_catalog(compiled: tuple[Catalog, BinaryCatalog]) -> None:
+    catalog, binary_catalog = compiled
+    shared = share_compiled_catalog(NESTED_TOML_DICT)
+    assert shared.path is None
+    assert shared.nbytes == binary_catalog.nbytes
+    assert shared.tree == catalog.tree
+    for key_path in ("settings.display", "settings.*", "*.volume", "numbers"):
+        assert shared.lookup(key_path) == catalog.lookup(key_path)
+
+
+def test_open_compiled_catalog_missing(tmp_path: Path) -> None:
+    toml_file_path = tmp_path / "en.toml"
+    _ = toml_file_path.write_text("")
+    assert open_compiled_catalog(toml_file_path) is None
+
+
+def test_open_compiled_catalog_stale(tmp_path: Path) -> None:
+    toml_file_path = tmp_path / "en.toml"
+    _ = shutil.copy(EXAMPLE_ENGLISH_TOML_PATH, toml_file_path)
+    assert compile_toml_file(toml_file_path) == get_compiled_path(toml_file_path)
+    assert isinstance(load_catalog(toml_file_path), BinaryCatalog)
+
+    with open(toml_file_path, "a") as f:
+        _ = f.write('extra = "Extra"\n')
+    os.utime(toml_file_path, ns=(0, 0))
+    assert open_compiled_catalog(toml_file_path) is None
+    catalog = load_catalog(toml_file_path)
+    assert isinstance(catalog, Catalog)
+    assert catalog.tree == parse_toml_file(toml_file_path)
+
+
+def test_write_compiled_catalog_mode(tmp_path: Path) -> None:
+    toml_file_path = tmp_path / "de.toml"
+    _ = toml_file_path.write_text("")
+    os.chmod(toml_file_path, 0o644)
+    compiled_path = write_compiled_catalog(NESTED_TOML_DICT, toml_file_path)
+    assert compiled_path.stat().st_mode & 0o777 == 0o644
+
+
+def test_open_compiled_catalog_unreadable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    toml_file_path = tmp_path / "de.toml"
+    _ = toml_file_path.write_text("")
+    _ = write_compiled_catalog(NESTED_TOML_DICT, toml_file_path)
+
+    def deny(*args: object, **kwargs: object) -> None:
+        raise PermissionError("Permission denied")
+
+    monkeypatch.setattr("tl.utils.compile_utils.open", deny, raising=False)
+    assert open_compiled_catalog(toml_file_path) is None
+
+
+def test_compile_toml_file_changed_while_parsing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    toml_file_path = tmp_path / "en.toml"
+    _ = shutil.copy(EXAMPLE_ENGLISH_TOML_PATH, toml_file_path)
+
+    def parse_then_edit(path: Path) -> dict[str, object]:
+        toml_dict = parse_toml_file(path)
+        with open(path, "a") as f:
+            _ = f.write('extra = "Extra"\n')
+        return toml_dict
+
+    monkeypatch.setattr("tl.utils.toml_utils.parse_toml_file", parse_then_edit)
+    _ = compile_toml_file(toml_file_path)
+    assert open_compiled_catalog(toml_file_path) is None
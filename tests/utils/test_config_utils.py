@@ -1,5 +1,10 @@
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
 import pytest
-from glom.core import PathAccessError  # type: ignore
 
 from resources.constants.values import (
     EXAMPLE_SUPPORTED_LANGUAGE,
@@ -7,20 +12,28 @@ from resources.constants.values import (
     EXAMPLE_UNSUPPORTED_LANGUAGE,
     EXAMPLE_UNSUPPORTED_LANGUAGE_CODE,
 )
+from tl.utils import config_utils
 from tl.utils.config_utils import (
+    CONFIG_ENV,
+    ConfigSnapshot,
     get_all_english_names,
     get_all_file_names,
     get_all_language_codes,
     get_all_native_names,
     get_config_file_path,
+    get_config_snapshot,
+    get_fallback_chain,
     get_fallback_language_code,  # TODO: test this
     get_i18n_dir_path,
     get_language_file_path,
     get_value_from_config,  # TODO: test this
+    is_supported_code,
     language_code_to_english_name,
-    language_code_to_file_name,  # TODO: test this
+    language_code_to_file_name,
     language_code_to_native_name,
+    reload,
 )
+from tl.utils.path_utils import ROOT_ENV
 
 
 def test_get_config_file_path() -> None:
@@ -80,7 +93,7 @@ def test_language_code_to_english_name() -> None:
 
 
 def test_language_code_to_english_name_fail() -> None:
-    with pytest.raises(PathAccessError):
+    with pytest.raises(KeyError):
         _ = language_code_to_english_name(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE)
 
 
@@ -92,12 +105,187 @@ def test_language_code_to_native_name() -> None:
 
 
 def test_language_code_to_native_name_fail() -> None:
-    with pytest.raises(PathAccessError):
+    with pytest.raises(KeyError):
         _ = language_code_to_native_name(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE)
 
 
-# def test_language_code_to_file_name() -> None:
+def test_language_code_to_file_name() -> None:
+    assert language_code_to_file_name(EXAMPLE_SUPPORTED_LANGUAGE_CODE) in (
+        get_all_file_names()
+    )
+
+
+def test_language_code_to_file_name_fail() -> None:
+    with pytest.raises(KeyError):
+        _ = language_code_to_file_name(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE)
 
 
 def test_get_language_file_path() -> None:
     assert get_language_file_path(EXAMPLE_SUPPORTED_LANGUAGE_CODE).exists()
+
+
+def test_get_all_language_codes_excludes_fallback() -> None:
+    assert "fallback" not in get_all_language_codes()
+
+
+def test_is_supported_code() -> None:
+    assert is_supported_code(EXAMPLE_SUPPORTED_LANGUAGE_CODE)
+    assert not is_supported_code(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE)
+
+
+def test_config_snapshot_is_frozen() -> None:
+    with pytest.raises(FrozenInstanceError):
+        get_config_snapshot().fallback_code = EXAMPLE_UNSUPPORTED_LANGUAGE_CODE  # type: ignore[misc]
+
+
+def test_config_snapshot_paths_are_absolute() -> None:
+    snapshot = get_config_snapshot()
+    assert snapshot.i18n_dir_path.is_absolute()
+    assert all(path.is_absolute() for path in snapshot.file_paths.values())
+
+
+def test_reload_swaps_snapshot() -> None:
+    before = get_config_snapshot()
+    after = reload()
+    assert after is not before
+    assert get_config_snapshot() is after
+    assert after == before
+
+
+def test_config_snapshot_first_use_loads_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    loads: list[ConfigSnapshot] = []
+    from_toml_dict = ConfigSnapshot.from_toml_dict
+
+    def slow_from_toml_dict(*args: object) -> ConfigSnapshot:
+        time.sleep(0.05)
+        loads.append(from_toml_dict(*args))  # type: ignore[arg-type]
+        return loads[-1]
+
+    monkeypatch.setattr(config_utils, "_snapshot", None)
+    monkeypatch.setattr(ConfigSnapshot, "from_toml_dict", slow_from_toml_dict)
+    threads = [threading.Thread(target=get_config_snapshot) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(loads) == 1
+    assert get_config_snapshot() is loads[0]
+
+
+def test_config_snapshot_invalid_fallback_fail() -> None:
+    with pytest.raises(ValueError):
+        _ = ConfigSnapshot.from_toml_dict(
+            {
+                "paths": {"i18n_dir": "i18n"},
+                "languages": {
+                    "fallback": EXAMPLE_UNSUPPORTED_LANGUAGE_CODE,
+                    "en": {"file": "en.toml"},
+                },
+            },
+            Path("config.toml"),
+        )
+
+
+def _chains_snapshot(**languages: Mapping[str, object]) -> ConfigSnapshot:
+    return ConfigSnapshot.from_toml_dict(
+        {
+            "paths": {"i18n_dir": "i18n"},
+            "languages": {"fallback": "en", **languages},
+        },
+        Path("config.toml"),
+    )
+
+
+def test_config_snapshot_chains() -> None:
+    snapshot = _chains_snapshot(
+        en={"file": "en.toml"},
+        de={"file": "de.toml"},
+        **{"de-at": {"file": "de-at.toml"}},
+        fr={"file": "fr.toml", "fallbacks": ["de-at"]},
+    )
+    assert snapshot.chains == {
+        "en": ("en",),
+        "de": ("de", "en"),
+        "de-at": ("de-at", "de", "en"),
+        "fr": ("fr", "de-at", "de", "en"),
+    }
+    assert snapshot.chain_for("de-ch") == ("de", "en")
+    assert snapshot.chain_for(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE) == ("en",)
+
+
+def test_config_snapshot_chains_cycle() -> None:
+    snapshot = _chains_snapshot(
+        en={"file": "en.toml"},
+        de={"file": "de.toml", "fallbacks": ["nl"]},
+        nl={"file": "nl.toml", "fallbacks": ["de"]},
+    )
+    assert snapshot.chains["de"] == ("de", "nl", "en")
+    assert snapshot.chains["nl"] == ("nl", "de", "en")
+
+
+@pytest.mark.parametrize(
+    "fallbacks", ["de", ["de", 1], [EXAMPLE_UNSUPPORTED_LANGUAGE_CODE]]
+)
+def test_config_snapshot_invalid_fallbacks_fail(fallbacks: object) -> None:
+    with pytest.raises(ValueError):
+        _ = _chains_snapshot(
+            en={"file": "en.toml"},
+            de={"file": "de.toml"},
+            fr={"file": "fr.toml", "fallbacks": fallbacks},
+        )
+
+
+def test_get_fallback_chain() -> None:
+    fallback_code = get_fallback_language_code()
+    assert get_fallback_chain(fallback_code) == [fallback_code]
+    assert get_fallback_chain(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE) == [fallback_code]
+
+
+def _write_config(dir_path: Path) -> Path:
+    config_file_path = dir_path / "config.toml"
+    _ = config_file_path.write_text(
+        '[paths]\ni18n_dir = "i18n"\n\n'
+        '[languages]\nfallback = "en"\n\n'
+        '[languages.en]\nenglish_name = "English"\nfile = "en.toml"\n'
+    )
+    return config_file_path
+
+
+@pytest.fixture
+def restore_config(monkeypatch: pytest.MonkeyPatch) -> Iterator[pytest.MonkeyPatch]:
+    monkeypatch.delenv(CONFIG_ENV, raising=False)
+    monkeypatch.delenv(ROOT_ENV, raising=False)
+    yield monkeypatch
+    monkeypatch.undo()
+    config_utils._resolve_config_file_path.cache_clear()
+    _ = reload()
+
+
+def test_get_config_file_path_config_env(
+    tmp_path: Path, restore_config: pytest.MonkeyPatch
+) -> None:
+    config_file_path = _write_config(tmp_path)
+    restore_config.setenv(CONFIG_ENV, str(config_file_path))
+    assert get_config_file_path() == config_file_path
+    snapshot = reload()
+    assert snapshot.config_file_path == config_file_path
+    assert snapshot.i18n_dir_path == tmp_path / "i18n"
+    assert snapshot.language_codes == ("en",)
+
+
+def test_get_config_file_path_root_env(
+    tmp_path: Path, restore_config: pytest.MonkeyPatch
+) -> None:
+    restore_config.setenv(ROOT_ENV, str(tmp_path))
+    assert get_config_file_path() == _write_config(tmp_path)
+
+
+def test_get_config_file_path_package_resource(
+    tmp_path: Path, restore_config: pytest.MonkeyPatch
+) -> None:
+    config_file_path = _write_config(tmp_path)
+    restore_config.setattr(
+        config_utils, "_get_package_config_file", lambda: config_file_path
+    )
+    config_utils._resolve_config_file_path.cache_clear()
+    assert get_config_file_path() == config_file_path
@@ -0,0 +1,89 @@
+import io
+import json
+import tomllib
+
+import pytest
+from typer.testing import CliRunner
+
+from resources.constants.values import EXAMPLE_SUPPORTED_LANGUAGE_CODE
+from tl.cli.tl_cli import cli
+from tl.utils.catalog_utils import Catalog
+from tl.utils.compile_utils import BinaryCatalog, share_compiled_catalog
+from tl.utils.export_utils import export_catalog, export_language
+
+NESTED_TOML_DICT: dict[str, object] = {
+    "settings": {
+        "display": {"brightness": "Helligkeit"},
+        "volume": "Lautstärke",
+        "sound": {"quote": 'Say "hi"\n', "key with spaces": "Leerzeichen"},
+    },
+    "title": "Einstellungen",
+    "numbers": [1, 2, 3],
+}
+
+
+@pytest.fixture(params=["catalog", "binary"])
+def catalog(request: pytest.FixtureRequest) -> Catalog | BinaryCatalog:
+    if request.param == "binary":
+        return share_compiled_catalog(NESTED_TOML_DICT)
+    return Catalog(NESTED_TOML_DICT)
+
+
+def _export(catalog: Catalog | BinaryCatalog, export_format: str) -> str:
+    out = io.StringIO()
+    assert export_catalog(catalog, out, export_format) == 6  # type: ignore[arg-type]
+    return out.getvalue()
+
+
+def test_export_toml(catalog: Catalog | BinaryCatalog) -> None:
+    # Root keys after a table and keys after a sub-table still parse back
+    assert tomllib.loads(_export(catalog, "toml")) == NESTED_TOML_DICT
+
+
+def test_export_toml_array_of_tables() -> None:
+    toml_dict: dict[str, object] = {
+        "menu": {
+            "items": [
+                {"label": "Öffnen", "shortcut": "Ctrl+O"},
+                {"label": "Beenden", "a.b": [1, {"nested": True}]},
+            ]
+        },
+        "empty": [],
+    }
+    out = io.StringIO()
+    assert export_catalog(Catalog(toml_dict), out) == 2
+    assert tomllib.loads(out.getvalue()) == toml_dict
+
+
+def test_export_json(catalog: Catalog | BinaryCatalog) -> None:
+    assert json.loads(_export(catalog, "json")) == NESTED_TOML_DICT
+
+
+def test_export_ndjson(catalog: Catalog | BinaryCatalog) -> None:
+    records = [json.loads(line) for line in _export(catalog, "ndjson").splitlines()]
+    assert records[0] == {"key": "settings.display.brightness", "value": "Helligkeit"}
+    assert {"key": "numbers", "value": [1, 2, 3]} in records
+
+
+def test_export_po() -> None:
+    source = Catalog({"start": {"welcome": "Welcome", "title": 'Say "hi"'}})
+    catalog = Catalog({"start": {"welcome": "Willkommen"}})
+    out = io.StringIO()
+    assert export_catalog(catalog, out, "po", source, "de") == 2
+    po = out.getvalue()
+    assert '"Language: de\\n"' in po
+    assert 'msgctxt "start.welcome"\nmsgid "Welcome"\nmsgstr "Willkommen"\n' in po
+    assert 'msgctxt "start.title"\nmsgid "Say \\"hi\\""\nmsgstr ""\n' in po
+
+
+def test_export_unknown_format_fail() -> None:
+    with pytest.raises(ValueError):
+        export_language(EXAMPLE_SUPPORTED_LANGUAGE_CODE, io.StringIO(), "xml")  # type: ignore[arg-type]
+
+
+def test_export_cli() -> None:
+    result = CliRunner().invoke(
+        cli, ["export", "-l", EXAMPLE_SUPPORTED_LANGUAGE_CODE, "-f", "json"]
+    )
+    assert result.exit_code == 0
+    assert isinstance(json.loads(result.stdout), dict)
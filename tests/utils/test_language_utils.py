@@ -1,11 +1,43 @@
-from resources.constants.values import EXAMPLE_SUPPORTED_LANGUAGE_CODE
+import shutil
+from pathlib import Path
+
+import pytest
+
+from resources.constants.values import (
+    EXAMPLE_ENGLISH_TOML_PATH,
+    EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+)
+from tl.utils import language_utils
+from tl.utils.compile_utils import BinaryCatalog
 from tl.utils.language_utils import into_toml_dict, into_toml_str
+from tl.utils.toml_utils import _load_catalog, compile_toml_file
 
 
 def test_into_toml_dict() -> None:
     assert isinstance(into_toml_dict(EXAMPLE_SUPPORTED_LANGUAGE_CODE), dict)
 
 
+def test_into_toml_dict_copy() -> None:
+    toml_dict = into_toml_dict(EXAMPLE_SUPPORTED_LANGUAGE_CODE)
+    toml_dict.clear()
+    assert into_toml_dict(EXAMPLE_SUPPORTED_LANGUAGE_CODE)
+
+
+def test_into_toml_dict_keeps_binary_catalog_lazy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    toml_file_path = tmp_path / "en.toml"
+    _ = shutil.copy(EXAMPLE_ENGLISH_TOML_PATH, toml_file_path)
+    _ = compile_toml_file(toml_file_path)
+    monkeypatch.setattr(
+        language_utils, "get_language_file_path", lambda _: toml_file_path
+    )
+    catalog = _load_catalog(toml_file_path)
+    assert isinstance(catalog, BinaryCatalog)
+    assert into_toml_dict(EXAMPLE_SUPPORTED_LANGUAGE_CODE) == catalog.to_dict()
+    assert catalog._tree is None
+
+
 def test_into_toml_str() -> None:
     assert isinstance(into_toml_str(EXAMPLE_SUPPORTED_LANGUAGE_CODE), str)
 
@@ -0,0 +1,82 @@
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from resources.constants.values import EXAMPLE_SUPPORTED_LANGUAGE_CODE
+from tl.utils.log_utils import (
+    LOG_FILE_ENV,
+    LOG_LEVEL_ENV,
+    MAX_LOGGED_STR_LEN,
+    PACKAGE_LOGGER_NAME,
+    configure_logging,
+    configure_logging_from_env,
+    describe_value,
+    reset_logging,
+)
+from tl.utils.translation_utils import get_i18n_obj
+
+
+@pytest.fixture(autouse=True)
+def _reset() -> Iterator[None]:
+    yield
+    reset_logging()
+
+
+def test_package_logs_nothing_by_default() -> None:
+    package_logger = logging.getLogger(PACKAGE_LOGGER_NAME)
+    assert all(isinstance(h, logging.NullHandler) for h in package_logger.handlers)
+    assert package_logger.level == logging.NOTSET
+
+
+@pytest.mark.parametrize("queued", [False, True])
+def test_configure_logging_to_file(tmp_path: Path, queued: bool) -> None:
+    log_file = tmp_path / "logs" / "session.log"
+    configure_logging(level="DEBUG", filename=log_file, queued=queued)
+    _ = get_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*")
+    reset_logging()  # flushes the queue
+    log = log_file.read_text()
+    assert "Starting session" in log
+    assert "Successfully retrieved a list of" in log
+
+
+def test_configure_logging_level(tmp_path: Path) -> None:
+    log_file = tmp_path / "session.log"
+    configure_logging(level=logging.WARNING, filename=log_file)
+    _ = get_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*")
+    reset_logging()
+    assert log_file.read_text() == ""
+
+
+def test_reset_logging_removes_handler(tmp_path: Path) -> None:
+    configure_logging(filename=tmp_path / "a.log")
+    configure_logging(filename=tmp_path / "b.log")
+    package_logger = logging.getLogger(PACKAGE_LOGGER_NAME)
+    assert len(package_logger.handlers) == 2  # the NullHandler and b.log's
+    reset_logging()
+    assert len(package_logger.handlers) == 1
+
+
+def test_configure_logging_from_env(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv(LOG_LEVEL_ENV, raising=False)
+    monkeypatch.delenv(LOG_FILE_ENV, raising=False)
+    assert not configure_logging_from_env()
+
+    log_file = tmp_path / "env.log"
+    monkeypatch.setenv(LOG_FILE_ENV, str(log_file))
+    monkeypatch.setenv(LOG_LEVEL_ENV, "info")
+    assert configure_logging_from_env()
+    assert logging.getLogger(PACKAGE_LOGGER_NAME).level == logging.INFO
+    reset_logging()
+    assert log_file.exists()
+
+
+def test_describe_value() -> None:
+    assert describe_value("Hello") == "'Hello'"
+    assert describe_value(["a", "b"]) == "a list of 2 values"
+    assert describe_value({"a": 1}) == "a dict of 1 values"
+    long_value = "x" * (MAX_LOGGED_STR_LEN * 2)
+    assert len(describe_value(long_value)) < len(long_value)
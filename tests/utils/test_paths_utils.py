@@ -6,7 +6,7 @@ from resources.constants.values import (
     EXAMPLE_ENGLISH_TOML_PATH,
     EXAMPLE_UNSUPPORTED_LANGUAGE,
 )
-from tl.utils.path_utils import get_project_root, valid_path_validator
+from tl.utils.path_utils import ROOT_ENV, get_project_root, valid_path_validator
 
 
 def test_valid_path_validator() -> None:
@@ -35,3 +35,18 @@ def test_get_project_root() -> None:
 def test_get_project_root_fail() -> None:
     with pytest.raises(FileNotFoundError):
         _ = get_project_root(anchor=f"{EXAMPLE_UNSUPPORTED_LANGUAGE}.toml")
+
+
+def test_get_project_root_is_cached() -> None:
+    assert get_project_root() is get_project_root()
+
+
+def test_get_project_root_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(ROOT_ENV, str(tmp_path))
+    assert get_project_root() == tmp_path
+
+
+def test_get_project_root_env_fail(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(ROOT_ENV, EXAMPLE_UNSUPPORTED_LANGUAGE)
+    with pytest.raises(FileNotFoundError):
+        _ = get_project_root()
@@ -0,0 +1,193 @@
+import datetime
+import json
+import socket
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from resources.constants.values import (
+    EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+    EXAMPLE_UNSUPPORTED_LANGUAGE,
+)
+from tl.utils import server_utils
+from tl.utils.server_utils import (
+    TranslationClient,
+    TranslationServer,
+    dump_record,
+    parse_address,
+    percentile,
+    read_records,
+)
+from tl.utils.translation_utils import get_i18n_obj
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[TranslationServer]:
+    with TranslationServer(str(tmp_path / "tl.sock"), preload=False) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        yield server
+        server.shutdown()
+        thread.join()
+
+
+def test_parse_address() -> None:
+    assert parse_address("localhost:8765") == ("localhost", 8765)
+    assert parse_address("/run/tl.sock") == "/run/tl.sock"
+    assert parse_address("./tl:8765") == "./tl:8765"
+    assert parse_address("127.0.0.1:8765") == ("127.0.0.1", 8765)
+    assert parse_address("[::1]:8765") == parse_address("::1:8765") == ("::1", 8765)
+
+
+@pytest.mark.parametrize(
+    "address", ["0.0.0.0:8765", "192.168.1.2:8765", "example.com:80"]
+)
+def test_parse_address_non_loopback_fail(address: str) -> None:
+    with pytest.raises(ValueError):
+        _ = parse_address(address)
+
+
+@pytest.mark.parametrize("host", ["127.0.0.1", "::1"])
+def test_server_tcp(host: str) -> None:
+    if host == "::1" and not socket.has_ipv6:
+        pytest.skip("IPv6 is not available")
+    try:
+        server = TranslationServer(f"[{host}]:0", preload=False)
+    except OSError as e:
+        pytest.skip(f"cannot bind {host}: {e}")
+    with server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        port = cast(tuple[str, int], server._server.server_address)[1]
+        with TranslationClient(f"[{host}]:{port}") as client:
+            assert "value" in client.request(
+                {"op": "lookup", "lang": EXAMPLE_SUPPORTED_LANGUAGE_CODE, "key": "*"}
+            )
+        server.shutdown()
+        thread.join()
+
+
+def test_server_refuses_to_remove_non_socket(tmp_path: Path) -> None:
+    path = tmp_path / "config.toml"
+    _ = path.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        _ = TranslationServer(str(path), preload=False)
+    assert path.read_text() == "keep me"
+
+
+def test_server_refuses_live_socket(server: TranslationServer) -> None:
+    assert isinstance(server.address, str)
+    with pytest.raises(OSError):
+        _ = TranslationServer(server.address, preload=False)
+    with TranslationClient(server.address) as client:
+        assert "value" in client.request(
+            {"op": "lookup", "lang": EXAMPLE_SUPPORTED_LANGUAGE_CODE, "key": "*"}
+        )
+
+
+def test_server_replaces_stale_socket(tmp_path: Path) -> None:
+    path = str(tmp_path / "tl.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(path)
+    with TranslationServer(path, preload=False) as server:
+        assert server.address == path
+
+
+def test_server_failed_preload_leaves_no_socket(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def missing(language_code: str) -> None:
+        raise FileNotFoundError(language_code)
+
+    monkeypatch.setattr(server_utils, "Translator", missing)
+    path = tmp_path / "tl.sock"
+    with pytest.raises(FileNotFoundError):
+        _ = TranslationServer(str(path))
+    assert not path.exists()
+
+
+def test_percentile() -> None:
+    samples = [float(n) for n in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+def test_read_records() -> None:
+    records = list(read_records(['{"lang": "en", "key": "hello"}\n', "\n", "oops\n"]))
+    assert records[0] == {"lang": "en", "key": "hello"}
+    assert "error" in records[1]
+
+
+def test_server_lookup(server: TranslationServer) -> None:
+    assert isinstance(server.address, str)
+    with TranslationClient(server.address) as client:
+        result = client.request(
+            {"op": "lookup", "lang": EXAMPLE_SUPPORTED_LANGUAGE_CODE, "key": "*"}
+        )
+        missing = client.request(
+            {
+                "lang": EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+                "key": EXAMPLE_UNSUPPORTED_LANGUAGE,
+            }
+        )
+    assert result["value"] == get_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*")
+    assert "error" in missing
+    assert server.latency_percentiles()["count"] == 2
+
+
+def test_server_concurrent_clients(server: TranslationServer) -> None:
+    assert isinstance(server.address, str)
+    address = server.address
+
+    def lookup(_: int) -> object:
+        with TranslationClient(address) as client:
+            return client.request(
+                {"op": "lookup", "lang": EXAMPLE_SUPPORTED_LANGUAGE_CODE, "key": "*"}
+            )["value"]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        values = list(pool.map(lookup, range(32)))
+    assert all(value == values[0] for value in values)
+    assert server.latency_percentiles()["count"] == 32
+
+
+def test_server_survives_bad_input(server: TranslationServer) -> None:
+    assert isinstance(server.address, str)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(server.address)
+        with sock.makefile("rwb") as f:
+            _ = f.write(b'{"lang": "en", "key": "\xff"}\n')
+            _ = f.write(b'{"op": "lookup", "lang": "en", "key": "*"}\n')
+            f.flush()
+            assert "error" in json.loads(f.readline())
+            assert "value" in json.loads(f.readline())
+
+
+def test_dump_record_non_json_values() -> None:
+    when = datetime.date(2024, 1, 2)
+    assert json.loads(dump_record({"value": when})) == {"value": "2024-01-02"}
+
+
+def test_server_keys_translators_by_resolved_code(server: TranslationServer) -> None:
+    assert isinstance(server.address, str)
+    with TranslationClient(server.address) as client:
+        for n in range(20):
+            _ = client.request({"lang": f"xx-{n}", "key": "hello"})
+    assert len(server._server.translators) == 1
+
+
+def test_server_latencies_are_bounded(
+    server: TranslationServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(server_utils, "MAX_LATENCY_SAMPLES", 10)
+    for n in range(100):
+        server._server.record_latency(n / 1000)
+    assert len(server._server.latencies) == 10
+    summary = server.latency_percentiles()
+    assert summary["count"] == 100
+    assert summary["max"] == pytest.approx(99.0)
@@ -0,0 +1,62 @@
+import pytest
+
+from tl.utils.template_utils import Template, compile_template, render
+
+
+@pytest.mark.parametrize(
+    ("source", "args"),
+    [
+        ("This is the English language file", {}),
+        ("Hello {name}", {"name": "Blake"}),
+        (
+            "{greeting}, {name}! You have {count} new {{messages}}",
+            {
+                "greeting": "Hi",
+                "name": "Blake",
+                "count": 3,
+            },
+        ),
+        ("{count:>4d} | {name!r}", {"count": 7, "name": "Blake"}),
+        ("{user.real} {items[0]}", {"user": 2, "items": ["a"]}),
+        ("{{escaped}}", {}),
+    ],
+)
+def test_render_matches_str_format(source: str, args: dict[str, object]) -> None:
+    assert Template(source).render(**args) == source.format(**args)
+
+
+def test_template_field_names() -> None:
+    assert Template("{a} {b:>3} {a}").field_names == {"a", "b"}
+
+
+def test_template_without_placeholders_is_unchanged() -> None:
+    source = "This is the English language file"
+    assert Template(source).render() is source
+
+
+def test_render_missing_arg_fail() -> None:
+    with pytest.raises(KeyError, match="name"):
+        _ = render("Hello {name}")
+
+
+def test_render_extra_arg_fail() -> None:
+    with pytest.raises(TypeError, match="extra"):
+        _ = render("Hello {name}", name="Blake", extra="arg")
+
+
+def test_render_extra_arg_without_placeholders_fail() -> None:
+    with pytest.raises(TypeError):
+        _ = render("Hello", name="Blake")
+
+
+def test_compile_template_malformed_fail() -> None:
+    with pytest.raises(ValueError):
+        _ = Template("Hello {name")
+
+
+def test_compile_template_is_cached() -> None:
+    assert compile_template("Hello {name}") is compile_template("Hello {name}")
+
+
+def test_render_map() -> None:
+    assert Template("Hello {name}").render_map({"name": "Blake"}) == "Hello Blake"
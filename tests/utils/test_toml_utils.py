@@ -1,5 +1,9 @@
+import os
+import threading
+from pathlib import Path
+
 import pytest
-from glom.core import PathAccessError  # type: ignore
+import tomlkit
 from pydantic_core import ValidationError
 from tomlkit.exceptions import EmptyKeyError, EmptyTableNameError
 
@@ -12,8 +16,13 @@ from resources.constants.values import (
 )
 from tl.utils.toml_utils import (
     deserialize_toml_dict,
+    edit_toml_file,
+    get_read_backend,
     get_value_from_key,
+    load_catalog,
+    load_toml_document,
     serialize_toml_dict,
+    set_read_backend,
     valid_toml_path_validator,  # TODO: test this
 )
 
@@ -68,10 +77,122 @@ def test_get_value_from_key_empty_key_path_fail() -> None:
 
 
 def test_get_value_from_key_wrong_section_fail() -> None:
-    with pytest.raises(PathAccessError):
+    with pytest.raises(KeyError):
         _ = get_value_from_key(EXAMPLE_ENGLISH_TOML_PATH, key_path="welcome")
 
 
 def test_get_value_from_key_unsupported_language_fail() -> None:
     with pytest.raises(FileNotFoundError):
         _ = get_value_from_key(EXAMPLE_UNSUPPORTED_LANGUAGE_TOML_PATH, key_path="hello")
+
+
+def test_serialize_toml_default_backend_is_plain_dict() -> None:
+    assert get_read_backend() == "tomllib"
+    assert type(serialize_toml_dict(EXAMPLE_ENGLISH_TOML_PATH)) is dict
+
+
+def test_serialize_toml_tomlkit_backend() -> None:
+    toml_dict = serialize_toml_dict(EXAMPLE_ENGLISH_TOML_PATH, backend="tomlkit")
+    assert isinstance(toml_dict, tomlkit.TOMLDocument)
+    assert toml_dict == EXAMPLE_ENGLISH_TOML_DICT
+
+
+def test_set_read_backend() -> None:
+    set_read_backend("tomlkit")
+    try:
+        assert isinstance(
+            serialize_toml_dict(EXAMPLE_ENGLISH_TOML_PATH), tomlkit.TOMLDocument
+        )
+    finally:
+        set_read_backend("tomllib")
+
+
+def test_set_read_backend_unknown_fail() -> None:
+    with pytest.raises(ValueError):
+        set_read_backend("toml")  # type: ignore[arg-type]
+
+
+def test_load_toml_document() -> None:
+    toml_document = load_toml_document(EXAMPLE_ENGLISH_TOML_PATH)
+    assert isinstance(toml_document, tomlkit.TOMLDocument)
+    assert toml_document == EXAMPLE_ENGLISH_TOML_DICT
+
+
+LANGUAGE_TOML: str = """# German strings
+hello = "Hallo {name}"  # greeting
+
+[start]
+welcome = "Willkommen"
+old = "Alt"
+"""
+
+
+@pytest.fixture
+def language_file(tmp_path: Path) -> Path:
+    path = tmp_path / "de.toml"
+    _ = path.write_text(LANGUAGE_TOML, encoding="utf-8")
+    return path
+
+
+def test_edit_toml_file(language_file: Path) -> None:
+    assert load_catalog(language_file).lookup("start.welcome") == "Willkommen"
+    with edit_toml_file(language_file) as edit:
+        edit.set("start.welcome", "Willkommen {name}!")
+        edit.delete("start.old")
+        edit.set("settings.display.brightness", "Helligkeit")
+        assert len(edit) == 3
+    text = language_file.read_text(encoding="utf-8")
+    assert text.startswith('# German strings\nhello = "Hallo {name}"  # greeting\n')
+    assert "old" not in text
+    # The commit invalidated the cached catalog
+    catalog = load_catalog(language_file)
+    assert catalog.lookup("start.welcome") == "Willkommen {name}!"
+    assert catalog.lookup("settings.display.brightness") == "Helligkeit"
+    assert os.listdir(language_file.parent) == ["de.toml"]
+
+
+def test_edit_toml_file_missing_key_writes_nothing(language_file: Path) -> None:
+    with pytest.raises(KeyError):
+        with edit_toml_file(language_file) as edit:
+            edit.set("start.welcome", "Willkommen {name}!")
+            edit.delete("start.missing")
+    assert language_file.read_text(encoding="utf-8") == LANGUAGE_TOML
+    assert os.listdir(language_file.parent) == ["de.toml"]
+
+
+def test_edit_toml_file_not_a_table_fail(language_file: Path) -> None:
+    with pytest.raises(TypeError):
+        with edit_toml_file(language_file) as edit:
+            edit.set("hello.world", "Hallo Welt")
+    assert language_file.read_text(encoding="utf-8") == LANGUAGE_TOML
+
+
+def test_edit_toml_file_rolls_back_on_error(language_file: Path) -> None:
+    edit = edit_toml_file(language_file)
+    with pytest.raises(RuntimeError):
+        with edit:
+            edit.delete("hello")
+            raise RuntimeError
+    assert len(edit) == 0
+    assert language_file.read_text(encoding="utf-8") == LANGUAGE_TOML
+
+
+def test_concurrent_edits_keep_every_change(language_file: Path) -> None:
+    def add_key(i: int) -> None:
+        with edit_toml_file(language_file) as edit:
+            edit.set(f"keys.key_{i}", str(i))
+
+    threads = [threading.Thread(target=add_key, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(load_catalog(language_file).lookup("keys.*")) == 8  # type: ignore[arg-type]
+
+
+def test_deserialize_toml_keeps_file_mode(language_file: Path) -> None:
+    language_file.chmod(0o644)
+    deserialize_toml_dict({"hello": "Hallo"}, language_file)
+    assert language_file.stat().st_mode & 0o777 == 0o644
+    assert serialize_toml_dict(language_file) == {"hello": "Hallo"}
+    assert os.listdir(language_file.parent) == ["de.toml"]
@@ -1,14 +1,35 @@
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
 from resources.constants.values import (
     EXAMPLE_SUPPORTED_LANGUAGE,
     EXAMPLE_SUPPORTED_LANGUAGE_CODE,
     EXAMPLE_UNSUPPORTED_LANGUAGE,
     EXAMPLE_UNSUPPORTED_LANGUAGE_CODE,
 )
+from tl.utils import config_utils
+from tl.utils.compile_utils import BinaryCatalog
+from tl.utils.config_utils import CONFIG_ENV, get_fallback_language_code, reload
+from tl.utils.toml_utils import CATALOG_CACHE, _load_catalog, compile_toml_file
 from tl.utils.translation_utils import (
-    get_i18n_obj,  # TODO: test this
+    MISSING_FILES,
+    MISSING_KEYS,
+    UNSUPPORTED_CODES,
+    Translator,
+    _resolve_cached_catalog,
+    _resolve_catalog,
+    get_i18n_obj,
+    get_i18n_objs,
     get_languages,
     get_languages_as_english_names,
     is_supported,
+    share_catalogs,
+    translate_records,
+    unshare_catalogs,
 )
 
 
@@ -36,3 +57,282 @@ def test_is_supported_language() -> None:
 
 def test_is_supported_language_fail() -> None:
     assert not is_supported(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE)
+
+
+def test_get_i18n_obj() -> None:
+    assert isinstance(get_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*"), list)
+
+
+def test_get_i18n_obj_unsupported_uses_fallback() -> None:
+    assert get_i18n_obj(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE, "*") == get_i18n_obj(
+        get_fallback_language_code(), "*"
+    )
+
+
+def test_translator_unsupported_uses_fallback() -> None:
+    translator = Translator(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE)
+    assert translator.requested_code == EXAMPLE_UNSUPPORTED_LANGUAGE_CODE
+    assert translator.language_code == get_fallback_language_code()
+
+
+def test_translator_matches_get_i18n_obj() -> None:
+    translator = Translator(EXAMPLE_SUPPORTED_LANGUAGE_CODE)
+    assert translator.get("*") == get_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*")
+
+
+def test_translator_missing_key_fail() -> None:
+    with pytest.raises(KeyError):
+        _ = Translator(EXAMPLE_SUPPORTED_LANGUAGE_CODE).get(
+            EXAMPLE_UNSUPPORTED_LANGUAGE
+        )
+
+
+def test_get_i18n_obj_default() -> None:
+    default = object()
+    assert get_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "missing", default) is default
+    translator = Translator(EXAMPLE_SUPPORTED_LANGUAGE_CODE)
+    assert translator.get("missing", default=default) is default
+    assert translator.get("*", default=default) == get_i18n_obj(
+        EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*"
+    )
+
+
+def test_missing_keys_are_cached() -> None:
+    translator = Translator(EXAMPLE_SUPPORTED_LANGUAGE_CODE)
+    MISSING_KEYS.clear()
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            _ = translator.get("missing")
+        assert translator.get("missing", default=None) is None
+    assert (len(MISSING_KEYS), MISSING_KEYS.hits) == (1, 5)
+
+
+def test_unsupported_codes_are_cached(caplog: pytest.LogCaptureFixture) -> None:
+    UNSUPPORTED_CODES.clear()
+    with caplog.at_level("WARNING", logger="tl"):
+        for _ in range(3):
+            _ = get_i18n_obj(EXAMPLE_UNSUPPORTED_LANGUAGE_CODE, "*")
+    assert len(caplog.records) == 1
+    assert UNSUPPORTED_CODES.hits == 2
+
+
+def test_get_i18n_objs() -> None:
+    assert (
+        list(get_i18n_objs(EXAMPLE_SUPPORTED_LANGUAGE_CODE, ["*", "*"]))
+        == [get_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*")] * 2
+    )
+
+
+def test_get_i18n_objs_is_lazy() -> None:
+    i18n_objs = get_i18n_objs(
+        EXAMPLE_SUPPORTED_LANGUAGE_CODE, ["*", EXAMPLE_UNSUPPORTED_LANGUAGE]
+    )
+    _ = next(i18n_objs)
+    with pytest.raises(KeyError):
+        _ = next(i18n_objs)
+
+
+def test_translate_records_reports_errors() -> None:
+    results = list(
+        translate_records(
+            [
+                {"lang": EXAMPLE_SUPPORTED_LANGUAGE_CODE, "key": "*"},
+                {"lang": EXAMPLE_SUPPORTED_LANGUAGE_CODE},
+                {"lang": EXAMPLE_SUPPORTED_LANGUAGE_CODE, "key": "missing"},
+                {"error": "invalid JSON record"},
+            ]
+        )
+    )
+    assert "value" in results[0]
+    assert all("error" in result for result in results[1:])
+
+
+@pytest.fixture
+def locale_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    (i18n_dir := tmp_path / "i18n").mkdir()
+    _ = (i18n_dir / "en.toml").write_text(
+        'hello = "Hello"\nbye = "Bye"\n\n'
+        '[start]\nwelcome = "Welcome"\ntitle = "Start"\n'
+    )
+    _ = (i18n_dir / "de.toml").write_text(
+        'hello = "Hallo"\n\n[start]\ntitle = "Anfang"\n'
+    )
+    _ = (i18n_dir / "de-at.toml").write_text('hello = "Servus"\n')
+    _ = (tmp_path / "config.toml").write_text(
+        '[paths]\ni18n_dir = "i18n"\n\n'
+        '[languages]\nfallback = "en"\n\n'
+        '[languages.en]\nfile = "en.toml"\n\n'
+        '[languages.de]\nfile = "de.toml"\n\n'
+        '[languages.de-at]\nfile = "de-at.toml"\n'
+    )
+    monkeypatch.setenv(CONFIG_ENV, str(tmp_path / "config.toml"))
+    config_utils._resolve_config_file_path.cache_clear()
+    _ = reload()
+    yield i18n_dir
+    monkeypatch.undo()
+    config_utils._resolve_config_file_path.cache_clear()
+    _ = reload()
+
+
+def test_missing_chain_file_warns_once(
+    locale_dir: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    (locale_dir / "de.toml").unlink()
+    MISSING_FILES.clear()
+    with caplog.at_level("WARNING", logger="tl"):
+        for _ in range(3):
+            assert get_i18n_obj("de-at", "start.title") == "Start"
+    assert [record.exc_info for record in caplog.records] == [None]
+    assert "'de'" in caplog.records[0].getMessage()
+    _ = reload()  # a new snapshot warns again
+    with caplog.at_level("WARNING", logger="tl"):
+        _ = _resolve_catalog("de-at")
+    assert len(caplog.records) == 2
+
+
+def test_get_i18n_obj_resolves_missing_keys_through_chain(locale_dir: Path) -> None:
+    assert get_i18n_obj("de-at", "hello") == "Servus"
+    assert get_i18n_obj("de-at", "start.title") == "Anfang"
+    assert get_i18n_obj("de-at", "bye") == "Bye"
+    assert get_i18n_obj("de-at", "start.*") == ["Anfang", "Welcome"]
+    assert get_i18n_obj("de-ch", "hello") == "Hallo"
+    with pytest.raises(KeyError):
+        _ = get_i18n_obj("de-at", "missing")
+
+
+def test_merged_catalog_shares_values(locale_dir: Path) -> None:
+    translator = Translator("de-at")
+    assert translator.language_code == "de-at"
+    en = _load_catalog(locale_dir / "en.toml")
+    assert translator.get("bye") is en.lookup("bye")
+    # The merged catalog is built once and reused while its languages are unchanged
+    assert Translator("de-at").catalog is translator.catalog
+
+
+def test_translator_keys_include_fallbacks(locale_dir: Path) -> None:
+    translator = Translator("de-at")
+    assert list(translator.keys()) == ["hello", "start.title", "start.welcome", "bye"]
+    assert list(translator.keys("start")) == ["start.title", "start.welcome"]
+    assert get_i18n_obj("de-at", "**") == ["Servus", "Anfang", "Welcome", "Bye"]
+
+
+def test_chain_keeps_binary_catalogs_lazy(locale_dir: Path) -> None:
+    for name in ("de-at", "de", "en"):
+        _ = compile_toml_file(locale_dir / f"{name}.toml")
+    assert get_i18n_obj("de-at", "bye") == "Bye"
+    assert get_i18n_obj("de-at", "start.*") == ["Anfang", "Welcome"]
+    assert list(Translator("de-at").keys("start")) == ["start.title", "start.welcome"]
+    for name in ("de-at", "de", "en"):
+        catalog = _load_catalog(locale_dir / f"{name}.toml")
+        assert isinstance(catalog, BinaryCatalog)
+        assert catalog._tree is None
+
+
+def test_merged_catalog_rebuilt_after_change(locale_dir: Path) -> None:
+    assert get_i18n_obj("de-at", "bye") == "Bye"
+    path = locale_dir / "en.toml"
+    _ = path.write_text('bye = "Goodbye"\n')
+    os.utime(path, ns=(0, 0))
+    assert get_i18n_obj("de-at", "bye") == "Goodbye"
+
+
+def test_resolve_cached_catalog_never_loads(locale_dir: Path) -> None:
+    CATALOG_CACHE.clear()
+    assert _resolve_cached_catalog("de-at") is None
+    for name in ("de-at", "de", "en"):
+        _ = _load_catalog(locale_dir / f"{name}.toml")
+    # Chaining loaded catalogs needs no load
+    assert _resolve_cached_catalog("de-at") == _resolve_catalog("de-at")
+    assert _resolve_cached_catalog("en") == _resolve_catalog("en")
+
+    path = locale_dir / "en.toml"
+    _ = path.write_text('bye = "Goodbye"\n')
+    os.utime(path, ns=(0, 0))
+    assert _resolve_cached_catalog("de-at") is None
+    assert _resolve_cached_catalog("en") is None
+    assert CATALOG_CACHE.misses == 3
+
+
+def test_chain_skips_missing_files(locale_dir: Path) -> None:
+    (locale_dir / "de.toml").unlink()
+    assert get_i18n_obj("de-at", "start.title") == "Start"
+    (locale_dir / "de-at.toml").unlink()
+    assert Translator("de-at").language_code == "en"
+
+
+def test_missing_keys_forgotten_after_reload(locale_dir: Path) -> None:
+    assert get_i18n_obj("de", "farewell", default=None) is None
+    path = locale_dir / "en.toml"
+    _ = path.write_text('farewell = "Farewell"\n')
+    os.utime(path, ns=(0, 0))
+    assert get_i18n_obj("de", "farewell", default=None) == "Farewell"
+
+
+def test_share_catalogs(locale_dir: Path) -> None:
+    try:
+        assert share_catalogs() > 0
+        translator = Translator("de-at")
+        assert isinstance(translator.catalog, BinaryCatalog)
+        assert translator.get("hello") == "Servus"
+        assert translator.get("bye") == "Bye"
+        assert get_i18n_obj("de-ch", "start.*") == ["Anfang", "Welcome"]
+        # Shared catalogs are snapshots of the files when they were packed
+        _ = (locale_dir / "de-at.toml").write_text('hello = "Griaß di"\n')
+        assert get_i18n_obj("de-at", "hello") == "Servus"
+    finally:
+        unshare_catalogs()
+    assert get_i18n_obj("de-at", "hello") == "Griaß di"
+
+
+def _uss() -> int:
+    total = 0
+    for line in Path("/proc/self/smaps_rollup").read_text().splitlines():
+        if line.startswith(("Private_Clean:", "Private_Dirty:")):
+            total += int(line.split()[1]) * 1024
+    return total
+
+
+def _forked_lookup_growth(keys: int) -> int:
+    """
+    Fork a worker that looks up every key once and report how much its unique
+    set size (the memory no other process shares) grew.
+    """
+    read_fd, write_fd = os.pipe()
+    if (pid := os.fork()) == 0:
+        try:
+            before = _uss()
+            translator = Translator("en")
+            for i in range(keys):
+                # Build key paths here, so the parent's strings stay untouched
+                _ = translator.get(f"section_{i // 100}.key_{i % 100}")
+            _ = os.write(write_fd, str(_uss() - before).encode())
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        growth = f.read()
+    _ = os.waitpid(pid, 0)
+    return int(growth)
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="reads /proc/self/smaps_rollup"
+)
+def test_shared_catalogs_are_not_copied_into_workers(locale_dir: Path) -> None:
+    keys = 20_000
+    lines: list[str] = []
+    for section in range(keys // 100):
+        lines.append(f"[section_{section}]")
+        lines.extend(
+            f'key_{i} = "Message {section * 100 + i} with a {{placeholder}} in it"'
+            for i in range(100)
+        )
+    _ = (locale_dir / "en.toml").write_text("\n".join(lines))
+    _ = Translator("en").get("section_0.key_0")
+    copied = _forked_lookup_growth(keys)
+    try:
+        _ = share_catalogs(["en"])
+        shared = _forked_lookup_growth(keys)
+    finally:
+        unshare_catalogs()
+    assert shared * 3 < copied
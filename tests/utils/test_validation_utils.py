@@ -0,0 +1,79 @@
+import asyncio
+import inspect
+from collections.abc import Iterator
+
+import pytest
+from pydantic import Field
+from pydantic_core import ValidationError
+
+from resources.constants.values import (
+    EXAMPLE_ENGLISH_TOML_PATH,
+    EXAMPLE_SUPPORTED_LANGUAGE_CODE,
+    EXAMPLE_UNSUPPORTED_LANGUAGE_TOML_PATH,
+)
+from tl.utils.toml_utils import get_value_from_key
+from tl.utils.translation_utils import get_i18n_obj
+from tl.utils.validation_utils import (
+    get_validation_mode,
+    set_validation_mode,
+    validate_boundary,
+)
+
+
+@validate_boundary
+def _double(n: int, name: str = Field(..., min_length=1)) -> object:
+    return n * 2
+
+
+@validate_boundary
+async def _adouble(n: int) -> object:
+    return n * 2
+
+
+@pytest.fixture(autouse=True)
+def _restore_mode() -> Iterator[None]:
+    mode = get_validation_mode()
+    yield
+    set_validation_mode(mode)
+
+
+def test_default_validation_mode() -> None:
+    assert get_validation_mode() == "strict"
+
+
+def test_set_validation_mode_fail() -> None:
+    with pytest.raises(ValueError):
+        set_validation_mode("lenient")  # type: ignore[arg-type]
+
+
+def test_validate_boundary_strict() -> None:
+    assert _double("2", "n") == 4  # type: ignore[arg-type]
+    with pytest.raises(ValidationError):
+        _ = _double(2, "")
+
+
+def test_validate_boundary_fast() -> None:
+    set_validation_mode("fast")
+    assert get_validation_mode() == "fast"
+    assert _double("2", "") == "22"  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("mode", ["strict", "fast"])
+def test_validate_boundary_coroutine_function(mode: str) -> None:
+    set_validation_mode(mode)  # type: ignore[arg-type]
+    assert inspect.iscoroutinefunction(_adouble)
+    assert not inspect.iscoroutinefunction(_double)
+    assert asyncio.run(_adouble(2)) == 4
+
+
+def test_fast_mode_matches_strict_mode() -> None:
+    strict = get_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*")
+    set_validation_mode("fast")
+    assert get_i18n_obj(EXAMPLE_SUPPORTED_LANGUAGE_CODE, "*") == strict
+    assert get_value_from_key(EXAMPLE_ENGLISH_TOML_PATH, "hello") == "Hello {name}"
+
+
+def test_fast_mode_skips_path_validation() -> None:
+    set_validation_mode("fast")
+    with pytest.raises(FileNotFoundError):
+        _ = get_value_from_key(EXAMPLE_UNSUPPORTED_LANGUAGE_TOML_PATH, "hello")
@@ -0,0 +1,123 @@
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from tl.utils import config_utils
+from tl.utils.config_utils import CONFIG_ENV, get_config_snapshot, reload
+from tl.utils.translation_utils import Translator, get_i18n_obj
+from tl.utils.watch_utils import CatalogWatcher, WatchBackend
+
+BACKENDS: list[WatchBackend] = ["polling"]
+if sys.platform.startswith("linux"):
+    BACKENDS.append("inotify")
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("timed out waiting for a reload")
+        time.sleep(0.01)
+
+
+def _write_config(dir_path: Path, fallback: str = "en") -> None:
+    _ = (dir_path / "config.toml").write_text(
+        '[paths]\ni18n_dir = "i18n"\n\n'
+        f'[languages]\nfallback = "{fallback}"\n\n'
+        '[languages.en]\nfile = "en.toml"\n\n'
+        '[languages.de]\nfile = "de.toml"\n'
+    )
+
+
+@pytest.fixture
+def i18n_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    (i18n_dir := tmp_path / "i18n").mkdir()
+    _ = (i18n_dir / "en.toml").write_text('hello = "Hello {name}"\n')
+    _ = (i18n_dir / "de.toml").write_text('hello = "Hallo {name}"\n')
+    _write_config(tmp_path)
+    monkeypatch.setenv(CONFIG_ENV, str(tmp_path / "config.toml"))
+    config_utils._resolve_config_file_path.cache_clear()
+    _ = reload()
+    yield i18n_dir
+    monkeypatch.undo()
+    config_utils._resolve_config_file_path.cache_clear()
+    _ = reload()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_watcher_reloads_changed_language_file(
+    i18n_dir: Path, backend: WatchBackend
+) -> None:
+    translator = Translator("en")
+    assert translator.t("hello", name="Blake") == "Hello Blake"
+    with CatalogWatcher(interval=0.05, backend=backend) as watcher:
+        _ = (i18n_dir / "en.toml").write_text('hello = "Hi there {name}"\n')
+        _wait_for(lambda: watcher.stats().reloads >= 1)
+        assert translator.t("hello", name="Blake") == "Hi there Blake"
+    stats = watcher.stats()
+    assert stats.backend == backend
+    assert stats.failures == 0
+    assert stats.total_duration >= stats.last_duration > 0
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_watcher_reloads_replaced_config_file(
+    i18n_dir: Path, backend: WatchBackend
+) -> None:
+    config_file_path = i18n_dir.parent / "config.toml"
+    with CatalogWatcher(interval=0.05, backend=backend) as watcher:
+        _write_config(i18n_dir, fallback="de")  # written aside, then renamed
+        (i18n_dir / "config.toml").replace(config_file_path)
+        _wait_for(lambda: watcher.stats().reloads >= 1)
+    assert get_config_snapshot().fallback_code == "de"
+
+
+def test_watcher_keeps_catalog_on_failure(i18n_dir: Path) -> None:
+    translator = Translator("en")
+    watcher = CatalogWatcher(backend="polling")
+    _ = (i18n_dir / "en.toml").write_text('hello = "unterminated\n')
+    assert not watcher.reload([i18n_dir / "en.toml"])
+    assert watcher.stats().failures == 1
+    assert translator.get("hello") == "Hello {name}"
+    assert get_i18n_obj("en", "hello") == "Hello {name}"
+    # Once the file is fixed, it is picked up again
+    _ = (i18n_dir / "en.toml").write_text('hello = "Hi there {name}"\n')
+    assert watcher.reload([i18n_dir / "en.toml"])
+    assert translator.get("hello") == "Hi there {name}"
+
+
+def test_lookups_leave_changed_files_to_the_watcher(i18n_dir: Path) -> None:
+    assert get_i18n_obj("en", "hello") == "Hello {name}"
+    with CatalogWatcher(interval=0.5, backend="polling"):
+        with open(i18n_dir / "en.toml", "a") as f:
+            _ = f.write("[broken\n")
+        assert get_i18n_obj("en", "*") == ["Hello {name}"]
+
+
+def test_watcher_stop_waits_at_most_interval(
+    i18n_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    reloading = threading.Event()
+
+    def slow_reload(_: object) -> bool:
+        reloading.set()
+        time.sleep(1)
+        return True
+
+    watcher = CatalogWatcher(interval=0.05, backend="polling").start()
+    monkeypatch.setattr(watcher, "reload", slow_reload)
+    _ = (i18n_dir / "de.toml").write_text('hello = "Servus {name}"\n')
+    assert reloading.wait(5)
+    start = time.monotonic()
+    watcher.stop()
+    assert time.monotonic() - start < 0.5
+
+
+def test_watcher_skips_unloaded_catalogs(i18n_dir: Path) -> None:
+    watcher = CatalogWatcher(backend="polling")
+    assert watcher.reload([i18n_dir / "de.toml"])
+    assert watcher.stats().reloads == 1
@@ -1,14 +1,11 @@
 """
 init for the translation_library package
+
+The package logs to the "tl" logger but never configures logging itself. Call
+`tl.utils.log_utils.configure_logging()` (or set `TL_LOG_LEVEL`/`TL_LOG_FILE`
+when using the CLI) to opt in.
 """
 
-import datetime
 import logging
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="[%(levelname)s] (%(asctime)s) %(funcName)s(): %(message)s ['%(pathname)s:%(lineno)s']",
-    filename=f"logs/{datetime.datetime.now().strftime("%H:%M:%S_%m-%d-%y")}.log",
-)
-
-logging.getLogger(__name__).debug("Starting session")
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -1,9 +1,24 @@
 import logging
 
-from tl.cli.tl_cli import cli
-
 logger = logging.getLogger(__name__)
 
 
-if __name__ == "__main__":
+def main() -> None:
+    from tl.utils.log_utils import configure_logging_from_env
+
+    _ = configure_logging_from_env()
+
+    # The hot `translate`/`supported` commands skip importing typer and the
+    # rest of the full CLI entirely
+    from tl.cli import fast_cli
+
+    if fast_cli.run():
+        return
+
+    from tl.cli.tl_cli import cli
+
     cli()
+
+
+if __name__ == "__main__":
+    main()
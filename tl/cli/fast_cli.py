@@ -0,0 +1,98 @@
+"""
+A lightweight dispatch path for the hot `translate` and `supported` commands.
+
+It handles only the plain forms of those commands without importing typer (or
+anything else the full CLI needs). Anything it does not recognize, such as
+`--help`, `--batch` or an error that needs a usage message, is left to the full
+typer CLI in `tl_cli`, so the observable behavior of both paths is the same.
+"""
+
+import sys
+
+_OPTION_NAMES: dict[str, str] = {
+    "-l": "language",
+    "--language": "language",
+    "-k": "key_path",
+    "--key-path": "key_path",
+}
+
+
+def _parse(argv: list[str]) -> tuple[dict[str, str], list[str]] | None:
+    """
+    Parse `-l/--language` and `-k/--key-path` options and positional args.
+
+    Returns:
+        tuple[dict[str, str], list[str]] | None: options and positional args, or None
+            if anything else was given
+    """
+    options: dict[str, str] = {}
+    positional: list[str] = []
+    args = iter(argv)
+    for arg in args:
+        if arg == "--":
+            positional.extend(args)
+        elif arg.startswith("-"):
+            name, eq, value = arg.partition("=")
+            if name not in _OPTION_NAMES or name in options:
+                return None
+            if not eq and (value := next(args, None)) is None:
+                return None
+            options[_OPTION_NAMES[name]] = value
+        else:
+            positional.append(arg)
+    return options, positional
+
+
+def _translate(options: dict[str, str], positional: list[str]) -> bool:
+    if "language" not in options or "key_path" not in options:
+        return False
+    if not all("=" in arg for arg in positional):
+        return False
+
+    from tl.utils.template_utils import compile_template
+    from tl.utils.translation_utils import get_i18n_obj
+
+    try:
+        i18n_obj = get_i18n_obj(options["language"].lower(), options["key_path"])
+        if not isinstance(i18n_obj, str):
+            print(i18n_obj)
+            return True
+        placeholder_args = dict(arg.split("=", 1) for arg in positional)
+        print(compile_template(i18n_obj).render_map(placeholder_args))
+    except Exception:
+        return False  # let the full CLI report the error
+    return True
+
+
+def _supported(options: dict[str, str], positional: list[str]) -> bool:
+    if "language" not in options or "key_path" in options or positional:
+        return False
+
+    from tl.utils.translation_utils import is_supported
+
+    try:
+        print(is_supported(options["language"].lower()))
+    except Exception:
+        return False
+    return True
+
+
+_COMMANDS = {"translate": _translate, "supported": _supported}
+
+
+def run(argv: list[str] | None = None) -> bool:
+    """
+    Run a plain `translate` or `supported` command without loading the full CLI.
+
+    Args:
+        argv (list[str] | None, optional): the command line args. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        bool: `True` if the command was handled, `False` if the full CLI should run it
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or (command := _COMMANDS.get(argv[0])) is None:
+        return False
+    if (parsed := _parse(argv[1:])) is None:
+        return False
+    return command(*parsed)
@@ -12,6 +12,7 @@ from tl.utils.path_utils import (
     get_languages_file_path,
     get_project_root,
 )
+from tl.utils.template_utils import render
 from tl.utils.toml_utils import serialize_toml_dict
 
 
@@ -90,9 +91,9 @@ def print_translated_message(
         elif section and not variable_args:
             message_string = toml_dict[section][variable]
         elif not section and variable_args:
-            message_string = toml_dict[variable].format(**variable_args)
+            message_string = render(toml_dict[variable], **variable_args)
         else:
-            message_string = toml_dict[section][variable].format(**variable_args)
+            message_string = render(toml_dict[section][variable], **variable_args)
 
         print("TRANSLATION: " + message_string)
     except KeyError:
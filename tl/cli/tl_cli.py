@@ -1,18 +1,52 @@
-from typing import Annotated, List  # pyright: ignore[reportDeprecated]
+import signal
+import sys
+from pathlib import Path
+from typing import IO, Annotated, List, cast  # pyright: ignore[reportDeprecated]
 
 import typer  # ignore-errors
 from typer.main import Typer
 
+from tl.utils.language_utils import compile_language_files
+from tl.utils.server_utils import (
+    DEFAULT_ADDRESS,
+    TranslationClient,
+    TranslationServer,
+    dump_record,
+    read_records,
+)
+from tl.utils.template_utils import compile_template
 from tl.utils.translation_utils import (
     get_i18n_obj,
     get_languages,
     get_languages_as_english_names,
     is_supported,
+    translate_records,
 )
 
 cli: Typer = typer.Typer(no_args_is_help=True, suggest_commands=True)
 
 
+def translate_batch(lines: IO[str], out: IO[str], server: str | None = None) -> None:
+    """
+    Translate NDJSON `{"lang", "key", "args"}` records from `lines` and stream
+    one NDJSON `{"lang", "key", "value"}` or `{"lang", "key", "error"}` result
+    per record to `out`.
+
+    Args:
+        lines (IO[str]): the NDJSON input stream, e.g. stdin
+        out (IO[str]): the NDJSON output stream, e.g. stdout
+        server (str | None, optional): the address of a `serve` daemon to translate with
+    """
+    if server:
+        with TranslationClient(server) as client:
+            for record in read_records(lines):
+                _ = out.write(dump_record(client.request(record)))
+    else:
+        for result in translate_records(read_records(lines)):
+            _ = out.write(dump_record(result))
+    out.flush()
+
+
 @cli.command()
 def list(
     as_english: Annotated[bool, typer.Option("--english", "-e")] = False,
@@ -40,9 +74,11 @@ def list(
 
 @cli.command()
 def translate(
-    language_code: Annotated[str, typer.Option("--language", "-l")],
-    key_path: Annotated[str, typer.Option("--key-path", "-k")],
+    language_code: Annotated[str | None, typer.Option("--language", "-l")] = None,
+    key_path: Annotated[str | None, typer.Option("--key-path", "-k")] = None,
     args: Annotated[List[str], typer.Argument()] = [],
+    batch: Annotated[bool, typer.Option("--batch", "-b")] = False,
+    server: Annotated[str | None, typer.Option("--server", "-s")] = None,
 ) -> None:
     """
     Translate any value from a language TOML file with a specified key.
@@ -52,24 +88,52 @@ def translate(
         key_path (str): path to the i18n string to get in the language TOML file
         args (Optional[dict[str, object]]): optional dictionary entries to format
             into the i18n string's placeholder variables separated by spaces
+        batch (Optional[bool]): read NDJSON `{"lang", "key", "args"}` records from
+            stdin and write one NDJSON result per record to stdout
+        server (Optional[str]): translate with a running `serve` daemon at this
+            Unix socket path or HOST:PORT instead of loading catalogs
 
     Example:
     ```bash
     $ python -m translation_library translate -l en -k confirm
     $ python -m translation_library translate -l de -k hello name=Blake
     $ python -m translation_library translate -l ja -k notifications.new_message count=1
+    $ echo '{"lang": "de", "key": "hello", "args": {"name": "Blake"}}' | python -m translation_library translate --batch
+    $ python -m translation_library translate -s tl-python.sock -l de -k hello name=Blake
     ```
     """
-    raw_i18n_str: str = str(get_i18n_obj(language_code.lower(), key_path))
+    if batch:
+        translate_batch(sys.stdin, sys.stdout, server)
+        return
+    if not language_code or not key_path:
+        raise typer.BadParameter(
+            "--language and --key-path are required unless --batch is given"
+        )
 
     # If "name=Blake", adds {"name": "Blake"} to placeholder_args dictionary
-    if args:
-        placeholder_args: dict[str, str] = {
-            k: v for k, v in (arg.split("=") for arg in args)
-        }
-        print(raw_i18n_str.format(**placeholder_args))
-    else:
-        print(raw_i18n_str)
+    placeholder_args: dict[str, str] = {
+        k: v for k, v in (arg.split("=", 1) for arg in args)
+    }
+
+    if server:
+        with TranslationClient(server) as client:
+            result = client.request(
+                {"lang": language_code, "key": key_path, "args": placeholder_args}
+            )
+        if "error" in result:
+            raise typer.BadParameter(str(result["error"]))
+        print(result["value"])
+        return
+
+    i18n_obj: object = get_i18n_obj(language_code.lower(), key_path)
+    if not isinstance(i18n_obj, str):
+        print(i18n_obj)
+        return
+
+    try:
+        print(compile_template(i18n_obj).render(**placeholder_args))
+    except (KeyError, TypeError) as e:
+        raise typer.BadParameter(e.args[0], param_hint="args") from e
 
 
 @cli.command()
@@ -110,3 +174,150 @@ def i18n_print(
     ```
     """
     print(get_i18n_obj(language_code.lower(), key_path))
+
+
+@cli.command()
+def export(
+    language_code: Annotated[str, typer.Option("--language", "-l")],
+    export_format: Annotated[str, typer.Option("--format", "-f")] = "toml",
+    output: Annotated[Path | None, typer.Option("--output", "-o")] = None,
+) -> None:
+    """
+    Export a language file as TOML, JSON, NDJSON or a gettext .po file, written
+    key by key so memory use stays flat however large the file is.
+
+    Args:
+        language (str): the code of the language to export
+        export_format (Optional[str]): one of toml, json, ndjson or po. defaults to toml
+        output (Optional[Path]): the file to write. defaults to stdout
+
+    Example:
+    ```bash
+    $ python -m translation_library export -l de -f json
+    $ python -m translation_library export -l de -f po -o de.po
+    ```
+    """
+    from contextlib import nullcontext
+
+    from tl.utils.export_utils import EXPORT_FORMATS, ExportFormat, export_language
+
+    if export_format not in EXPORT_FORMATS:
+        raise typer.BadParameter(
+            f"expected one of {', '.join(EXPORT_FORMATS)}", param_hint="--format"
+        )
+    with (
+        open(output, "w", encoding="utf-8") if output else nullcontext(sys.stdout)
+    ) as out:
+        _ = export_language(
+            language_code.lower(), out, cast(ExportFormat, export_format)
+        )
+
+
+@cli.command()
+def compile() -> None:
+    """
+    Compile every language TOML file into a binary catalog, which lookups load
+    with mmap instead of parsing TOML. A compiled catalog is ignored once its
+    TOML file changes, so re-run this after editing language files.
+
+    Example:
+    ```bash
+    $ python -m translation_library compile
+    ```
+    """
+    for compiled_path in compile_language_files():
+        print(compiled_path)
+
+
+@cli.command()
+def serve(
+    address: Annotated[str, typer.Option("--address", "-a")] = DEFAULT_ADDRESS,
+    watch: Annotated[bool, typer.Option("--watch", "-w")] = False,
+) -> None:
+    """
+    Keep every language catalog resident and answer NDJSON translate records
+    over a Unix socket or a localhost TCP port until interrupted. Latency
+    percentiles are printed at shutdown.
+
+    Args:
+        address (Optional[str]): a Unix socket path, or HOST:PORT for TCP
+        watch (Optional[bool]): reload the config and language files when they change
+
+    Example:
+    ```bash
+    $ python -m translation_library serve -a tl-python.sock
+    $ python -m translation_library serve -a localhost:8765 --watch
+    ```
+    """
+    from tl.utils.watch_utils import CatalogWatcher
+
+    def stop(*_: object) -> None:
+        raise KeyboardInterrupt
+
+    _ = signal.signal(signal.SIGTERM, stop)
+    try:
+        server = TranslationServer(address)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--address") from e
+    watcher = CatalogWatcher() if watch else None
+    with server:
+        print(f"Serving on {address}", file=sys.stderr)
+        if watcher is not None:
+            _ = watcher.start()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            print(server.report(), file=sys.stderr)
+            if watcher is not None:
+                watcher.stop()
+                print(watcher.report(), file=sys.stderr)
+
+
+@cli.command()
+def check(
+    as_json: Annotated[bool, typer.Option("--json", "-j")] = False,
+    workers: Annotated[int | None, typer.Option("--workers", "-w", min=1)] = None,
+) -> None:
+    """
+    Check every language file against the fallback language for missing keys,
+    extra keys and mismatched placeholders, parsing the files in parallel.
+    Exits with status 1 if any issue was found.
+
+    Args:
+        as_json (Optional[bool]): print a machine-readable JSON report
+        workers (Optional[int]): max worker processes. defaults to the CPU count
+
+    Example:
+    ```bash
+    $ python -m translation_library check
+    $ python -m translation_library check --json -w 8
+    ```
+    """
+    import json
+
+    from tl.utils.check_utils import check_languages
+
+    report = check_languages(workers=workers)
+    if as_json:
+        print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    else:
+        for language in report.languages:
+            if language.ok:
+                print(f"{language.code}: ok")
+                continue
+            print(f"{language.code}: {language.file}")
+            for error in language.errors:
+                print(f"  error: {error}")
+            for key in language.missing:
+                print(f"  missing: {key}")
+            for key in language.extra:
+                print(f"  extra: {key}")
+            for mismatch in language.placeholders:
+                print(
+                    f"  placeholders: {mismatch['key']} expects {mismatch['expected']},"
+                    f" found {mismatch['found']}"
+                )
+    if not report.ok:
+        raise typer.Exit(1)
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import weakref
+from collections.abc import Iterable
+
+from pydantic import Field
+
+from tl.utils.catalog_utils import Catalog, ChainedCatalog
+from tl.utils.compile_utils import BinaryCatalog
+from tl.utils.config_utils import (
+    ConfigSnapshot,
+    _loaded_config_snapshot,
+    get_config_snapshot,
+)
+from tl.utils.translation_utils import (
+    _RAISE,
+    _lookup_i18n_obj,
+    _resolve_cached_catalog,
+    _resolve_catalog,
+    _resolve_chain,
+)
+from tl.utils.validation_utils import validate_boundary
+
+logger = logging.getLogger(__name__)
+
+_Resolved = tuple[str, Catalog | BinaryCatalog | ChainedCatalog]
+
+# Loads in flight on each event loop, by resolved language code
+_inflight: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Future[_Resolved]]
+] = weakref.WeakKeyDictionary()
+
+
+async def _aget_config_snapshot() -> ConfigSnapshot:
+    """
+    Intended for internal use. `get_config_snapshot()` without blocking the
+    event loop: on first use, the config file is parsed in the loop's default
+    executor.
+    """
+    if (snapshot := _loaded_config_snapshot()) is not None:
+        return snapshot
+    return await asyncio.get_running_loop().run_in_executor(None, get_config_snapshot)
+
+
+async def _aresolve_catalog(language_code: str) -> _Resolved:
+    """
+    Intended for internal use. `_resolve_catalog()` without blocking the event
+    loop. A language is only resolved on the loop if its catalogs are cached
+    and fresh already. Otherwise they are loaded in the loop's default
+    executor, and concurrent awaits for languages that resolve to the same
+    code (e.g. an unsupported code and the fallback language) share that load.
+    """
+    _ = await _aget_config_snapshot()
+    if (resolved := _resolve_cached_catalog(language_code)) is not None:
+        return resolved
+
+    resolved_code = _resolve_chain(language_code)[1][0]
+    loop = asyncio.get_running_loop()
+    inflight = _inflight.setdefault(loop, {})
+    if (future := inflight.get(resolved_code)) is None:
+        logger.debug("Loading '%s' off the event loop", resolved_code)
+        future = inflight[resolved_code] = loop.run_in_executor(
+            None, _resolve_catalog, resolved_code
+        )
+        future.add_done_callback(lambda _: inflight.pop(resolved_code, None))
+    # One awaiter being cancelled must not cancel the load the others share
+    return await asyncio.shield(future)
+
+
+@validate_boundary
+async def aget_i18n_obj(
+    language_code: str = Field(..., min_length=1),
+    key_path: str = Field(..., min_length=1),
+    default: object = _RAISE,
+) -> object:
+    """
+    Get the value of a specific key from a given language TOML file, like
+    `get_i18n_obj()`, without blocking the event loop. The first lookup of a
+    language parses its file, and the first lookup at all the config file, in
+    a worker thread; later lookups are answered on the loop.
+
+    Args:
+        language_code (str): the language's code from which to retrieve the i18n object
+        key_path (str): the key's path in the specified language TOML file. supports globbing.
+        default (Optional[object]): returned if the key path does not exist, instead of
+            raising
+
+    Raises:
+        KeyError: if the key path does not exist and there is no default
+        FileNotFoundError: if the fallback language's TOML file could not be found
+
+    Returns:
+        object: the value (as an object) of associated with the given key
+    """
+    return _lookup_i18n_obj(*await _aresolve_catalog(language_code), key_path, default)
+
+
+async def apreload(language_codes: Iterable[str] | None = None) -> dict[str, str]:
+    """
+    Load the catalogs of many languages in parallel worker threads, e.g. at
+    service startup, so later lookups never wait on parsing.
+
+    Args:
+        language_codes (Iterable[str] | None, optional): the codes to load. Defaults to
+            every language in the config file.
+
+    Raises:
+        FileNotFoundError: if the fallback language's TOML file could not be found
+
+    Returns:
+        dict[str, str]: each requested language code and the code it resolved to after fallback
+    """
+    if language_codes is None:
+        language_codes = (await _aget_config_snapshot()).language_codes
+    codes = list(dict.fromkeys(language_codes))
+    resolved = await asyncio.gather(*map(_aresolve_catalog, codes))
+    return {code: resolved_code for code, (resolved_code, _) in zip(codes, resolved)}
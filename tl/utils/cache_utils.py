@@ -0,0 +1,429 @@
+import itertools
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES: int = 128
+
+DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+
+DEFAULT_MAX_MISSES: int = 10_000
+
+
+class CacheStats(NamedTuple):
+    """
+    A point-in-time snapshot of a `FileCache`'s counters.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class _CacheEntry:
+    """
+    A loaded value and the file stats it was loaded with. Entries are never
+    changed once published, except for `last_used`, which readers bump
+    without a lock. A lost bump only makes LRU eviction slightly approximate.
+    """
+
+    __slots__ = ("mtime_ns", "size", "value", "last_used")
+
+    def __init__(self, mtime_ns: int, size: int, value: object, last_used: int) -> None:
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.value = value
+        self.last_used = last_used
+
+
+class _PendingLoad:
+    """
+    A load in progress, which threads that miss the same file wait on instead
+    of loading it again.
+    """
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: object = None
+        self.error: BaseException | None = None
+
+    def wait(self) -> object:
+        _ = self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class FileCache:
+    """
+    A process-wide, LRU-bounded cache of values derived from files on disk.
+
+    Entries are keyed by the file's absolute path and are only considered fresh
+    while the file's `st_mtime_ns` and `st_size` match what was recorded when the
+    value was loaded, so a cache hit costs a single `stat()` call. The file size
+    is used as the byte cost of an entry when enforcing `max_bytes`.
+
+    Reads never take a lock. The entries live in a dict that is never mutated
+    once published: loads, invalidations and evictions build a new dict under
+    a writer lock and publish it with a single reference swap, so a reader sees
+    either the old or the new entries, never a half-updated one. Threads that
+    miss the same file at the same time share a single load. The `hits` counter
+    is not synchronized and may undercount under heavy concurrency.
+
+    Values handed out by the cache are shared between callers and must be
+    treated as read-only.
+
+    While a watcher is attached (see `attach_watcher()`), cached entries are
+    served as they are, without the `stat()` check, and only the watcher
+    loads changed files again, through `refresh()`. A lookup then never
+    parses a file that is being saved, or that was saved broken.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[Path], object],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """
+        Args:
+            loader (Callable[[Path], object]): builds a value from a file path on a miss
+            max_entries (int, optional): max number of entries kept. Defaults to 128.
+            max_bytes (int, optional): max summed file size kept. Defaults to 64 MiB.
+        """
+        self._loader = loader
+        self._entries: dict[str, _CacheEntry] = {}
+        self._loading: dict[str, _PendingLoad] = {}
+        self._lock = threading.Lock()  # taken by writers only
+        self._clock = itertools.count()
+        self._size_bytes = 0
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.watchers = 0
+
+    @staticmethod
+    def _resolve(path: str | Path) -> str:
+        # Symlinks are deliberately not resolved: `stat()` follows them, so
+        # swapping a `current -> releases/N` link is seen as a changed file
+        return os.path.abspath(path)
+
+    def get(self, path: str | Path) -> object:
+        """
+        Get the value for a file, loading it if it is missing or, unless a
+        watcher is attached, stale.
+
+        Args:
+            path (str | Path): the path of the file whose value to get
+
+        Raises:
+            FileNotFoundError: if the file does not exist
+
+        Returns:
+            object: the cached or freshly loaded value
+        """
+        if self.watchers and (entry := self._entries.get(self._resolve(path))):
+            entry.last_used = next(self._clock)
+            self.hits += 1
+            return entry.value
+        return self.refresh(path)
+
+    def refresh(self, path: str | Path) -> object:
+        """
+        Get the value for a file, loading it if it is missing or stale, even
+        while a watcher is attached.
+
+        Args:
+            path (str | Path): the path of the file whose value to get
+
+        Raises:
+            FileNotFoundError: if the file does not exist
+
+        Returns:
+            object: the cached or freshly loaded value
+        """
+        key = self._resolve(path)
+        st = os.stat(key)
+        entry = self._entries.get(key)
+        if entry and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            entry.last_used = next(self._clock)
+            self.hits += 1
+            return entry.value
+        return self._load(key, st)
+
+    def peek(self, path: str | Path) -> object | None:
+        """
+        Get the value for a file only if it is cached and, unless a watcher is
+        attached, fresh, without ever loading it.
+
+        Args:
+            path (str | Path): the path of the file whose value to get
+
+        Raises:
+            FileNotFoundError: if the file does not exist
+
+        Returns:
+            object | None: the cached value, or `None` if it is missing or stale
+        """
+        key = self._resolve(path)
+        entry = self._entries.get(key)
+        if self.watchers and entry:
+            entry.last_used = next(self._clock)
+            self.hits += 1
+            return entry.value
+        st = os.stat(key)
+        if entry and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            entry.last_used = next(self._clock)
+            self.hits += 1
+            return entry.value
+        return None
+
+    def _load(self, key: str, st: os.stat_result) -> object:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+                self.hits += 1  # published by another thread since the read
+                return entry.value
+            if (pending := self._loading.get(key)) is not None:
+                owner = False
+            else:
+                pending = self._loading[key] = _PendingLoad()
+                owner = True
+                self.misses += 1
+        if not owner:
+            return pending.wait()
+
+        logger.debug("Cache miss for '%s', loading", key)
+        try:
+            value = self._loader(Path(key))
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            pending.error = e
+            pending.done.set()
+            raise
+
+        with self._lock:
+            entries = dict(self._entries)
+            size_bytes = self._size_bytes
+            if old := entries.pop(key, None):
+                size_bytes -= old.size
+            entries[key] = _CacheEntry(
+                st.st_mtime_ns, st.st_size, value, next(self._clock)
+            )
+            self._publish(entries, size_bytes + st.st_size)
+            del self._loading[key]
+        pending.value = value
+        pending.done.set()
+        return value
+
+    def _publish(self, entries: dict[str, _CacheEntry], size_bytes: int) -> None:
+        """
+        Evict from a new, not yet published dict of entries, then swap it in.
+        Must be called with the writer lock held.
+        """
+        # Always keep the most recently used entry, even if it alone is over budget
+        while len(entries) > 1 and (
+            len(entries) > self.max_entries or size_bytes > self.max_bytes
+        ):
+            key = min(entries, key=lambda k: entries[k].last_used)
+            size_bytes -= entries.pop(key).size
+            self.evictions += 1
+            logger.debug("Evicted '%s' from cache", key)
+        self._entries = entries
+        self._size_bytes = size_bytes
+
+    def configure(
+        self, max_entries: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        """
+        Change the cache's budget, evicting least recently used entries if needed.
+
+        Args:
+            max_entries (int | None, optional): new max number of entries
+            max_bytes (int | None, optional): new max summed file size
+        """
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._publish(dict(self._entries), self._size_bytes)
+
+    def attach_watcher(self) -> None:
+        """
+        Serve cached entries without checking if their files changed, until
+        the matching `detach_watcher()`. The watcher is then responsible for
+        calling `refresh()`, `pin()` or `invalidate()` for changed files.
+        """
+        with self._lock:
+            self.watchers += 1
+
+    def detach_watcher(self) -> None:
+        """
+        Undo an `attach_watcher()`. Once no watcher is attached, entries are
+        checked against their files again.
+        """
+        with self._lock:
+            self.watchers = max(0, self.watchers - 1)
+
+    def invalidate(self, path: str | Path) -> bool:
+        """
+        Drop the entry of a single file, if there is one.
+
+        Args:
+            path (str | Path): the path of the file whose entry to drop
+
+        Returns:
+            bool: `True` if an entry was dropped, `False` otherwise
+        """
+        key = self._resolve(path)
+        with self._lock:
+            if key not in self._entries:
+                return False
+            entries = dict(self._entries)
+            size_bytes = self._size_bytes - entries.pop(key).size
+            self._publish(entries, size_bytes)
+        logger.debug("Invalidated '%s'", key)
+        return True
+
+    def pin(self, path: str | Path) -> bool:
+        """
+        Keep serving a file's current entry as if it was loaded from the file
+        as it is now on disk, e.g. once the file changed into something that
+        fails to load. The file is only loaded again once it changes again.
+
+        Args:
+            path (str | Path): the path of the file whose entry to keep
+
+        Raises:
+            FileNotFoundError: if the file does not exist
+
+        Returns:
+            bool: `True` if an entry was pinned, `False` if there was none
+        """
+        key = self._resolve(path)
+        st = os.stat(key)
+        with self._lock:
+            if (old := self._entries.get(key)) is None:
+                return False
+            entries = dict(self._entries)
+            entries[key] = _CacheEntry(
+                st.st_mtime_ns, st.st_size, old.value, old.last_used
+            )
+            self._publish(entries, self._size_bytes - old.size + st.st_size)
+        logger.debug("Pinned '%s'", key)
+        return True
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the hit/miss/eviction counters.
+        """
+        with self._lock:
+            self._publish({}, 0)
+            self.hits = self.misses = self.evictions = 0
+        logger.debug("Cache cleared")
+
+    def stats(self) -> CacheStats:
+        """
+        Get the cache's current counters.
+
+        Returns:
+            CacheStats: hits, misses, evictions, entry count and summed size
+        """
+        with self._lock:
+            return CacheStats(
+                self.hits,
+                self.misses,
+                self.evictions,
+                len(self._entries),
+                self._size_bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: object) -> bool:
+        if not isinstance(path, (str, Path)):
+            return False
+        return self._resolve(path) in self._entries
+
+
+class MissCache:
+    """
+    A bounded record of lookups known to fail, such as unknown keys or
+    unsupported language codes that the same clients keep sending.
+
+    Each miss is recorded against the object it was observed on, e.g. a
+    catalog or a config snapshot, and only counts while that same object is
+    asked about. A reloaded catalog is a new object, so its misses are
+    forgotten without any explicit invalidation. Objects are only weakly
+    referenced, so recorded misses never keep an old catalog alive. Once
+    full, the oldest misses are dropped first.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_MISSES) -> None:
+        """
+        Args:
+            max_entries (int, optional): max number of misses kept. Defaults to 10,000.
+        """
+        self._entries: dict[Hashable, weakref.ref[object]] = {}
+        self._lock = threading.Lock()  # taken by writers only
+        self.max_entries = max_entries
+        self.hits = 0
+
+    def has(self, key: Hashable, owner: object) -> bool:
+        """
+        Check if a lookup was recorded as a miss on the given object.
+
+        Args:
+            key (Hashable): the lookup, e.g. a key path
+            owner (object): the object the lookup is made on
+
+        Returns:
+            bool: `True` if the lookup is known to miss on `owner`, `False` otherwise
+        """
+        if (ref := self._entries.get(key)) is not None and ref() is owner:
+            self.hits += 1
+            return True
+        return False
+
+    def add(self, key: Hashable, owner: object) -> None:
+        """
+        Record a lookup as a miss on the given object, dropping the oldest
+        misses if the cache is full.
+
+        Args:
+            key (Hashable): the lookup, e.g. a key path
+            owner (object): the object the lookup missed on, which must be weakly referenceable
+        """
+        ref = weakref.ref(owner)
+        with self._lock:
+            entries = self._entries
+            _ = entries.pop(key, None)
+            while entries and len(entries) >= self.max_entries:
+                del entries[next(iter(entries))]
+            entries[key] = ref
+
+    def clear(self) -> None:
+        """
+        Forget every recorded miss and reset the hit counter.
+        """
+        with self._lock:
+            self._entries = {}
+            self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
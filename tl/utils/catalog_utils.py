@@ -0,0 +1,389 @@
+import logging
+from collections.abc import Iterator, Mapping, Sequence
+from sys import intern
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tl.utils.compile_utils import BinaryCatalog
+
+logger = logging.getLogger(__name__)
+
+KEY_SEPARATOR: str = "."
+
+WILDCARD: str = "*"
+
+# The last segment of a key path matching every value below a table, recursively
+DEEP_WILDCARD: str = "**"
+
+# Returned by non-raising lookups for keys that do not exist
+_MISSING: object = object()
+
+
+def _unwrap(value: object) -> object:
+    """
+    Convert tomlkit containers/items (or any nested mappings and lists) into
+    plain `dict`, `list` and `str` objects. Keys and strings are interned, so
+    equal strings (e.g. the same key names in every table, or untranslated
+    values) are a single object across every catalog of the process.
+    """
+    if isinstance(value, Mapping):
+        return {intern(str(k)): _unwrap(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_unwrap(v) for v in value]
+    if isinstance(value, str):
+        return intern(str(value))
+    if unwrap := getattr(value, "unwrap", None):
+        return unwrap()
+    return value
+
+
+def _merge_trees(
+    primary: dict[str, object], fallback: dict[str, object]
+) -> dict[str, object]:
+    """
+    Overlay one plain tree on another. Only tables present in both are copied;
+    every other value and table is shared with the tree it came from.
+    """
+    merged = dict(primary)
+    for key, value in fallback.items():
+        if key not in merged:
+            merged[key] = value
+        elif isinstance(own := merged[key], dict) and isinstance(value, dict):
+            merged[key] = _merge_trees(own, value)  # type: ignore[arg-type]
+    return merged
+
+
+def _iter_items(
+    prefix: str, table: dict[str, object], recursive: bool
+) -> Iterator[tuple[str, object]]:
+    """
+    Intended for internal use. Walk a plain table, yielding its direct children
+    or, recursively, every value below it but not the tables in between.
+    """
+    for key, value in table.items():
+        path = f"{prefix}{KEY_SEPARATOR}{key}" if prefix else key
+        if not recursive:
+            yield path, value
+        elif isinstance(value, dict):
+            yield from _iter_items(path, value, True)  # type: ignore[arg-type]
+        else:
+            yield path, value
+
+
+def _iter_values(table: dict[str, object]) -> Iterator[object]:
+    """
+    Intended for internal use. `_iter_items()` recursively, without building
+    the key paths.
+    """
+    for value in table.values():
+        if isinstance(value, dict):
+            yield from _iter_values(value)  # type: ignore[arg-type]
+        else:
+            yield value
+
+
+class Catalog:
+    """
+    A language (or config) TOML dict compiled into flat lookup indexes.
+
+    Every table and value is indexed by its dotted key path, so an exact key
+    lookup such as `"start.welcome"` is a single dict hit, and a wildcard lookup
+    such as `"start.*"` is answered from the indexed table's values instead of
+    walking the tree. Lookups return the same plain values `glom` would return
+    for the same key path, except `"start.**"`, which returns every value below
+    the table without the tables in between. Since the index leads straight to
+    a table, the nested tree is the prefix trie: wildcard lookups and `keys()`
+    only ever visit the part of the tree they return.
+
+    Catalogs are kept lean for processes with many resident languages: they
+    hold plain `dict`/`list`/`str` objects only, never tomlkit items, and
+    every key, key path and string is interned, so the key paths shared by
+    all languages and any equal strings are stored once per process. The
+    index shares its values and tables with the tree.
+
+    Attributes:
+        tree (dict[str, object]): the catalog as plain nested dicts
+        index (dict[str, object]): dotted key path to value, for every table and value
+    """
+
+    __slots__ = ("tree", "index", "__weakref__")
+
+    def __init__(self, toml_dict: Mapping[str, object]) -> None:
+        """
+        Args:
+            toml_dict (Mapping[str, object]): the TOML-like dict to compile
+        """
+        self.tree: dict[str, object] = _unwrap(toml_dict)  # type: ignore[assignment]
+        self.index: dict[str, object] = {}
+        self._add_table("", self.tree)
+        logger.debug("Compiled catalog with %d key paths", len(self.index))
+
+    def _add_table(self, prefix: str, table: dict[str, object]) -> None:
+        index = self.index
+        for key, value in table.items():
+            # Interned so every language's catalog shares its key paths
+            path = intern(f"{prefix}{KEY_SEPARATOR}{key}") if prefix else key
+            index[path] = value
+            if isinstance(value, dict):
+                self._add_table(path, value)  # type: ignore[arg-type]
+
+    def __contains__(self, key_path: object) -> bool:
+        return key_path in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def items(
+        self, prefix: str = "", recursive: bool = True
+    ) -> Iterator[tuple[str, object]]:
+        """
+        Lazily yield the dotted key path and value of every value below a
+        table, in document order, like `"prefix.**"`. Not recursively, yield
+        the table's direct children instead, tables included, like
+        `"prefix.*"`. Nothing is yielded if the prefix is not a table.
+
+        Args:
+            prefix (str, optional): the dotted path of the table. Defaults to the root.
+            recursive (bool, optional): descend into nested tables. Defaults to True.
+
+        Returns:
+            Iterator[tuple[str, object]]: the key path and value of each key
+        """
+        table = self.index.get(prefix) if prefix else self.tree
+        if isinstance(table, dict):
+            yield from _iter_items(prefix, table, recursive)  # type: ignore[arg-type]
+
+    def keys(self, prefix: str = "", recursive: bool = True) -> Iterator[str]:
+        """
+        Lazily yield the dotted key paths of `items()`.
+
+        Args:
+            prefix (str, optional): the dotted path of the table. Defaults to the root.
+            recursive (bool, optional): descend into nested tables. Defaults to True.
+
+        Returns:
+            Iterator[str]: the key path of each key, e.g. "start.welcome"
+        """
+        return (path for path, _ in self.items(prefix, recursive))
+
+    def lookup(self, key_path: str) -> object:
+        """
+        Get the value at a dotted key path. Supports `*` globbing, and `**` as
+        the last segment for every value below a table.
+
+        Args:
+            key_path (str): the dotted path of the key, e.g. "start.welcome" or "start.*"
+
+        Raises:
+            KeyError: if the key path does not exist in the catalog
+
+        Returns:
+            object: the value at the key path, or a list of values for wildcards
+        """
+        try:
+            return self.index[key_path]
+        except KeyError:
+            if (value := self.get(key_path, _MISSING)) is _MISSING:
+                raise KeyError(
+                    f"Key '{key_path}' does not exist in TOML file"
+                ) from None
+            return value
+
+    def get(self, key_path: str, default: object = None) -> object:
+        """
+        Get the value at a dotted key path like `lookup()`, but return a default
+        instead of raising if it does not exist. Misses never create exceptions,
+        except inside glom for patterns such as "*.welcome".
+
+        Args:
+            key_path (str): the dotted path of the key, e.g. "start.welcome" or "start.*"
+            default (object, optional): the value for missing keys. Defaults to None.
+
+        Returns:
+            object: the value at the key path, a list of values for wildcards, or `default`
+        """
+        if (value := self.index.get(key_path, _MISSING)) is not _MISSING:
+            return value
+        if WILDCARD not in key_path:
+            return default
+
+        prefix, _, last = key_path.rpartition(KEY_SEPARATOR)
+        if last in (WILDCARD, DEEP_WILDCARD) and WILDCARD not in prefix:
+            value = self.index.get(prefix, _MISSING) if prefix else self.tree
+            if value is _MISSING:
+                return default
+            if isinstance(value, dict):
+                if last == DEEP_WILDCARD:
+                    return list(_iter_values(value))  # type: ignore[arg-type]
+                return list(value.values())
+            return list(value) if isinstance(value, list) else []
+
+        return self._glob(key_path, default)
+
+    def _glob(self, key_path: str, default: object) -> object:
+        """
+        Intended for internal use. Resolve wildcard patterns the prefix index
+        cannot answer (such as "*.welcome") by walking the tree with glom.
+        """
+        # glom is slow to import and only needed for these rarer patterns
+        from glom import glom  # type: ignore
+        from glom.core import PathAccessError  # type: ignore
+
+        try:
+            return glom(self.tree, key_path)
+        except PathAccessError:
+            return default
+
+
+class ChainedCatalog:
+    """
+    A language's catalog layered over the catalogs of its fallbacks, with the
+    same lookup interface as `Catalog`. Each key comes from the first catalog
+    that has it, and tables present in several catalogs are overlaid.
+
+    Nothing is copied or decoded up front: an exact key is looked up in each
+    catalog in turn, so values are the parents' own objects, and a
+    `BinaryCatalog` in the chain stays a lazy view of its mapping. Only
+    tables, e.g. for `"start.*"`, are overlaid on demand, for the part of
+    the tree they cover. Never keep the result of `tree`, it is rebuilt on
+    every access.
+
+    Attributes:
+        catalogs (tuple[Catalog | BinaryCatalog, ...]): the catalogs, by priority
+    """
+
+    __slots__ = ("catalogs", "__weakref__")
+
+    def __init__(self, catalogs: "Sequence[Catalog | BinaryCatalog]") -> None:
+        """
+        Args:
+            catalogs (Sequence[Catalog | BinaryCatalog]): a language's catalog, then its
+                fallbacks' catalogs
+        """
+        self.catalogs: tuple[Catalog | BinaryCatalog, ...] = tuple(catalogs)
+
+    def _table(self, prefix: str) -> object:
+        """
+        Intended for internal use. The value at a key path with the tables of
+        every catalog overlaid, or `_MISSING`.
+        """
+        values = [
+            catalog.get(prefix, _MISSING) if prefix else _root(catalog)
+            for catalog in self.catalogs
+        ]
+        found = [value for value in values if value is not _MISSING]
+        if not found or not isinstance(found[0], dict):
+            return found[0] if found else _MISSING
+        tables: list[dict[str, object]] = [
+            value for value in found if isinstance(value, dict)
+        ]
+        merged = tables[-1]
+        for table in reversed(tables[:-1]):
+            merged = _merge_trees(table, merged)
+        return merged
+
+    @property
+    def tree(self) -> dict[str, object]:
+        """
+        Every catalog overlaid into plain nested dicts, built on each access.
+        """
+        return self._table("")  # type: ignore[return-value]
+
+    def __contains__(self, key_path: object) -> bool:
+        return any(key_path in catalog for catalog in self.catalogs)
+
+    def items(
+        self, prefix: str = "", recursive: bool = True
+    ) -> Iterator[tuple[str, object]]:
+        """
+        Lazily yield the dotted key path and value of every value below a
+        table, like `Catalog.items()`, including the keys only the fallbacks
+        have.
+
+        Args:
+            prefix (str, optional): the dotted path of the table. Defaults to the root.
+            recursive (bool, optional): descend into nested tables. Defaults to True.
+
+        Returns:
+            Iterator[tuple[str, object]]: the key path and value of each key
+        """
+        table = self._table(prefix)
+        if isinstance(table, dict):
+            yield from _iter_items(prefix, table, recursive)  # type: ignore[arg-type]
+
+    def keys(self, prefix: str = "", recursive: bool = True) -> Iterator[str]:
+        """
+        Lazily yield the dotted key paths of `items()`.
+
+        Args:
+            prefix (str, optional): the dotted path of the table. Defaults to the root.
+            recursive (bool, optional): descend into nested tables. Defaults to True.
+
+        Returns:
+            Iterator[str]: the key path of each key, e.g. "start.welcome"
+        """
+        return (path for path, _ in self.items(prefix, recursive))
+
+    def lookup(self, key_path: str) -> object:
+        """
+        Get the value at a dotted key path. Supports `*` globbing, and `**` as
+        the last segment for every value below a table.
+
+        Args:
+            key_path (str): the dotted path of the key, e.g. "start.welcome" or "start.*"
+
+        Raises:
+            KeyError: if the key path does not exist in any of the catalogs
+
+        Returns:
+            object: the value at the key path, or a list of values for wildcards
+        """
+        if (value := self.get(key_path, _MISSING)) is _MISSING:
+            raise KeyError(f"Key '{key_path}' does not exist in TOML file")
+        return value
+
+    def get(self, key_path: str, default: object = None) -> object:
+        """
+        Get the value at a dotted key path like `lookup()`, but return a default
+        instead of raising if it does not exist.
+
+        Args:
+            key_path (str): the dotted path of the key, e.g. "start.welcome" or "start.*"
+            default (object, optional): the value for missing keys. Defaults to None.
+
+        Returns:
+            object: the value at the key path, a list of values for wildcards, or `default`
+        """
+        if WILDCARD not in key_path:
+            for catalog in self.catalogs:
+                if (value := catalog.get(key_path, _MISSING)) is not _MISSING:
+                    # Only a table needs the fallbacks' tables overlaid on it
+                    return self._table(key_path) if isinstance(value, dict) else value
+            return default
+
+        prefix, _, last = key_path.rpartition(KEY_SEPARATOR)
+        if last in (WILDCARD, DEEP_WILDCARD) and WILDCARD not in prefix:
+            if (value := self._table(prefix)) is _MISSING:
+                return default
+            if isinstance(value, dict):
+                if last == DEEP_WILDCARD:
+                    return list(_iter_values(value))  # type: ignore[arg-type]
+                return list(value.values())
+            return list(value) if isinstance(value, list) else []
+
+        # glom is slow to import and only needed for these rarer patterns
+        from glom import glom  # type: ignore
+        from glom.core import PathAccessError  # type: ignore
+
+        try:
+            return glom(self.tree, key_path)
+        except PathAccessError:
+            return default
+
+
+def _root(catalog: "Catalog | BinaryCatalog") -> dict[str, object]:
+    """
+    Intended for internal use. A catalog's whole tree, without making a
+    `BinaryCatalog` keep a decoded copy of it.
+    """
+    return catalog.tree if isinstance(catalog, Catalog) else catalog.to_dict()
@@ -0,0 +1,243 @@
+import logging
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from string import Formatter
+
+from tl.utils.catalog_utils import KEY_SEPARATOR
+from tl.utils.config_utils import get_all_language_codes, get_config_snapshot
+from tl.utils.toml_utils import parse_toml_file
+
+logger = logging.getLogger(__name__)
+
+# The placeholder names of each of the fallback language's keys, or None for
+# keys whose values are not strings. Set once in each worker process.
+_reference: Mapping[str, frozenset[str] | None] = {}
+
+
+@dataclass(slots=True)
+class LanguageReport:
+    """
+    The problems found in one language file, compared to the fallback language.
+
+    Attributes:
+        code (str): the language code
+        file (str): the path of the language file
+        missing (list[str]): keys of the fallback language that neither the file nor
+            the languages it inherits from (e.g. "de" for "de-at") have
+        extra (list[str]): keys the fallback language does not have
+        placeholders (list[dict[str, object]]): keys whose placeholders differ from the
+            fallback's, as `{"key", "expected", "found"}`
+        errors (list[str]): problems that prevent or limit the comparison, e.g. a missing
+            file, invalid TOML or malformed placeholders
+    """
+
+    code: str
+    file: str
+    missing: list[str] = field(default_factory=list)
+    extra: list[str] = field(default_factory=list)
+    placeholders: list[dict[str, object]] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.extra or self.placeholders or self.errors)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "code": self.code,
+            "file": self.file,
+            "ok": self.ok,
+            "missing": self.missing,
+            "extra": self.extra,
+            "placeholders": self.placeholders,
+            "errors": self.errors,
+        }
+
+
+@dataclass(slots=True)
+class CheckReport:
+    """
+    The result of checking every language file against the fallback language.
+
+    Attributes:
+        fallback_code (str): the code of the fallback language used as the reference
+        languages (list[LanguageReport]): one report per checked language, the
+            fallback language first
+    """
+
+    fallback_code: str
+    languages: list[LanguageReport]
+
+    @property
+    def ok(self) -> bool:
+        return all(report.ok for report in self.languages)
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Returns:
+            dict[str, object]: the report as JSON-serializable data
+        """
+        return {
+            "fallback": self.fallback_code,
+            "ok": self.ok,
+            "languages": [report.to_dict() for report in self.languages],
+        }
+
+
+def _iter_leaves(
+    table: dict[str, object], prefix: str = ""
+) -> Iterator[tuple[str, object]]:
+    for key, value in table.items():
+        path = f"{prefix}{KEY_SEPARATOR}{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from _iter_leaves(value, path)  # type: ignore[arg-type]
+        else:
+            yield path, value
+
+
+_NO_FIELDS: frozenset[str] = frozenset()
+
+
+def _field_names(value: str, parse: Formatter = Formatter()) -> frozenset[str]:
+    """
+    Intended for internal use. The arg names `Template(value)` would require,
+    without building the template.
+    """
+    if "{" not in value and "}" not in value:
+        return _NO_FIELDS
+    return frozenset(
+        name.partition(".")[0].partition("[")[0]
+        for _, name, _, _ in parse.parse(value)
+        if name is not None
+    )
+
+
+def _collect_placeholders(
+    toml_dict: dict[str, object], report: LanguageReport
+) -> dict[str, frozenset[str] | None]:
+    """
+    Intended for internal use. Map every leaf key of a language file to the
+    names of its placeholders, recording malformed placeholders as errors.
+    """
+    placeholders: dict[str, frozenset[str] | None] = {}
+    for key_path, value in _iter_leaves(toml_dict):
+        if not isinstance(value, str):
+            placeholders[key_path] = None
+            continue
+        try:
+            placeholders[key_path] = _field_names(value)
+        except ValueError as e:
+            report.errors.append(f"malformed placeholders in '{key_path}': {e}")
+            placeholders[key_path] = _NO_FIELDS
+    return placeholders
+
+
+def _load(report: LanguageReport) -> dict[str, frozenset[str] | None] | None:
+    try:
+        return _collect_placeholders(parse_toml_file(Path(report.file)), report)
+    except FileNotFoundError:
+        report.errors.append("file not found")
+    except ValueError as e:  # tomllib.TOMLDecodeError
+        report.errors.append(f"invalid TOML: {e}")
+    return None
+
+
+def _init_worker(reference: Mapping[str, frozenset[str] | None]) -> None:
+    global _reference
+    _reference = reference
+
+
+def _check_language(
+    code: str, file: str, inherited: tuple[tuple[str, str], ...] = ()
+) -> LanguageReport:
+    """
+    Intended for internal use. Compare one language file to `_reference`, in
+    a worker process. Keys of the `(code, file)` languages it inherits from
+    before the fallback language do not count as missing.
+    """
+    report = LanguageReport(code, file)
+    if (found := _load(report)) is None:
+        return report
+    resolved = set(found)
+    for parent_code, parent_file in inherited:
+        if (parent := _load(LanguageReport(parent_code, parent_file))) is None:
+            report.errors.append(f"could not load '{parent_code}' it inherits from")
+        else:
+            resolved.update(parent)
+    reference = _reference
+    report.missing = [key for key in reference if key not in resolved]
+    report.extra = [key for key in found if key not in reference]
+    for key, names in found.items():
+        if key in reference and (expected := reference[key]) != names:
+            report.placeholders.append(
+                {
+                    "key": key,
+                    "expected": None if expected is None else sorted(expected),
+                    "found": None if names is None else sorted(names),
+                }
+            )
+    return report
+
+
+def check_languages(
+    language_codes: Iterable[str] | None = None, workers: int | None = None
+) -> CheckReport:
+    """
+    Check language files against the fallback language for missing keys,
+    extra keys and placeholders that differ (e.g. "{name}" vs "{nom}"). The
+    fallback language is parsed once, then the other files are parsed and
+    compared in parallel worker processes. Keys a language inherits through
+    its fallback chain (e.g. "de-at" from "de") are not reported as missing.
+
+    Args:
+        language_codes (Iterable[str] | None, optional): the codes to check. Defaults to
+            every language in the config file.
+        workers (int | None, optional): max worker processes. Defaults to the CPU count.
+
+    Returns:
+        CheckReport: a report per language, the fallback language first
+    """
+    snapshot = get_config_snapshot()
+    fallback_code = snapshot.fallback_code
+    if language_codes is None:
+        language_codes = get_all_language_codes()
+
+    reports = [LanguageReport(fallback_code, str(snapshot.file_paths[fallback_code]))]
+    reference = _load(reports[0])
+    if reference is None:
+        logger.error("Could not load the fallback language '%s'", fallback_code)
+
+    codes: list[str] = []
+    unchecked: list[LanguageReport] = []
+    for code in dict.fromkeys(language_codes):
+        if code == fallback_code:
+            continue
+        if code not in snapshot.codes:
+            unchecked.append(LanguageReport(code, ""))
+            unchecked[-1].errors.append("not a language in the config file")
+        elif reference is None:
+            unchecked.append(LanguageReport(code, str(snapshot.file_paths[code])))
+            unchecked[-1].errors.append("the fallback language could not be loaded")
+        else:
+            codes.append(code)
+
+    if codes and reference is not None:
+        files = [str(snapshot.file_paths[code]) for code in codes]
+        inherited = [
+            tuple(
+                (parent, str(snapshot.file_paths[parent]))
+                for parent in snapshot.chain_for(code)[1:]
+                if parent != fallback_code
+            )
+            for code in codes
+        ]
+        workers = min(workers or os.cpu_count() or 1, len(codes))
+        logger.info("Checking %d languages with %d workers", len(codes), workers)
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(reference,)
+        ) as pool:
+            reports.extend(pool.map(_check_language, codes, files, inherited))
+    return CheckReport(fallback_code, reports + unchecked)
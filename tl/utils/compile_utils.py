@@ -0,0 +1,455 @@
+import json
+import logging
+import mmap
+import os
+import stat
+import struct
+import tempfile
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import cast
+
+from tl.utils.catalog_utils import (
+    DEEP_WILDCARD,
+    KEY_SEPARATOR,
+    WILDCARD,
+    _MISSING,
+    _iter_items,
+)
+
+logger = logging.getLogger(__name__)
+
+COMPILED_SUFFIX: str = ".tlc"
+
+MAGIC: bytes = b"TLC\x00"
+
+VERSION: int = 1
+
+# magic, version, source st_mtime_ns, source st_size, entry count,
+# key blob length, value blob length
+_HEADER = struct.Struct("<4sIqQIII")
+
+# key offset, key length, value offset, value length, value kind
+_ENTRY = struct.Struct("<IIIIB3x")
+
+_SORTED_INDEX = struct.Struct("<I")
+
+_KIND_STR = 0
+_KIND_JSON = 1
+_KIND_TABLE = 2
+
+
+def get_compiled_path(toml_file_path: str | Path) -> Path:
+    """
+    Get the path of the binary catalog compiled from a TOML file.
+
+    Args:
+        toml_file_path (str | Path): the path of the source TOML file
+
+    Returns:
+        Path: the source path with its suffix replaced by `.tlc`
+    """
+    return Path(toml_file_path).with_suffix(COMPILED_SUFFIX)
+
+
+def _flatten(
+    table: Mapping[str, object], prefix: str = ""
+) -> Iterator[tuple[str, int, bytes]]:
+    for key, value in table.items():
+        path = f"{prefix}{KEY_SEPARATOR}{key}" if prefix else key
+        if isinstance(value, Mapping):
+            if value:
+                yield from _flatten(value, path)  # type: ignore[arg-type]
+            else:
+                yield path, _KIND_TABLE, b""
+        elif isinstance(value, str):
+            yield path, _KIND_STR, value.encode()
+        else:
+            yield path, _KIND_JSON, json.dumps(value, default=str).encode()
+
+
+def _pack(
+    toml_dict: Mapping[str, object], mtime_ns: int = 0, size: int = 0
+) -> tuple[int, list[bytes]]:
+    """
+    Intended for internal use. Lay a parsed TOML file out as the parts of a
+    binary catalog, in file order. Returns the number of entries and the parts.
+    """
+    entries = list(_flatten(toml_dict))
+    keys = [path.encode() for path, _, _ in entries]
+
+    key_blob = bytearray()
+    value_blob = bytearray()
+    entry_table = bytearray()
+    for key, (_, kind, value) in zip(keys, entries):
+        entry_table += _ENTRY.pack(
+            len(key_blob), len(key), len(value_blob), len(value), kind
+        )
+        key_blob += key
+        value_blob += value
+    sorted_index = b"".join(
+        _SORTED_INDEX.pack(i) for i in sorted(range(len(keys)), key=keys.__getitem__)
+    )
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        mtime_ns,
+        size,
+        len(entries),
+        len(key_blob),
+        len(value_blob),
+    )
+    return len(entries), [
+        header,
+        bytes(entry_table),
+        sorted_index,
+        bytes(key_blob),
+        bytes(value_blob),
+    ]
+
+
+def write_compiled_catalog(
+    toml_dict: Mapping[str, object],
+    toml_file_path: str | Path,
+    st: os.stat_result | None = None,
+) -> Path:
+    """
+    Compile a parsed TOML file into a binary catalog next to it. The catalog
+    records the source file's mtime and size so a stale catalog is ignored.
+
+    The layout is a fixed header, an entry table in document order, an index
+    of entry numbers sorted by key, then a UTF-8 key blob and value blob.
+    Non-string values are stored as JSON.
+
+    Args:
+        toml_dict (Mapping[str, object]): the parsed contents of the TOML file
+        toml_file_path (str | Path): the path the TOML file was parsed from
+        st (os.stat_result | None, optional): the TOML file's stat, taken before it
+            was parsed. Defaults to stat'ing it now.
+
+    Returns:
+        Path: the path of the written binary catalog
+    """
+    if st is None:
+        st = os.stat(toml_file_path)
+    count, parts = _pack(toml_dict, st.st_mtime_ns, st.st_size)
+
+    compiled_path = get_compiled_path(toml_file_path)
+    fd, tmp_path = tempfile.mkstemp(dir=compiled_path.parent, suffix=COMPILED_SUFFIX)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for part in parts:
+                _ = f.write(part)
+        # mkstemp creates the file for its owner only, but workers may run as
+        # other users than whoever compiled it
+        os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
+        # Replace rather than truncate, so processes that still map the old file
+        # keep reading a consistent catalog
+        os.replace(tmp_path, compiled_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    logger.debug("Compiled %d keys into '%s'", count, compiled_path)
+    return compiled_path
+
+
+def share_compiled_catalog(toml_dict: Mapping[str, object]) -> "BinaryCatalog":
+    """
+    Compile a parsed TOML dict into a binary catalog held in anonymous shared
+    memory instead of a file. Processes forked after this call map the same
+    physical pages, and since lookups only read the buffer and decode the
+    strings they return, those pages are never copied into a worker.
+
+    Args:
+        toml_dict (Mapping[str, object]): the TOML-like dict to compile
+
+    Returns:
+        BinaryCatalog: a catalog over the shared buffer
+    """
+    count, parts = _pack(toml_dict)
+    # An anonymous mapping is MAP_SHARED, so it is not copied on fork
+    mm = mmap.mmap(-1, max(sum(map(len, parts)), 1))
+    for part in parts:
+        _ = mm.write(part)
+    logger.debug("Compiled %d keys into %d bytes of shared memory", count, mm.tell())
+    return BinaryCatalog(None, mm)
+
+
+class BinaryCatalog:
+    """
+    A read-only, mmap-backed view of a compiled binary catalog with the same
+    lookup interface as `Catalog`. Keys are found by binary search over the
+    sorted index and strings are only decoded when they are looked up.
+
+    The mapping is either a compiled file or, from `share_compiled_catalog()`,
+    anonymous shared memory with no path.
+    """
+
+    __slots__ = (
+        "path",
+        "_mm",
+        "_count",
+        "_entries_offset",
+        "_sorted_offset",
+        "_keys_offset",
+        "_values_offset",
+        "_tree",
+        "__weakref__",
+    )
+
+    def __init__(self, path: Path | None, mm: mmap.mmap) -> None:
+        """
+        Args:
+            path (Path | None): the path of the compiled catalog, or None if in memory
+            mm (mmap.mmap): the read-only mapping of the compiled catalog
+        """
+        _, _, _, _, count, key_blob_len, _ = _HEADER.unpack_from(mm)
+        self.path = path
+        self._mm = mm
+        self._count: int = count
+        self._entries_offset = _HEADER.size
+        self._sorted_offset = self._entries_offset + count * _ENTRY.size
+        self._keys_offset = self._sorted_offset + count * _SORTED_INDEX.size
+        self._values_offset = self._keys_offset + key_blob_len
+        self._tree: dict[str, object] | None = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the mapped catalog in bytes.
+        """
+        return len(self._mm)
+
+    def __contains__(self, key_path: object) -> bool:
+        if not isinstance(key_path, str):
+            return False
+        return self._find(key_path.encode()) is not None or bool(
+            self._prefix_range(key_path)
+        )
+
+    def _entry(self, i: int) -> tuple[int, int, int, int, int]:
+        return _ENTRY.unpack_from(self._mm, self._entries_offset + i * _ENTRY.size)
+
+    def _key(self, i: int) -> bytes:
+        key_offset, key_len, _, _, _ = self._entry(i)
+        start = self._keys_offset + key_offset
+        return self._mm[start : start + key_len]
+
+    def _sorted(self, position: int) -> int:
+        return _SORTED_INDEX.unpack_from(
+            self._mm, self._sorted_offset + position * _SORTED_INDEX.size
+        )[0]
+
+    def _bisect(self, key: bytes) -> int:
+        return bisect_left(
+            range(self._count), key, key=lambda p: self._key(self._sorted(p))
+        )
+
+    def _find(self, key: bytes) -> int | None:
+        position = self._bisect(key)
+        if position < self._count and self._key(i := self._sorted(position)) == key:
+            return i
+        return None
+
+    def _value(self, i: int) -> object:
+        _, _, value_offset, value_len, kind = self._entry(i)
+        start = self._values_offset + value_offset
+        if kind == _KIND_TABLE:
+            return {}
+        raw = self._mm[start : start + value_len]
+        return raw.decode() if kind == _KIND_STR else json.loads(raw)
+
+    def _prefix_range(self, prefix: str) -> Sequence[int]:
+        """
+        Entry numbers, in document order, of every key under a table path.
+        """
+        if not prefix:
+            return range(self._count)
+        low = self._bisect(f"{prefix}{KEY_SEPARATOR}".encode())
+        # "/" is the byte right after "." so it bounds every "prefix." key
+        high = self._bisect(f"{prefix}/".encode())
+        return sorted(self._sorted(p) for p in range(low, high))
+
+    def _table(self, prefix: str, entries: Iterable[int]) -> dict[str, object]:
+        skip = len(prefix) + 1 if prefix else 0
+        table: dict[str, object] = {}
+        for i in entries:
+            *parents, last = self._key(i).decode()[skip:].split(KEY_SEPARATOR)
+            node = table
+            for parent in parents:
+                # Entries come in document order, so a table always precedes its keys
+                node = cast(dict[str, object], node.setdefault(parent, {}))
+            node[last] = self._value(i)
+        return table
+
+    @property
+    def tree(self) -> dict[str, object]:
+        """
+        The whole catalog decoded into plain nested dicts, on first access, and
+        kept for the life of the catalog.
+        """
+        if self._tree is None:
+            self._tree = self.to_dict()
+        return self._tree
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Decode the whole catalog into fresh plain nested dicts, without keeping
+        them like `tree` does.
+
+        Returns:
+            dict[str, object]: the catalog as plain nested dicts
+        """
+        return self._table("", self._prefix_range(""))
+
+    def _leaves(self, entries: Iterable[int]) -> Iterator[tuple[int, str]]:
+        for i in entries:
+            key_offset, key_len, _, _, kind = self._entry(i)
+            if kind != _KIND_TABLE:
+                start = self._keys_offset + key_offset
+                yield i, self._mm[start : start + key_len].decode()
+
+    def items(
+        self, prefix: str = "", recursive: bool = True
+    ) -> Iterator[tuple[str, object]]:
+        """
+        Lazily yield the dotted key path and value of every value below a
+        table, like `Catalog.items()`. Recursively, the keys are found by
+        binary search and only they are decoded.
+
+        Args:
+            prefix (str, optional): the dotted path of the table. Defaults to the root.
+            recursive (bool, optional): descend into nested tables. Defaults to True.
+
+        Returns:
+            Iterator[tuple[str, object]]: the key path and value of each key
+        """
+        entries = self._prefix_range(prefix)
+        if recursive:
+            for i, key in self._leaves(entries):
+                yield key, self._value(i)
+        elif entries:
+            table = self._table(prefix, entries) if prefix else self.tree
+            yield from _iter_items(prefix, table, False)
+
+    def keys(self, prefix: str = "", recursive: bool = True) -> Iterator[str]:
+        """
+        Lazily yield the dotted key paths of `items()`. Recursively, values are
+        not decoded.
+
+        Args:
+            prefix (str, optional): the dotted path of the table. Defaults to the root.
+            recursive (bool, optional): descend into nested tables. Defaults to True.
+
+        Returns:
+            Iterator[str]: the key path of each key, e.g. "start.welcome"
+        """
+        if recursive:
+            return (key for _, key in self._leaves(self._prefix_range(prefix)))
+        return (path for path, _ in self.items(prefix, False))
+
+    def lookup(self, key_path: str) -> object:
+        """
+        Get the value at a dotted key path. Supports `*` globbing, and `**` as
+        the last segment for every value below a table.
+
+        Args:
+            key_path (str): the dotted path of the key, e.g. "start.welcome" or "start.*"
+
+        Raises:
+            KeyError: if the key path does not exist in the catalog
+
+        Returns:
+            object: the value at the key path, or a list of values for wildcards
+        """
+        if (value := self.get(key_path, _MISSING)) is _MISSING:
+            raise KeyError(f"Key '{key_path}' does not exist in TOML file")
+        return value
+
+    def get(self, key_path: str, default: object = None) -> object:
+        """
+        Get the value at a dotted key path like `lookup()`, but return a default
+        instead of raising if it does not exist.
+
+        Args:
+            key_path (str): the dotted path of the key, e.g. "start.welcome" or "start.*"
+            default (object, optional): the value for missing keys. Defaults to None.
+
+        Returns:
+            object: the value at the key path, a list of values for wildcards, or `default`
+        """
+        if WILDCARD not in key_path:
+            if (i := self._find(key_path.encode())) is not None:
+                return self._value(i)
+            if entries := self._prefix_range(key_path):
+                return self._table(key_path, entries)
+            return default
+
+        prefix, _, last = key_path.rpartition(KEY_SEPARATOR)
+        if last == DEEP_WILDCARD and WILDCARD not in prefix:
+            if (entries := self._prefix_range(prefix)) or not prefix:
+                return [self._value(i) for i, _ in self._leaves(entries)]
+            if (i := self._find(prefix.encode())) is None:
+                return default
+            value = self._value(i)
+            return list(value) if isinstance(value, list) else []
+        if last == WILDCARD and WILDCARD not in prefix:
+            value = self.get(prefix, _MISSING) if prefix else self.tree
+            if value is _MISSING:
+                return default
+            if isinstance(value, dict):
+                return list(value.values())
+            return list(value) if isinstance(value, list) else []
+
+        # glom is slow to import and only needed for these rarer patterns
+        from glom import glom  # type: ignore
+        from glom.core import PathAccessError  # type: ignore
+
+        try:
+            return glom(self.tree, key_path)
+        except PathAccessError:
+            return default
+
+
+def open_compiled_catalog(toml_file_path: str | Path) -> BinaryCatalog | None:
+    """
+    Open the binary catalog compiled from a TOML file, if it is up to date.
+
+    Args:
+        toml_file_path (str | Path): the path of the source TOML file
+
+    Returns:
+        BinaryCatalog | None: the mapped catalog, or None if it is missing, stale or invalid
+    """
+    compiled_path = get_compiled_path(toml_file_path)
+    try:
+        st = os.stat(toml_file_path)
+        with open(compiled_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        # e.g. unreadable by this user, or empty. The TOML source still works.
+        logger.warning("Ignoring compiled catalog '%s': %s", compiled_path, e)
+        return None
+
+    if len(mm) < _HEADER.size:
+        logger.warning("Ignoring truncated compiled catalog '%s'", compiled_path)
+        mm.close()
+        return None
+    magic, version, mtime_ns, size, _, _, _ = _HEADER.unpack_from(mm)
+    if magic != MAGIC or version != VERSION:
+        logger.warning("Ignoring incompatible compiled catalog '%s'", compiled_path)
+        mm.close()
+        return None
+    if (mtime_ns, size) != (st.st_mtime_ns, st.st_size):
+        logger.info("Ignoring stale compiled catalog '%s'", compiled_path)
+        mm.close()
+        return None
+
+    logger.debug("Opened compiled catalog '%s'", compiled_path)
+    return BinaryCatalog(compiled_path, mm)
@@ -1,16 +1,72 @@
 # mypy: ignore-errors
 
 import logging
+import os
+import threading
+from collections.abc import Container, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
-from tl.utils.path_utils import get_project_root
-from tl.utils.toml_utils import get_value_from_key
+from tl.utils.path_utils import ROOT_ENV, _find_project_root
+from tl.utils.toml_utils import _get_value_from_key, _serialize_toml_dict
 
 logger = logging.getLogger(__name__)
 
+CONFIG_ENV: str = "TL_CONFIG"
+
+CONFIG_FILE_NAME: str = "config.toml"
+
+# Separators between a language and its region/script, e.g. "de-at" or "zh_hant"
+LOCALE_SEPARATORS: tuple[str, ...] = ("-", "_")
+
 
 def get_config_file_path() -> Path:
-    return get_project_root() / "config.toml"
+    """
+    Get the path of the config file. The first of these that applies is used,
+    and the result is cached for as long as the environment variables are
+    unchanged:
+
+    1. `TL_CONFIG`, the path of the config file itself
+    2. `config.toml` in `TL_ROOT`
+    3. a `config.toml` shipped inside the `tl` package (for installs without a
+       project checkout), found without walking the filesystem
+    4. `config.toml` in the project root found by `get_project_root()`
+
+    Raises:
+        FileNotFoundError: if no project root could be found for the last option
+
+    Returns:
+        Path: the path of the config file
+    """
+    return _resolve_config_file_path(
+        os.environ.get(CONFIG_ENV), os.environ.get(ROOT_ENV)
+    )
+
+
+@lru_cache(maxsize=8)
+def _resolve_config_file_path(config_file: str | None, root: str | None) -> Path:
+    if config_file:
+        logger.debug("Using %s as the config file: '%s'", CONFIG_ENV, config_file)
+        return Path(config_file).absolute()
+    if not root and (package_config := _get_package_config_file()) is not None:
+        logger.debug("Using the packaged config file: '%s'", package_config)
+        return package_config
+    return _find_project_root() / CONFIG_FILE_NAME
+
+
+def _get_package_config_file() -> Path | None:
+    """
+    Intended for internal use. Get the `config.toml` installed as a resource of
+    the `tl` package, if there is one on the filesystem.
+    """
+    from importlib.resources import files
+
+    resource = files("tl") / CONFIG_FILE_NAME
+    if isinstance(resource, Path) and resource.is_file():
+        return resource
+    return None
 
 
 def get_value_from_config(
@@ -25,7 +81,240 @@ def get_value_from_config(
     Returns:
         str | list[str] | list[dict[str, object]]: the value from the config file
     """
-    return get_value_from_key(get_config_file_path(), key_path)
+    return _get_value_from_key(get_config_file_path(), key_path)
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class ConfigSnapshot:
+    """
+    An immutable, already validated view of the config file. Every accessor in
+    this module reads from the current snapshot instead of re-parsing the file.
+
+    Attributes:
+        config_file_path (Path): the path of the config file the snapshot was built from
+        i18n_dir_path (Path): absolute path of the i18n directory
+        fallback_code (str): the fallback language code
+        language_codes (tuple[str, ...]): supported language codes, in config order
+        codes (frozenset[str]): supported language codes, for membership tests
+        english_names (Mapping[str, str]): language code to english spelling
+        native_names (Mapping[str, str]): language code to native spelling
+        file_names (Mapping[str, str]): language code to language file name
+        file_paths (Mapping[str, Path]): language code to absolute language file path
+        chains (Mapping[str, tuple[str, ...]]): language code to the codes its keys are
+            looked up in, in order, starting with itself and ending with the fallback
+    """
+
+    config_file_path: Path
+    i18n_dir_path: Path
+    fallback_code: str
+    language_codes: tuple[str, ...]
+    codes: frozenset[str]
+    english_names: Mapping[str, str]
+    native_names: Mapping[str, str]
+    file_names: Mapping[str, str]
+    file_paths: Mapping[str, Path]
+    chains: Mapping[str, tuple[str, ...]]
+
+    @classmethod
+    def from_toml_dict(
+        cls, toml_dict: Mapping[str, object], config_file_path: Path
+    ) -> "ConfigSnapshot":
+        """
+        Build and validate a snapshot from an already parsed config file.
+
+        Args:
+            toml_dict (Mapping[str, object]): the parsed config file
+            config_file_path (Path): the path the config file was parsed from
+
+        Raises:
+            ValueError: if a required config value is missing or malformed
+
+        Returns:
+            ConfigSnapshot: the validated snapshot
+        """
+        paths = toml_dict.get("paths")
+        if not isinstance(paths, Mapping) or not str(paths.get("i18n_dir", "")):
+            raise ValueError(f"'paths.i18n_dir' is missing from '{config_file_path}'")
+        i18n_dir_path = Path(str(paths["i18n_dir"]))
+        if not i18n_dir_path.is_absolute():
+            i18n_dir_path = config_file_path.parent / i18n_dir_path
+
+        languages = toml_dict.get("languages")
+        if not isinstance(languages, Mapping):
+            raise ValueError(f"'languages' table is missing from '{config_file_path}'")
+
+        english_names: dict[str, str] = {}
+        native_names: dict[str, str] = {}
+        file_names: dict[str, str] = {}
+        parents: dict[str, tuple[str, ...] | None] = {}
+        for code, table in languages.items():
+            if not isinstance(table, Mapping):
+                continue  # scalar settings such as `fallback`
+            if code != code.lower():
+                raise ValueError(f"Language code '{code}' must be all lowercase")
+            if not (file_name := str(table.get("file", ""))):
+                raise ValueError(f"'languages.{code}.file' is missing")
+            english_names[code] = str(table.get("english_name", ""))
+            native_names[code] = str(table.get("native_name", ""))
+            file_names[code] = file_name
+            if (fallbacks := table.get("fallbacks")) is None:
+                parents[code] = None
+            elif isinstance(fallbacks, list) and all(
+                isinstance(parent, str) for parent in fallbacks
+            ):
+                parents[code] = tuple(fallbacks)
+            else:
+                raise ValueError(
+                    f"'languages.{code}.fallbacks' must be a list of codes"
+                )
+
+        fallback_code = str(languages.get("fallback", ""))
+        if fallback_code not in file_names:
+            raise ValueError(
+                f"Fallback language '{fallback_code}' is not a configured language"
+            )
+        for code, fallbacks in parents.items():
+            if fallbacks is None:
+                parents[code] = _implicit_parents(code, file_names)
+            elif unknown := [
+                parent for parent in fallbacks if parent not in file_names
+            ]:
+                raise ValueError(
+                    f"'languages.{code}.fallbacks' has unconfigured languages {unknown}"
+                )
+
+        return cls(
+            config_file_path=config_file_path,
+            i18n_dir_path=i18n_dir_path,
+            fallback_code=fallback_code,
+            language_codes=tuple(file_names),
+            codes=frozenset(file_names),
+            english_names=MappingProxyType(english_names),
+            native_names=MappingProxyType(native_names),
+            file_names=MappingProxyType(file_names),
+            file_paths=MappingProxyType(
+                {code: i18n_dir_path / name for code, name in file_names.items()}
+            ),
+            chains=MappingProxyType(
+                {
+                    code: _build_chain(code, parents, fallback_code)
+                    for code in file_names
+                }
+            ),
+        )
+
+    def chain_for(self, code: str) -> tuple[str, ...]:
+        """
+        Get the codes a language's keys are looked up in. A code that is not
+        configured uses the chain of its base language if that is configured
+        (e.g. "de-ch" uses "de"), otherwise the fallback language's chain.
+
+        Args:
+            code (str): the language code (case sensitive)
+
+        Returns:
+            tuple[str, ...]: the language codes to look keys up in, in order
+        """
+        if (chain := self.chains.get(code)) is not None:
+            return chain
+        if base := _implicit_parents(code, self.codes):
+            return self.chains[base[0]]
+        return self.chains[self.fallback_code]
+
+
+def _implicit_parents(code: str, codes: Container[str]) -> tuple[str, ...]:
+    """
+    Intended for internal use. The configured base language of a regional
+    code, e.g. "de" for "de-at", if there is one.
+    """
+    for separator in LOCALE_SEPARATORS:
+        base, found, _ = code.rpartition(separator)
+        if found and base in codes:
+            return (base,)
+    return ()
+
+
+def _build_chain(
+    code: str, parents: Mapping[str, tuple[str, ...] | None], fallback_code: str
+) -> tuple[str, ...]:
+    """
+    Intended for internal use. Expand a language's fallbacks, then theirs, and
+    so on, ending with the fallback language. Repeated codes are skipped, so
+    cycles between languages are harmless. A language without parents may map
+    to None.
+    """
+    chain = [code]
+    for current in chain:  # grows while iterating
+        chain.extend(parent for parent in parents[current] or () if parent not in chain)
+    if fallback_code not in chain:
+        chain.append(fallback_code)
+    return tuple(chain)
+
+
+_snapshot: ConfigSnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+
+def reload() -> ConfigSnapshot:
+    """
+    Re-read the config file and atomically swap in a new snapshot. Readers
+    holding the previous snapshot keep a consistent view of the old config.
+
+    Raises:
+        ValueError: if the config file is invalid. The previous snapshot is kept.
+
+    Returns:
+        ConfigSnapshot: the newly published snapshot
+    """
+    with _snapshot_lock:
+        return _reload_locked()
+
+
+def _reload_locked() -> ConfigSnapshot:
+    """
+    Intended for internal use. `reload()` for callers already holding
+    `_snapshot_lock`.
+    """
+    global _snapshot
+    config_file_path = get_config_file_path()
+    _snapshot = ConfigSnapshot.from_toml_dict(
+        _serialize_toml_dict(config_file_path), config_file_path
+    )
+    logger.debug("Loaded config snapshot from '%s'", config_file_path)
+    return _snapshot
+
+
+def get_config_snapshot() -> ConfigSnapshot:
+    """
+    Get the current config snapshot, loading it on first use. Threads racing
+    on first use wait for one of them to load it.
+
+    Returns:
+        ConfigSnapshot: the current config snapshot
+    """
+    if (snapshot := _snapshot) is not None:
+        return snapshot
+    with _snapshot_lock:
+        if _snapshot is not None:
+            return _snapshot
+        return _reload_locked()
+
+
+def _loaded_config_snapshot() -> ConfigSnapshot | None:
+    """
+    Intended for internal use. The current config snapshot, or `None` if it
+    was not loaded yet.
+    """
+    return _snapshot
+
+
+def _lookup(mapping: Mapping[str, object], code: str) -> object:
+    try:
+        return mapping[code.lower()]
+    except KeyError:
+        raise KeyError(
+            f"Language code '{code}' does not exist in the config file"
+        ) from None
 
 
 def get_i18n_dir_path() -> Path:
@@ -33,9 +322,9 @@ def get_i18n_dir_path() -> Path:
     Get the path of the i18n directory, which should be stored in the config file.
 
     Returns:
-        Path: i18n_dir path if in the config file, or current directory (".")
+        Path: the absolute i18n_dir path, resolved against the project root
     """
-    return Path(str(get_value_from_config("paths.i18n_dir")))
+    return get_config_snapshot().i18n_dir_path
 
 
 def get_fallback_language_code() -> str:
@@ -48,7 +337,7 @@ def get_fallback_language_code() -> str:
     Returns:
         str: the fallback language code, or an empty str if unavailable
     """
-    return str(get_value_from_config("languages.fallback"))
+    return get_config_snapshot().fallback_code
 
 
 def get_all_english_names() -> list[str]:
@@ -60,7 +349,7 @@ def get_all_english_names() -> list[str]:
     Returns:
         list[str]: a list of all supported languages with english spelling
     """
-    return [str(name) for name in get_value_from_config("languages.*.english_name")]
+    return list(get_config_snapshot().english_names.values())
 
 
 def get_all_native_names() -> list[str]:
@@ -72,7 +361,7 @@ def get_all_native_names() -> list[str]:
     Returns:
         list[str]: a list of all supported languages with native spelling
     """
-    return [str(name) for name in get_value_from_config("languages.*.native_name")]
+    return list(get_config_snapshot().native_names.values())
 
 
 def get_all_file_names() -> list[str]:
@@ -85,7 +374,7 @@ def get_all_file_names() -> list[str]:
     Returns:
         list[str]: a list of the filenames for all supported languages
     """
-    return [str(name) for name in get_value_from_config("languages.*.file")]
+    return list(get_config_snapshot().file_names.values())
 
 
 def get_all_language_codes() -> list[str]:
@@ -97,7 +386,7 @@ def get_all_language_codes() -> list[str]:
     Returns:
         list[str]: a list of language codes for each supported language
     """
-    return [code for code in get_value_from_config("languages").keys()]
+    return list(get_config_snapshot().language_codes)
 
 
 def language_code_to_english_name(code: str) -> str:
@@ -115,7 +404,7 @@ def language_code_to_english_name(code: str) -> str:
     Returns:
         str: the language name in english, or empty str if english is unavailable
     """
-    return str(get_value_from_config(f"languages.{code.lower()}.english_name"))
+    return str(_lookup(get_config_snapshot().english_names, code))
 
 
 def language_code_to_native_name(code: str) -> str:
@@ -133,7 +422,7 @@ def language_code_to_native_name(code: str) -> str:
     Returns:
         str: the language name in native spelling, or empty str if spelling is unavailable
     """
-    return str(get_value_from_config(f"languages.{code.lower()}.native_name"))
+    return str(_lookup(get_config_snapshot().native_names, code))
 
 
 def language_code_to_file_name(code: str) -> str:
@@ -150,7 +439,7 @@ def language_code_to_file_name(code: str) -> str:
     Returns:
         str: the language name in native spelling, or empty str if spelling is unavailable
     """
-    return str(get_value_from_config(f"languages.{code.lower()}.file"))
+    return str(_lookup(get_config_snapshot().file_names, code))
 
 
 def get_language_file_path(code: str) -> Path:
@@ -166,4 +455,38 @@ def get_language_file_path(code: str) -> Path:
     Returns:
         Path: the absolute path of the specified language file
     """
-    return get_i18n_dir_path() / language_code_to_file_name(code)
+    # The snapshot's own Path, so its cached str is reused by the catalog cache
+    return _lookup(get_config_snapshot().file_paths, code)  # type: ignore[return-value]
+
+
+def get_fallback_chain(code: str) -> list[str]:
+    """
+    Get the language codes a language's keys are looked up in, in order. The
+    chain starts with the language itself, continues with the languages in its
+    `fallbacks` list (or its base language, e.g. "de" for "de-at") and theirs,
+    and ends with the fallback language:
+
+    >>> get_fallback_chain("de-at")
+    ['de-at', 'de', 'en']
+
+    Args:
+        code (str): the language code (case sensitive)
+
+    Returns:
+        list[str]: the language codes to look keys up in, in order
+    """
+    return list(get_config_snapshot().chain_for(code))
+
+
+def is_supported_code(code: str) -> bool:
+    """
+    Check if a language code is configured, as a set membership test on the
+    current config snapshot.
+
+    Args:
+        code (str): the language code to check (case sensitive)
+
+    Returns:
+        bool: `True` if the language code is in the config file, `False` otherwise
+    """
+    return code in get_config_snapshot().codes
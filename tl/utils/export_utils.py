@@ -0,0 +1,267 @@
+import json
+import logging
+import re
+from typing import IO, Literal, get_args
+
+from tl.utils.catalog_utils import KEY_SEPARATOR, Catalog
+from tl.utils.compile_utils import BinaryCatalog
+from tl.utils.config_utils import (
+    get_fallback_language_code,
+    get_language_file_path,
+    is_supported_code,
+)
+from tl.utils.toml_utils import _load_catalog
+
+logger = logging.getLogger(__name__)
+
+ExportFormat = Literal["toml", "json", "ndjson", "po"]
+
+EXPORT_FORMATS: tuple[str, ...] = get_args(ExportFormat)
+
+_BARE_KEY = re.compile(r"[A-Za-z0-9_-]+")
+
+_PO_ESCAPES: dict[int, str] = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+_PO_HEADER: str = (
+    'msgid ""\n'
+    'msgstr ""\n'
+    '"Language: {language_code}\\n"\n'
+    '"MIME-Version: 1.0\\n"\n'
+    '"Content-Type: text/plain; charset=UTF-8\\n"\n'
+    '"Content-Transfer-Encoding: 8bit\\n"\n'
+)
+
+
+def _toml_simple_key(key: str) -> str:
+    return key if _BARE_KEY.fullmatch(key) else json.dumps(key, ensure_ascii=False)
+
+
+def _toml_key(key_path: str) -> str:
+    return KEY_SEPARATOR.join(
+        _toml_simple_key(key) for key in key_path.split(KEY_SEPARATOR)
+    )
+
+
+def _toml_value(value: object) -> str:
+    # A JSON string is also a valid TOML basic string
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    # Arrays and tables are written inline, since the value must fit on its
+    # key's line. tomlkit would make a list of tables an array of tables.
+    if isinstance(value, list):
+        return "[" + ", ".join(_toml_value(item) for item in value) + "]"
+    if isinstance(value, dict):
+        pairs = (f"{_toml_simple_key(k)} = {_toml_value(v)}" for k, v in value.items())
+        return "{" + ", ".join(pairs) + "}"
+    import tomlkit
+
+    return tomlkit.item(value).as_string()
+
+
+def _write_toml(catalog: Catalog | BinaryCatalog, out: IO[str]) -> int:
+    """
+    Intended for internal use. Write a catalog as TOML, a line per key.
+
+    Every table's keys are contiguous in document order, so each table gets
+    one header, the first time one of its keys is written. Keys of nested
+    tables that follow are written as dotted keys under that header, since a
+    table header cannot be repeated once a sub-table was opened.
+    """
+    count = 0
+    # Keys at the root must come before the first table header
+    for key_path in catalog.keys():
+        if KEY_SEPARATOR not in key_path:
+            _ = out.write(
+                f"{_toml_key(key_path)} = {_toml_value(catalog.get(key_path))}\n"
+            )
+            count += 1
+
+    header = ""
+    for key_path, value in catalog.items():
+        table, _, key = key_path.rpartition(KEY_SEPARATOR)
+        if not table:
+            continue
+        if header and (table == header or table.startswith(header + KEY_SEPARATOR)):
+            key = key_path[len(header) + 1 :]
+        else:
+            header = table
+            _ = out.write(
+                f"\n[{_toml_key(table)}]\n" if count else f"[{_toml_key(table)}]\n"
+            )
+        _ = out.write(f"{_toml_key(key)} = {_toml_value(value)}\n")
+        count += 1
+    return count
+
+
+def _write_json(catalog: Catalog | BinaryCatalog, out: IO[str]) -> int:
+    """
+    Intended for internal use. Write a catalog as an indented JSON object,
+    opening and closing nested objects as the key paths enter and leave
+    tables.
+    """
+    count = 0
+    tables: list[str] = []
+    separator = ""
+    _ = out.write("{")
+    for key_path, value in catalog.items():
+        *parents, key = key_path.split(KEY_SEPARATOR)
+        shared = 0
+        while shared < min(len(tables), len(parents)):
+            if tables[shared] != parents[shared]:
+                break
+            shared += 1
+        while len(tables) > shared:
+            _ = tables.pop()
+            _ = out.write(f"\n{'  ' * (len(tables) + 1)}}}")
+            separator = ","
+        for parent in parents[shared:]:
+            tables.append(parent)
+            indent = "  " * len(tables)
+            _ = out.write(
+                f"{separator}\n{indent}{json.dumps(parent, ensure_ascii=False)}: {{"
+            )
+            separator = ""
+        value_json = json.dumps(value, ensure_ascii=False, default=str)
+        indent = "  " * (len(tables) + 1)
+        _ = out.write(
+            f"{separator}\n{indent}{json.dumps(key, ensure_ascii=False)}: {value_json}"
+        )
+        separator = ","
+        count += 1
+    while tables:
+        _ = tables.pop()
+        _ = out.write(f"\n{'  ' * (len(tables) + 1)}}}")
+    _ = out.write("\n}\n" if count else "}\n")
+    return count
+
+
+def _write_ndjson(catalog: Catalog | BinaryCatalog, out: IO[str]) -> int:
+    """
+    Intended for internal use. Write a catalog as a `{"key", "value"}` JSON
+    object per line.
+    """
+    count = 0
+    for key_path, value in catalog.items():
+        record = {"key": key_path, "value": value}
+        _ = out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        count += 1
+    return count
+
+
+def _po_str(value: str) -> str:
+    return f'"{value.translate(_PO_ESCAPES)}"'
+
+
+def _write_po(
+    catalog: Catalog | BinaryCatalog,
+    out: IO[str],
+    source: Catalog | BinaryCatalog,
+    language_code: str,
+) -> int:
+    """
+    Intended for internal use. Write a catalog as a gettext `.po` file. Each
+    string of the source (fallback) language becomes an entry with the key
+    path as its context, the source string as its id and the catalog's string
+    as its translation, which is left empty if the catalog does not have it.
+    """
+    count = 0
+    _ = out.write(_PO_HEADER.format(language_code=language_code))
+    for key_path, value in source.items():
+        if not isinstance(value, str) or not value:
+            continue
+        translation = catalog.get(key_path)
+        _ = out.write(
+            f"\nmsgctxt {_po_str(key_path)}\nmsgid {_po_str(value)}\n"
+            f"msgstr {_po_str(translation if isinstance(translation, str) else '')}\n"
+        )
+        count += 1
+    return count
+
+
+def export_catalog(
+    catalog: Catalog | BinaryCatalog,
+    out: IO[str],
+    export_format: ExportFormat = "toml",
+    source: Catalog | BinaryCatalog | None = None,
+    language_code: str = "",
+) -> int:
+    """
+    Write a catalog to a text file-like object, key by key. Nothing but the
+    line being written is built in memory, so exporting takes the same memory
+    however large the catalog is. Empty tables are left out.
+
+    Args:
+        catalog (Catalog | BinaryCatalog): the catalog to export
+        out (IO[str]): where to write, e.g. `sys.stdout` or an open file
+        export_format (ExportFormat, optional): "toml", "json", "ndjson" (a
+            `{"key", "value"}` object per line) or "po" (gettext). Defaults to "toml".
+        source (Catalog | BinaryCatalog | None, optional): for "po", the catalog of the
+            language translated from. Defaults to `catalog` itself.
+        language_code (str, optional): for "po", the code of the catalog's language
+
+    Raises:
+        ValueError: if the export format is unknown
+
+    Returns:
+        int: the number of keys written
+    """
+    match export_format:
+        case "toml":
+            count = _write_toml(catalog, out)
+        case "json":
+            count = _write_json(catalog, out)
+        case "ndjson":
+            count = _write_ndjson(catalog, out)
+        case "po":
+            if source is None:
+                source = catalog
+            count = _write_po(catalog, out, source, language_code)
+        case _:
+            raise ValueError(
+                f"Unknown export format '{export_format}', expected one of {EXPORT_FORMATS}"
+            )
+    logger.debug("Exported %d keys as %s", count, export_format)
+    return count
+
+
+def export_language(
+    language_code: str, out: IO[str], export_format: ExportFormat = "toml"
+) -> int:
+    """
+    Write a language file to a text file-like object in another format, key
+    by key (see `export_catalog()`). Uses the fallback language if the
+    language is not supported. A gettext export translates from the fallback
+    language:
+
+    >>> with open("de.po", "w", encoding="utf-8") as f:
+    ...     export_language("de", f, "po")
+
+    Args:
+        language_code (str): the code of the language to export
+        out (IO[str]): where to write, e.g. `sys.stdout` or an open file
+        export_format (ExportFormat, optional): "toml", "json", "ndjson" or "po".
+            Defaults to "toml".
+
+    Raises:
+        ValueError: if the export format is unknown
+        FileNotFoundError: if the language's TOML file could not be found
+
+    Returns:
+        int: the number of keys written
+    """
+    logger.debug("'language_code'=%r, 'export_format'=%r", language_code, export_format)
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unknown export format '{export_format}', expected one of {EXPORT_FORMATS}"
+        )
+    if not is_supported_code(language_code):
+        logger.warning("'%s' is not supported, using fallback", language_code)
+        language_code = get_fallback_language_code()
+
+    catalog = _load_catalog(get_language_file_path(language_code))
+    source = None
+    if export_format == "po":
+        source = _load_catalog(get_language_file_path(get_fallback_language_code()))
+    return export_catalog(catalog, out, export_format, source, language_code)
@@ -1,19 +1,30 @@
+import copy
+import io
 import logging
-
-import tomlkit
-from pydantic import Field, validate_call
-
-from tl.utils.config_utils import get_fallback_language_code, get_language_file_path
-from tl.utils.toml_utils import serialize_toml_dict
-from tl.utils.translation_utils import is_supported
+import sys
+from pathlib import Path
+
+from pydantic import Field
+
+from tl.utils.compile_utils import BinaryCatalog
+from tl.utils.config_utils import (
+    get_config_snapshot,
+    get_fallback_language_code,
+    get_language_file_path,
+    is_supported_code,
+)
+from tl.utils.export_utils import export_language
+from tl.utils.toml_utils import _compile_toml_file, _load_catalog
+from tl.utils.validation_utils import validate_boundary
 
 logger = logging.getLogger(__name__)
 
 
-@validate_call
+@validate_boundary
 def into_toml_dict(language_code: str = Field(..., min_length=1)) -> dict[str, object]:
     """
-    Returns a TOML-like dictionary with a given language code.
+    Returns a TOML-like dictionary with a given language code. The dict is a
+    copy of the cached catalog, so the caller is free to modify it.
 
     Args:
         language_code (str): the code of the desired language to convert into a TOML-like dict
@@ -21,56 +32,94 @@ def into_toml_dict(language_code: str = Field(..., min_length=1)) -> dict[str, o
     Returns:
         dict: the language file as a TOML-like dict or {} if file was empty
     """
+    return _into_toml_dict(language_code)
+
+
+def _into_toml_dict(language_code: str) -> dict[str, object]:
+    """
+    Intended for internal use. `into_toml_dict()` without validating its args.
+    """
     logger.debug("'language_code'=%r", language_code)
 
-    if not is_supported(language_code):
+    if not is_supported_code(language_code):
         logger.warning("'%s' is not supported, using fallback", language_code)
         language_code = get_fallback_language_code()
     else:
         logger.debug("'%s' is supported. Serializing its TOML dict", language_code)
 
-    if toml_dict := serialize_toml_dict(get_language_file_path(language_code)):
-        logger.info("'toml_dict'=%r", toml_dict)
+    catalog = _load_catalog(get_language_file_path(language_code))
+    # A compiled catalog is decoded afresh, so it does not keep a decoded copy.
+    # A parsed catalog's tree is shared by every lookup, so it is copied.
+    if isinstance(catalog, BinaryCatalog):
+        toml_dict = catalog.to_dict()
+    else:
+        toml_dict = copy.deepcopy(catalog.tree)
+    if toml_dict:
+        # Never repr a whole catalog, it is built even when nothing is written
+        logger.debug("Serialized %d top level keys", len(toml_dict))
         return toml_dict
     logger.warning("None dict serialized from '%s' TOML file", language_code)
     return {}
 
 
-@validate_call
+@validate_boundary
 def into_toml_str(language_code: str = Field(..., min_length=1)) -> str:
     """
     Return the TOML language file of a given language code as a TOML-based
-    pretty str.
+    pretty str. The str is rebuilt from the parsed catalog with a line per key
+    (see `export_utils.export_catalog()`), so the file's comments, formatting
+    and empty tables are not kept.
 
     Args:
         language_code (str): the code of the desired language to convert into a str
     """
-    logger.debug("'language_code'=%r", language_code)
+    return _into_toml_str(language_code)
 
-    if not is_supported(language_code):
-        logger.warning("'%s' is not supported, using fallback", language_code)
-        language_code = get_fallback_language_code()
-    else:
-        logger.debug("'%s' is supported. Converting its dict into str", language_code)
 
-    if toml_str := tomlkit.dumps(into_toml_dict(language_code)):
-        logger.info("'toml_str'=%r", toml_str)
+def _into_toml_str(language_code: str) -> str:
+    """
+    Intended for internal use. `into_toml_str()` without validating its args.
+    """
+    logger.debug("'language_code'=%r", language_code)
+
+    out = io.StringIO()
+    if export_language(language_code, out):
+        toml_str = out.getvalue()
+        logger.debug("Converted into a %d char TOML str", len(toml_str))
         return toml_str
     logger.warning("Retrieved empty str from '%s' TOML file", language_code)
     return ""
 
 
-@validate_call
+@validate_boundary
 def print_toml_dict(language_code: str = Field(..., min_length=1)) -> None:
     """
     Pretty print, or print with TOML-based formatting, the language file with
-    a given language code.
+    a given language code. The file is written to stdout key by key instead of
+    being built into a str first.
 
     Args:
         language_code (str): the code of the desired language to pretty print
     """
     logger.debug("'language_code'=%r", language_code)
 
-    toml_str: str = into_toml_str(language_code)
-    logger.debug("printing TOML str: `%s`", toml_str)
-    print(toml_str)
+    _ = export_language(language_code, sys.stdout)
+
+
+def compile_language_files() -> list[Path]:
+    """
+    Compile every language TOML file listed in the config file into a binary
+    catalog stored next to it. Lookups then map the binary catalogs instead of
+    parsing TOML, until a language file changes and its catalog becomes stale.
+    Language files that do not exist are skipped.
+
+    Returns:
+        list[Path]: the paths of the written binary catalogs
+    """
+    compiled_paths: list[Path] = []
+    for language_code, path in get_config_snapshot().file_paths.items():
+        if not path.exists():
+            logger.warning("Skipping '%s', '%s' does not exist", language_code, path)
+            continue
+        compiled_paths.append(_compile_toml_file(path))
+    return compiled_paths
@@ -0,0 +1,156 @@
+import atexit
+import datetime
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
+logger = logging.getLogger(__name__)
+
+LOG_FORMAT: str = (
+    "[%(levelname)s] (%(asctime)s) %(funcName)s(): %(message)s "
+    "['%(pathname)s:%(lineno)s']"
+)
+
+LOG_LEVEL_ENV: str = "TL_LOG_LEVEL"
+
+LOG_FILE_ENV: str = "TL_LOG_FILE"
+
+PACKAGE_LOGGER_NAME: str = "tl"
+
+MAX_LOGGED_STR_LEN: int = 80
+
+_handler: logging.Handler | None = None
+
+_listener: "QueueListener | None" = None
+
+
+def get_default_log_file_path() -> Path:
+    """
+    Get the path of a new, timestamped log file in the `logs` dir of the current
+    working directory, which is where the package used to always log to.
+
+    Returns:
+        Path: e.g. "logs/13:37:00_10-17-26.log"
+    """
+    return Path("logs") / f"{datetime.datetime.now().strftime('%H:%M:%S_%m-%d-%y')}.log"
+
+
+def describe_value(value: object) -> str:
+    """
+    Describe an i18n value for a log record without building the repr of a
+    whole table or list, which can be as large as the catalog itself. Only
+    call it behind a `logger.isEnabledFor()` check.
+
+    Args:
+        value (object): a value looked up from a catalog
+
+    Returns:
+        str: a short repr of a str, or the type and size of a table or list
+    """
+    if isinstance(value, str):
+        if len(value) > MAX_LOGGED_STR_LEN:
+            return f"{value[:MAX_LOGGED_STR_LEN]!r}... ({len(value)} chars)"
+        return repr(value)
+    if isinstance(value, (dict, list)):
+        return f"a {type(value).__name__} of {len(value)} values"
+    return repr(value)
+
+
+def configure_logging(
+    level: int | str = logging.DEBUG,
+    filename: str | Path | None = None,
+    fmt: str = LOG_FORMAT,
+    queued: bool = False,
+) -> None:
+    """
+    Opt in to the package's log records. The library itself only installs a
+    `NullHandler`, so nothing is formatted or written until an application
+    calls this (or configures the "tl" logger itself). Calling it again
+    replaces the previous configuration.
+
+    With `queued`, records are handed to a `QueueHandler` and formatted and
+    written by a background `QueueListener` thread, so a slow disk never
+    blocks a lookup. The listener is flushed and stopped at exit.
+
+    Args:
+        level (int | str, optional): the lowest level to log, e.g. "INFO". Defaults to DEBUG.
+        filename (str | Path | None, optional): the file to log to. Defaults to stderr.
+        fmt (str, optional): the format of log records. Defaults to `LOG_FORMAT`.
+        queued (bool, optional): write records from a background thread. Defaults to False.
+    """
+    global _handler, _listener
+    reset_logging()
+
+    handler: logging.Handler
+    if filename is None:
+        handler = logging.StreamHandler()
+    else:
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(filename, encoding="utf-8")
+    handler.setFormatter(logging.Formatter(fmt))
+
+    if queued:
+        import queue
+        from logging.handlers import QueueHandler, QueueListener
+
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _listener = QueueListener(records, handler)
+        _listener.start()
+        handler = QueueHandler(records)
+
+    package_logger = logging.getLogger(PACKAGE_LOGGER_NAME)
+    package_logger.setLevel(level)
+    package_logger.addHandler(handler)
+    _handler = handler
+    logger.debug("Starting session")
+
+
+def configure_logging_from_env() -> bool:
+    """
+    Configure queued logging from the `TL_LOG_LEVEL` and `TL_LOG_FILE`
+    environment variables, which is how the CLI opts in. Nothing is configured
+    unless at least one of them is set. `TL_LOG_FILE` defaults to
+    `get_default_log_file_path()` and `TL_LOG_LEVEL` to "DEBUG".
+
+    Raises:
+        ValueError: if `TL_LOG_LEVEL` is not a logging level name
+
+    Returns:
+        bool: `True` if logging was configured, `False` otherwise
+    """
+    level = os.environ.get(LOG_LEVEL_ENV)
+    filename = os.environ.get(LOG_FILE_ENV)
+    if not level and not filename:
+        return False
+    configure_logging(
+        level=(level or "DEBUG").upper(),
+        filename=filename or get_default_log_file_path(),
+        queued=True,
+    )
+    return True
+
+
+def reset_logging() -> None:
+    """
+    Undo `configure_logging()`: flush and stop the background listener, if
+    any, and remove the installed handler, so the package logs nothing again.
+    """
+    global _handler, _listener
+    package_logger = logging.getLogger(PACKAGE_LOGGER_NAME)
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    if _handler is not None:
+        package_logger.removeHandler(_handler)
+        _handler.close()
+        _handler = None
+    package_logger.setLevel(logging.NOTSET)
+
+
+_ = atexit.register(reset_logging)
@@ -1,11 +1,18 @@
 import logging
+import os
+from functools import lru_cache
 from os.path import exists
 from pathlib import Path
+from typing import Annotated
 
-from pydantic import Field, validate_call
+from pydantic import Field
+
+from tl.utils.validation_utils import validate_boundary
 
 logger = logging.getLogger(__name__)
 
+ROOT_ENV: str = "TL_ROOT"
+
 
 def valid_path_validator(v: str | Path) -> Path:
     """
@@ -30,7 +37,7 @@ def valid_path_validator(v: str | Path) -> Path:
         elif not exists(Path(v)):
             logger.error("arg '%s' could not be located/does not exist", v)
             raise FileNotFoundError(f"path '{v}' could not be located/does not exist")
-        logger.info("Validated existence of path: %r", Path(v))
+        logger.debug("Validated existence of path: %r", v)
         return Path(v)
 
     if not exists(v):
@@ -40,22 +47,48 @@ def valid_path_validator(v: str | Path) -> Path:
     return v
 
 
-@validate_call
+@validate_boundary
 def get_project_root(
-    anchor: str = Field(default=".git", min_length=1),
+    anchor: Annotated[str, Field(min_length=1)] = ".git",
 ) -> Path:
     """
-    Find and return the path of the root path of the project.
+    Find and return the path of the root path of the project. If `TL_ROOT` is
+    set, it is used as the root without any discovery. Otherwise the parent
+    dirs are only walked the first time, and the result is cached.
 
     Args:
         anchor (str, optional): a known file/dir that exists in the project root. Defaults to ".git".
 
     Raises:
-        FileNotFoundError: if `anchor` could not be found in parent dirs
+        FileNotFoundError: if `TL_ROOT` is not a dir, or `anchor` could not be found in parent dirs
 
     Returns:
         Path: the path of the project root
     """
+    return _find_project_root(anchor)
+
+
+def _find_project_root(anchor: str = ".git") -> Path:
+    """
+    Intended for internal use. `get_project_root()` without validating `anchor`.
+    """
+    if root := os.environ.get(ROOT_ENV):
+        return _explicit_project_root(root)
+    return _discover_project_root(anchor)
+
+
+@lru_cache(maxsize=8)
+def _explicit_project_root(root: str) -> Path:
+    root_path = Path(root).absolute()
+    if not root_path.is_dir():
+        logger.error("%s='%s' is not a dir", ROOT_ENV, root)
+        raise FileNotFoundError(f"{ROOT_ENV} '{root}' is not a dir")
+    logger.debug("Using %s as the project root: %r", ROOT_ENV, root_path)
+    return root_path
+
+
+@lru_cache(maxsize=8)
+def _discover_project_root(anchor: str) -> Path:
     logger.debug("'anchor'=%r", anchor)
     current_path = Path(__file__).resolve()
     for parent in current_path.parents:
@@ -66,3 +99,12 @@ def get_project_root(
     raise FileNotFoundError(
         f"Could not find '{anchor}' in the parent dirs of '{current_path}'"
     )
+
+
+def clear_project_root_cache() -> None:
+    """
+    Forget the cached project root, e.g. after moving the project or
+    changing `TL_ROOT`.
+    """
+    _explicit_project_root.cache_clear()
+    _discover_project_root.cache_clear()
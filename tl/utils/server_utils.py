@@ -0,0 +1,355 @@
+import errno
+import ipaddress
+import json
+import logging
+import os
+import random
+import socket
+import socketserver
+import stat
+import threading
+import time
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import IO, cast
+
+from tl.utils.config_utils import get_all_language_codes
+from tl.utils.translation_utils import Translator, translate_records
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ADDRESS: str = "tl-python.sock"
+
+PERCENTILES: tuple[int, ...] = (50, 90, 99)
+
+# Latencies kept to estimate percentiles, however many records are answered
+MAX_LATENCY_SAMPLES: int = 10_000
+
+
+def read_records(lines: Iterable[str]) -> Iterator[dict[str, object]]:
+    """
+    Parse NDJSON records lazily. Malformed lines become records carrying an
+    "error", so they are reported in order instead of aborting the stream.
+
+    Args:
+        lines (Iterable[str]): NDJSON lines, e.g. stdin or a socket file
+
+    Returns:
+        Iterator[dict[str, object]]: one record per non-blank line
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            parsed: object = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield {"error": f"invalid JSON record: {e}"}
+            continue
+        if isinstance(parsed, dict):
+            yield cast(dict[str, object], parsed)
+        else:
+            yield {"error": "record is not an object"}
+
+
+def dump_record(record: dict[str, object]) -> str:
+    """
+    Serialize a record as a single NDJSON line, including the trailing newline.
+    Values JSON has no type for, such as TOML dates and times, are written as
+    strings.
+
+    Args:
+        record (dict[str, object]): the record to serialize
+
+    Returns:
+        str: the NDJSON line
+    """
+    return json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
+
+def parse_address(address: str) -> str | tuple[str, int]:
+    """
+    Parse a server address. "HOST:PORT" (e.g. "localhost:8765" or
+    "[::1]:8765") is a TCP address, anything else is the path of a Unix socket. The server has no
+    authentication, so TCP hosts must be loopback addresses.
+
+    Args:
+        address (str): the address to parse
+
+    Raises:
+        ValueError: if the host of a TCP address is not a loopback address
+
+    Returns:
+        str | tuple[str, int]: a Unix socket path or a (host, port) pair
+    """
+    host, _, port = address.rpartition(":")
+    if host and port.isdigit() and "/" not in address:
+        host = host.removeprefix("[").removesuffix("]")  # e.g. "[::1]:8765"
+        if not _is_loopback(host):
+            raise ValueError(
+                f"Host '{host}' is not a loopback address, e.g. localhost or 127.0.0.1"
+            )
+        return host, int(port)
+    return address
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _remove_stale_socket(path: str) -> None:
+    """
+    Intended for internal use. Remove the socket file a previous server left
+    behind, refusing to remove anything that is not a socket or that a live
+    server still listens on.
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode):
+        raise FileExistsError(
+            errno.EEXIST, "Not a socket, refusing to replace it", path
+        )
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+            logger.debug("Removed stale socket '%s'", path)
+            return
+    raise OSError(errno.EADDRINUSE, "A server is already listening on it", path)
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """
+    Get a percentile of already sorted samples, using the nearest rank.
+
+    Args:
+        sorted_samples (list[float]): the samples, in ascending order
+        pct (float): the percentile to get, from 0 to 100
+
+    Returns:
+        float: the percentile, or 0.0 if there are no samples
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = max(
+        0, min(len(sorted_samples) - 1, round(pct / 100 * len(sorted_samples)) - 1)
+    )
+    return sorted_samples[rank]
+
+
+class _RecordHandler(socketserver.StreamRequestHandler):
+    """
+    Answers every NDJSON record sent over one connection, in order.
+    """
+
+    def handle(self) -> None:
+        server = cast("_UnixServer | _TCPServer", self.server)
+        # Invalid UTF-8 becomes an invalid record instead of dropping the connection
+        lines = (line.decode(errors="replace") for line in self.rfile)
+        for record in read_records(lines):
+            start = time.perf_counter()
+            line = dump_record(next(translate_records((record,), server.translators)))
+            server.record_latency(time.perf_counter() - start)
+            self.wfile.write(line.encode())
+
+
+class _ServerMixin(socketserver.ThreadingMixIn):
+    daemon_threads = True
+    request_queue_size = 128
+    translators: dict[str, Translator]
+    latencies: array
+    latencies_lock: threading.Lock
+    latency_count: int
+    latency_max: float
+
+    def record_latency(self, seconds: float) -> None:
+        # Reservoir sampling: every latency so far is equally likely to be kept
+        with self.latencies_lock:
+            self.latency_count += 1
+            self.latency_max = max(self.latency_max, seconds)
+            if len(self.latencies) < MAX_LATENCY_SAMPLES:
+                self.latencies.append(seconds)
+            elif (i := random.randrange(self.latency_count)) < MAX_LATENCY_SAMPLES:
+                self.latencies[i] = seconds
+
+
+class _UnixServer(_ServerMixin, socketserver.UnixStreamServer):
+    pass
+
+
+class _TCPServer(_ServerMixin, socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+class _TCP6Server(_TCPServer):
+    address_family = socket.AF_INET6
+
+
+def _address_family(host: str) -> socket.AddressFamily:
+    return socket.AF_INET6 if ":" in host else socket.AF_INET
+
+
+class TranslationServer:
+    """
+    A long running server that keeps every language's catalog resident and
+    answers NDJSON records (see `translation_utils.translate_records()`) over a
+    Unix socket or a localhost TCP port, one thread per connection:
+
+    ```
+    > {"lang": "de", "key": "hello", "args": {"name": "Blake"}}
+    < {"lang": "de", "key": "hello", "value": "Hallo Blake"}
+    > {"op": "lookup", "lang": "de", "key": "start.*"}
+    < {"lang": "de", "key": "start.*", "value": ["Willkommen {name}!"]}
+    ```
+
+    The latency of every record is recorded and summarized by `report()`.
+    Translators are kept per configured language, whatever codes clients
+    send, and only a bounded sample of latencies is kept.
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, preload: bool = True) -> None:
+        """
+        Args:
+            address (str, optional): a Unix socket path or "HOST:PORT". Defaults to "tl-python.sock".
+            preload (bool, optional): load every configured language up front. Defaults to True.
+
+        Raises:
+            ValueError: if a TCP address's host is not a loopback address
+            FileExistsError: if the Unix socket path exists and is not a socket
+            OSError: if another server is already listening on the address
+            FileNotFoundError: if the fallback language's TOML file could not be found
+        """
+        self.address = parse_address(address)
+        # Load before binding, so a language that fails to load leaves no
+        # listening socket or socket file behind
+        translators: dict[str, Translator] = {}
+        if preload:
+            for language_code in get_all_language_codes():
+                translators[language_code] = Translator(language_code)
+
+        if isinstance(self.address, str):
+            _remove_stale_socket(self.address)
+            self._server: _UnixServer | _TCPServer = _UnixServer(
+                self.address, _RecordHandler
+            )
+        elif _address_family(self.address[0]) == socket.AF_INET6:
+            self._server = _TCP6Server(self.address, _RecordHandler)
+        else:
+            self._server = _TCPServer(self.address, _RecordHandler)
+        self._server.translators = translators
+        self._server.latencies = array("d")
+        self._server.latencies_lock = threading.Lock()
+        self._server.latency_count = 0
+        self._server.latency_max = 0.0
+        logger.info("Serving %r", self.address)
+
+    def serve_forever(self) -> None:
+        """
+        Handle connections until `shutdown()` is called from another thread.
+        """
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """
+        Stop `serve_forever()`. Must not be called from the serving thread.
+        """
+        self._server.shutdown()
+
+    def close(self) -> None:
+        """
+        Close the listening socket and remove the Unix socket file, if any.
+        """
+        self._server.server_close()
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.unlink(self.address)
+
+    def __enter__(self) -> "TranslationServer":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def latency_percentiles(self) -> dict[str, float]:
+        """
+        Summarize the latency of every record answered so far. Percentiles
+        are estimated from a uniform sample of at most `MAX_LATENCY_SAMPLES`
+        latencies, the count and max are exact.
+
+        Returns:
+            dict[str, float]: the record count, then the p50/p90/p99 and max latencies in ms
+        """
+        with self._server.latencies_lock:
+            samples = sorted(self._server.latencies)
+            count = self._server.latency_count
+            latency_max = self._server.latency_max
+        summary: dict[str, float] = {"count": count}
+        for pct in PERCENTILES:
+            summary[f"p{pct}"] = percentile(samples, pct) * 1000
+        summary["max"] = latency_max * 1000
+        return summary
+
+    def report(self) -> str:
+        """
+        Returns:
+            str: a one line, human readable summary of `latency_percentiles()`
+        """
+        summary = self.latency_percentiles()
+        return f"{int(summary.pop('count'))} requests, " + ", ".join(
+            f"{name} {ms:.3f} ms" for name, ms in summary.items()
+        )
+
+
+class TranslationClient:
+    """
+    A client that sends NDJSON records to a `TranslationServer` over a single
+    connection and reads back one result per record.
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, timeout: float = 10.0) -> None:
+        """
+        Args:
+            address (str, optional): a Unix socket path or "HOST:PORT". Defaults to "tl-python.sock".
+            timeout (float, optional): seconds to wait for the server. Defaults to 10.
+
+        Raises:
+            OSError: if the server could not be reached
+        """
+        parsed = parse_address(address)
+        if isinstance(parsed, str):
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._sock = socket.socket(_address_family(parsed[0]), socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(parsed)
+        self._file: IO[str] = self._sock.makefile("rw", encoding="utf-8", newline="\n")
+
+    def request(self, record: dict[str, object]) -> dict[str, object]:
+        """
+        Send one record and wait for its result.
+
+        Args:
+            record (dict[str, object]): the record to send
+
+        Returns:
+            dict[str, object]: the server's result for the record
+        """
+        _ = self._file.write(dump_record(record))
+        self._file.flush()
+        return json.loads(self._file.readline())
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self) -> "TranslationClient":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
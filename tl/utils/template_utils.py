@@ -0,0 +1,159 @@
+import logging
+from collections.abc import Mapping
+from functools import lru_cache
+from string import Formatter
+
+logger = logging.getLogger(__name__)
+
+
+class Template:
+    """
+    An i18n string whose placeholders were parsed once into literal segments
+    and the names of the args they require:
+
+    >>> Template("Welcome {name}!").render(name="Blake")
+    'Welcome Blake!'
+
+    Strings without placeholders are returned unchanged without any
+    formatting. Otherwise rendering only costs an arg count check on top of
+    the C-level `str.format_map`, and the full missing/unexpected arg check
+    only runs when that check or the format fails.
+
+    Attributes:
+        source (str): the raw i18n string
+        literals (tuple[str, ...]): the literal text around each placeholder, unescaped
+        fields (tuple[str, ...]): the placeholders' field names, in order
+        field_names (frozenset[str]): the names of the args the string requires
+    """
+
+    __slots__ = ("source", "literals", "fields", "field_names", "_constant")
+
+    def __init__(self, source: str) -> None:
+        """
+        Args:
+            source (str): the raw i18n string to compile
+
+        Raises:
+            ValueError: if the string's placeholders are malformed, e.g. "{name"
+        """
+        self.source: str = source
+
+        if "{" not in source and "}" not in source:
+            self.literals: tuple[str, ...] = (source,)
+            self.fields: tuple[str, ...] = ()
+            self.field_names: frozenset[str] = frozenset()
+            self._constant: str | None = source
+            return
+
+        literals: list[str] = []
+        fields: list[str] = []
+        pending = ""
+        for literal, field_name, _, _ in Formatter().parse(source):
+            pending += literal
+            if field_name is None:
+                continue
+            literals.append(pending)
+            fields.append(field_name)
+            pending = ""
+        literals.append(pending)
+
+        self.literals = tuple(literals)
+        self.fields = tuple(fields)
+        # "user.name" and "items[0]" both require the "user"/"items" arg
+        self.field_names = frozenset(
+            name.partition(".")[0].partition("[")[0] for name in fields
+        )
+        self._constant = None if fields else pending
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.source!r})"
+
+    def _check_args(self, args: Mapping[str, object]) -> None:
+        if missing := self.field_names - args.keys():
+            raise KeyError(
+                f"Missing args for placeholders {sorted(missing)} in {self.source!r}"
+            )
+        if extra := args.keys() - self.field_names:
+            raise TypeError(
+                f"Unexpected args {sorted(extra)} for placeholders "
+                f"{sorted(self.field_names)} in {self.source!r}"
+            )
+
+    def render_map(self, args: Mapping[str, object]) -> str:
+        """
+        Format a mapping of args into the string's placeholders.
+
+        Args:
+            args (Mapping[str, object]): a value for every placeholder of the string
+
+        Raises:
+            KeyError: if an arg for one of the string's placeholders is missing
+            TypeError: if an arg does not match any of the string's placeholders
+
+        Returns:
+            str: the rendered string
+        """
+        if self._constant is not None:
+            if args:
+                self._check_args(args)
+            return self._constant
+        if len(args) == len(self.field_names):
+            try:
+                return self.source.format_map(args)
+            except KeyError:
+                pass
+        self._check_args(args)
+        return self.source.format_map(args)
+
+    def render(self, **args: object) -> str:
+        """
+        Format the given args into the string's placeholders.
+
+        Args:
+            **args (object): a value for every placeholder of the string
+
+        Raises:
+            KeyError: if an arg for one of the string's placeholders is missing
+            TypeError: if an arg does not match any of the string's placeholders
+
+        Returns:
+            str: the rendered string
+        """
+        return self.render_map(args)
+
+
+@lru_cache(maxsize=8192)
+def compile_template(source: str) -> Template:
+    """
+    Compile an i18n string into a `Template`. Compiled templates are cached,
+    so each distinct catalog string is only parsed once.
+
+    Args:
+        source (str): the raw i18n string to compile
+
+    Raises:
+        ValueError: if the string's placeholders are malformed, e.g. "{name"
+
+    Returns:
+        Template: the compiled template
+    """
+    logger.debug("Compiling template %r", source)
+    return Template(source)
+
+
+def render(source: str, **args: object) -> str:
+    """
+    Render an i18n string with the given args through its compiled template.
+
+    Args:
+        source (str): the raw i18n string
+        **args (object): a value for every placeholder of the string
+
+    Raises:
+        KeyError: if an arg for one of the string's placeholders is missing
+        TypeError: if an arg does not match any of the string's placeholders
+
+    Returns:
+        str: the rendered string
+    """
+    return compile_template(source).render(**args)
@@ -1,17 +1,41 @@
 import logging
+import os
+import stat
+import tempfile
+import threading
+import tomllib
+from collections.abc import Callable, Iterator, MutableMapping
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Annotated
+from typing import IO, Annotated, Literal, cast, get_args
 
-import tomlkit
-from glom import glom  # type: ignore
-from glom.core import PathAccessError  # type: ignore
-from pydantic import BeforeValidator, Field, validate_call
-from tomlkit.exceptions import EmptyKeyError, EmptyTableNameError
+from pydantic import BeforeValidator, Field
 
+from tl.utils.cache_utils import FileCache
+from tl.utils.catalog_utils import KEY_SEPARATOR, Catalog
+from tl.utils.compile_utils import (
+    BinaryCatalog,
+    open_compiled_catalog,
+    write_compiled_catalog,
+)
+from tl.utils.log_utils import describe_value
 from tl.utils.path_utils import valid_path_validator
+from tl.utils.validation_utils import validate_boundary
+
+try:
+    import fcntl
+except ImportError:  # Windows, where writers are only serialized within a process
+    fcntl = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Serializes this process's writers, which `flock()` alone does not do on
+# platforms without it
+_thread_write_lock: threading.Lock = threading.Lock()
+
+# Marks a key to delete among the changes of a `TomlTransaction`
+_DELETE: object = object()
+
 
 def valid_toml_path_validator(v: str | Path) -> Path:
     """
@@ -41,31 +65,81 @@ def valid_toml_path_validator(v: str | Path) -> Path:
     return valid_path_validator(v)
 
 
-@validate_call
-def serialize_toml_dict(
-    toml_file_path: Annotated[str | Path, BeforeValidator(valid_toml_path_validator)],
-) -> dict[str, object]:
+TomlBackend = Literal["tomllib", "tomlkit"]
+
+
+def _tomlkit_load(f: IO[bytes]) -> dict[str, object]:
+    # tomlkit is slow to import, so only pay for it when it is actually used
+    import tomlkit
+
+    return tomlkit.load(f)
+
+
+# tomllib builds plain dicts and is the fast choice for read-only lookups. tomlkit
+# keeps comments and formatting, so it is only needed for documents written back.
+_TOML_LOADERS: dict[str, Callable[[IO[bytes]], dict[str, object]]] = {
+    "tomllib": tomllib.load,
+    "tomlkit": _tomlkit_load,
+}
+
+_read_backend: TomlBackend = "tomllib"
+
+
+def get_read_backend() -> TomlBackend:
     """
-    Return a TOML file as a dictionary of key-value pairs from a specified
-    directory path.
+    Get the name of the parser backend used for cached, read-only TOML loads.
+
+    Returns:
+        TomlBackend: either "tomllib" (the default) or "tomlkit"
+    """
+    return _read_backend
+
+
+def set_read_backend(backend: TomlBackend) -> None:
+    """
+    Set the parser backend used for cached, read-only TOML loads. Changing the
+    backend clears `TOML_CACHE` and `CATALOG_CACHE`.
 
     Args:
-        toml_file_path (str | Path): the path of the TOML file to be loaded
+        backend (TomlBackend): either "tomllib" or "tomlkit"
 
     Raises:
-        RuntimeError: if an unknown/unchecked exception occurs when opening file
+        ValueError: if the backend is unknown
+    """
+    global _read_backend
+    if backend not in _TOML_LOADERS:
+        raise ValueError(
+            f"Unknown TOML backend '{backend}', expected one of {get_args(TomlBackend)}"
+        )
+    logger.debug("'backend'=%r", backend)
+    _read_backend = backend
+    TOML_CACHE.clear()
+    CATALOG_CACHE.clear()
+
+
+def parse_toml_file(
+    toml_file_path: Path, backend: TomlBackend | None = None
+) -> dict[str, object]:
+    """
+    Parse a TOML file from disk, bypassing the cache.
+
+    Args:
+        toml_file_path (Path): the path of the TOML file to be loaded
+        backend (TomlBackend | None, optional): the parser to use. Defaults to the read backend.
 
     Returns:
-        dict: the TOML-like dict obtained from the given TOML language file pah
+        dict: the TOML-like dict parsed from the file, or {} if it was empty
     """
+    load = _TOML_LOADERS[backend or _read_backend]
     try:
         with open(toml_file_path, "rb") as f:
-            if toml_data := tomlkit.load(f):
+            if toml_data := load(f):
                 logger.debug("TOML successfully serialized from '%s'", toml_file_path)
                 return toml_data
             logger.warning("None value serialized from '%s", toml_file_path)
             return {}
-    except (EmptyKeyError, EmptyTableNameError) as ee:
+    except ValueError as ee:
+        # tomllib.TOMLDecodeError and tomlkit's ParseError are both ValueErrors
         logger.exception("TOML file '%s' has invalid syntax", toml_file_path)
         raise ee
     except Exception as e:
@@ -73,13 +147,148 @@ def serialize_toml_dict(
         raise e
 
 
-@validate_call
+# Process-wide cache of parsed TOML files, keyed by (absolute path, mtime, size)
+TOML_CACHE: FileCache = FileCache(parse_toml_file)
+
+
+def _load_catalog_file(toml_file_path: Path) -> Catalog | BinaryCatalog:
+    """
+    Intended for internal use. Prefer an up to date binary catalog compiled
+    from the TOML file, otherwise compile the TOML source in memory.
+    """
+    return open_compiled_catalog(toml_file_path) or Catalog(
+        parse_toml_file(toml_file_path)
+    )
+
+
+# Process-wide cache of TOML files compiled into flat lookup indexes
+CATALOG_CACHE: FileCache = FileCache(_load_catalog_file)
+
+
+@validate_boundary
+def serialize_toml_dict(
+    toml_file_path: Annotated[str | Path, BeforeValidator(valid_toml_path_validator)],
+    backend: TomlBackend | None = None,
+) -> dict[str, object]:
+    """
+    Return a TOML file as a dictionary of key-value pairs from a specified
+    directory path. Files parsed with the read backend are kept in `TOML_CACHE`
+    and only re-parsed once they change on disk, so the returned dict is shared
+    and must not be mutated in place. Use `load_toml_document()` to get a
+    document that is meant to be edited and written back.
+
+    Args:
+        toml_file_path (str | Path): the path of the TOML file to be loaded
+        backend (TomlBackend | None, optional): the parser to use. Defaults to the read backend.
+
+    Raises:
+        RuntimeError: if an unknown/unchecked exception occurs when opening file
+
+    Returns:
+        dict: the TOML-like dict obtained from the given TOML language file pah
+    """
+    if backend and backend != _read_backend:
+        return parse_toml_file(Path(toml_file_path), backend)
+    return _serialize_toml_dict(toml_file_path)
+
+
+def _serialize_toml_dict(toml_file_path: str | Path) -> dict[str, object]:
+    """
+    Intended for internal use. `serialize_toml_dict()` with the read backend,
+    without validating the path.
+    """
+    return TOML_CACHE.get(toml_file_path)  # type: ignore[return-value]
+
+
+@validate_boundary
+def load_toml_document(
+    toml_file_path: Annotated[str | Path, BeforeValidator(valid_toml_path_validator)],
+) -> dict[str, object]:
+    """
+    Load a TOML file as a fresh, uncached tomlkit document that preserves
+    comments and formatting, for edits that will be written back with
+    `deserialize_toml_dict()`.
+
+    Args:
+        toml_file_path (str | Path): the path of the TOML file to be loaded
+
+    Returns:
+        dict: the editable TOML document, as a `tomlkit.TOMLDocument`
+    """
+    import tomlkit
+
+    with open(toml_file_path, "rb") as f:
+        return tomlkit.load(f)
+
+
+def _invalidate(toml_file_path: str | Path) -> None:
+    """
+    Intended for internal use. Drop the cached parses of a file that was just
+    written, and make every `Translator` re-resolve its catalog.
+    """
+    _ = TOML_CACHE.invalidate(toml_file_path)
+    _ = CATALOG_CACHE.invalidate(toml_file_path)
+    # Imported here, translation_utils is built on this module
+    from tl.utils.translation_utils import refresh_translators
+
+    refresh_translators()
+
+
+@contextmanager
+def _write_lock(directory: Path) -> Iterator[int | None]:
+    """
+    Intended for internal use. Hold the advisory lock that serializes writers
+    of the TOML files in a directory, across threads and, where `flock()` is
+    available, across processes. Yields the directory's file descriptor, for
+    syncing renames into it, or None if it cannot be opened.
+    """
+    with _thread_write_lock:
+        if fcntl is None:
+            yield None
+            return
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            fcntl.flock(dir_fd, fcntl.LOCK_EX)
+            yield dir_fd
+        finally:
+            # Closing the descriptor releases the lock
+            os.close(dir_fd)
+
+
+def _write_atomic(toml_file_path: Path, text: str, dir_fd: int | None) -> None:
+    """
+    Intended for internal use. Replace a file's contents without ever leaving
+    it half written: write a temp file next to it, fsync it and rename it over
+    the file. Readers see either the old or the new file.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=toml_file_path.parent, prefix=f".{toml_file_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            _ = f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(toml_file_path).st_mode))
+        os.replace(tmp_path, toml_file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    if dir_fd is not None:
+        # Make the rename itself survive a crash
+        os.fsync(dir_fd)
+
+
+@validate_boundary
 def deserialize_toml_dict(
     toml_data: Annotated[dict[str, object], Field(..., min_length=1)],
     toml_file_path: Annotated[str | Path, BeforeValidator(valid_toml_path_validator)],
 ) -> None:
     """
     Write a TOML-like dictionary to an specified, pre-existing TOML file path.
+    The file is replaced atomically, so a crash or a concurrent reader never
+    sees it half written. To change some keys of a file, prefer
+    `edit_toml_file()`, which rewrites it once for many changes.
 
     Args:
         toml_file_path (str | Path): TOML-like dictionary to be deserialized
@@ -88,11 +297,15 @@ def deserialize_toml_dict(
     Raises:
         RuntimeError: if an unknown/unchecked exception occurs when writing to file
     """
+    import tomlkit
+
+    toml_file_path = Path(toml_file_path)
     try:
-        with open(toml_file_path, "w") as f:
-            tomlkit.dump(toml_data, f)
+        with _write_lock(toml_file_path.parent) as dir_fd:
+            _write_atomic(toml_file_path, tomlkit.dumps(toml_data), dir_fd)
             logger.debug("Successfully deserialized TOML data to '%s'", toml_file_path)
-    except (EmptyKeyError, EmptyTableNameError) as ee:
+        _invalidate(toml_file_path)
+    except ValueError as ee:
         logger.exception("TOML file '%s' has invalid syntax", toml_file_path)
         raise ee
     except Exception as e:
@@ -100,7 +313,203 @@ def deserialize_toml_dict(
         raise e
 
 
-@validate_call
+def _apply_change(
+    document: MutableMapping[str, object], key_path: str, value: object
+) -> None:
+    """
+    Intended for internal use. Set or (with `_DELETE`) delete a dotted key path
+    in a tomlkit document, creating missing tables on the way to a set key.
+    """
+    import tomlkit
+
+    *parents, key = key_path.split(KEY_SEPARATOR)
+    table = document
+    for depth, parent in enumerate(parents, 1):
+        if parent not in table:
+            if value is _DELETE:
+                raise KeyError(f"Key '{key_path}' does not exist in TOML file")
+            table[parent] = tomlkit.table(is_super_table=depth < len(parents))
+        table = table[parent]  # type: ignore[assignment]
+        if not isinstance(table, MutableMapping):
+            path = KEY_SEPARATOR.join(parents[:depth])
+            raise TypeError(f"Key '{path}' of '{key_path}' is not a table")
+    if value is not _DELETE:
+        table[key] = value
+    elif key in table:
+        del table[key]
+    else:
+        raise KeyError(f"Key '{key_path}' does not exist in TOML file")
+
+
+class TomlTransaction:
+    """
+    A batch of changes to a TOML file, written all at once by `commit()`:
+
+    >>> with edit_toml_file("i18n/de.toml") as edit:
+    ...     edit.set("start.welcome", "Willkommen {name}!")
+    ...     edit.delete("start.old_title")
+
+    On commit, the file is re-read under the directory's write lock, so
+    concurrent writers never lose each other's changes, and the changes are
+    applied to it with tomlkit, keeping its comments and formatting. If any
+    change cannot be applied nothing is written. The file is then replaced
+    atomically and the cached catalogs of it are invalidated.
+
+    Attributes:
+        path (Path): the TOML file to change
+    """
+
+    __slots__ = ("path", "_changes")
+
+    def __init__(self, toml_file_path: str | Path) -> None:
+        """
+        Args:
+            toml_file_path (str | Path): the path of the TOML file to change
+        """
+        self.path: Path = Path(toml_file_path)
+        self._changes: list[tuple[str, object]] = []
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def __enter__(self) -> "TomlTransaction":
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: object) -> None:
+        if exc_type is None:
+            _ = self.commit()
+        else:
+            self.rollback()
+
+    def set(self, key_path: str, value: object) -> None:
+        """
+        Set the value of a dotted key path on commit, creating missing tables.
+
+        Args:
+            key_path (str): the dotted path of the key, e.g. "start.welcome"
+            value (object): the new value
+        """
+        self._changes.append((key_path, value))
+
+    def delete(self, key_path: str) -> None:
+        """
+        Delete a dotted key path, or a whole table, on commit.
+
+        Args:
+            key_path (str): the dotted path of the key, e.g. "start.welcome"
+        """
+        self._changes.append((key_path, _DELETE))
+
+    def rollback(self) -> None:
+        """
+        Discard the changes that were not committed yet.
+        """
+        self._changes.clear()
+
+    def commit(self) -> int:
+        """
+        Apply every pending change to the file in a single atomic write.
+
+        Raises:
+            KeyError: if a deleted key path does not exist, in which case nothing is written
+            TypeError: if a key path goes through a value that is not a table
+
+        Returns:
+            int: the number of changes written
+        """
+        if not self._changes:
+            return 0
+        import tomlkit
+
+        with _write_lock(self.path.parent) as dir_fd:
+            with open(self.path, "rb") as f:
+                document = tomlkit.load(f)
+            for key_path, value in self._changes:
+                _apply_change(document, key_path, value)
+            _write_atomic(self.path, tomlkit.dumps(document), dir_fd)
+        count = len(self._changes)
+        self._changes.clear()
+        _invalidate(self.path)
+        logger.debug("Committed %d changes to '%s'", count, self.path)
+        return count
+
+
+@validate_boundary
+def edit_toml_file(
+    toml_file_path: Annotated[str | Path, BeforeValidator(valid_toml_path_validator)],
+) -> TomlTransaction:
+    """
+    Start a batch of changes to a TOML file, committed when the returned
+    transaction's `with` block exits without an exception (see
+    `TomlTransaction`).
+
+    Args:
+        toml_file_path (str | Path): the path of the TOML file to change
+
+    Returns:
+        TomlTransaction: the transaction to add changes to
+    """
+    return TomlTransaction(toml_file_path)
+
+
+@validate_boundary
+def load_catalog(
+    toml_file_path: Annotated[str | Path, BeforeValidator(valid_toml_path_validator)],
+) -> Catalog | BinaryCatalog:
+    """
+    Return a TOML file compiled into a `Catalog` of flat lookup indexes, or the
+    mmap-backed `BinaryCatalog` compiled from it if that is up to date. The
+    catalog is kept in `CATALOG_CACHE` until the file changes on disk.
+
+    Args:
+        toml_file_path (str | Path): the path of the TOML file to be loaded
+
+    Returns:
+        Catalog | BinaryCatalog: the compiled catalog of the given TOML file
+    """
+    return _load_catalog(toml_file_path)
+
+
+def _load_catalog(toml_file_path: str | Path) -> Catalog | BinaryCatalog:
+    """
+    Intended for internal use. `load_catalog()` without validating the path.
+    """
+    return CATALOG_CACHE.get(toml_file_path)  # type: ignore[return-value]
+
+
+@validate_boundary
+def compile_toml_file(
+    toml_file_path: Annotated[str | Path, BeforeValidator(valid_toml_path_validator)],
+) -> Path:
+    """
+    Compile a TOML file into a binary catalog stored next to it, which lookups
+    will use until the TOML file changes again.
+
+    Args:
+        toml_file_path (str | Path): the path of the TOML file to compile
+
+    Returns:
+        Path: the path of the written binary catalog
+    """
+    return _compile_toml_file(toml_file_path)
+
+
+def _compile_toml_file(toml_file_path: str | Path) -> Path:
+    """
+    Intended for internal use. `compile_toml_file()` without validating the path.
+    """
+    # Stat before parsing: if the file changes meanwhile, the catalog records
+    # the old mtime and size and is ignored as stale, instead of passing old
+    # contents off as the new file
+    st = os.stat(toml_file_path)
+    compiled_path = write_compiled_catalog(
+        parse_toml_file(Path(toml_file_path)), toml_file_path, st
+    )
+    CATALOG_CACHE.invalidate(toml_file_path)
+    return compiled_path
+
+
+@validate_boundary
 def get_value_from_key(
     toml_file_path: Annotated[str | Path, BeforeValidator(valid_toml_path_validator)],
     key_path: str = Field(..., min_length=1),
@@ -113,32 +522,42 @@ def get_value_from_key(
         key_path (str): the path to the key in the specified language TOML dict
 
     Raises:
-        PathAccessError: if the value could not be retrieved from the given key path
+        KeyError: if the value could not be retrieved from the given key path
         FileNotFoundError: if the arg path to the TOML file does not exist
         RuntimeError: if an unknown/unchecked exception occurs when getting the value
 
     Returns:
         object: the value associated with the given key path
     """
+    return _get_value_from_key(toml_file_path, key_path)
+
+
+def _get_value_from_key(
+    toml_file_path: str | Path, key_path: str
+) -> str | list[str] | list[dict[str, object]]:
+    """
+    Intended for internal use. `get_value_from_key()` without validating its args.
+    """
     logger.debug("'key_path'=%r", key_path)
 
     try:
-        language_toml_dict: dict[str, object] = serialize_toml_dict(toml_file_path)
-        if value := glom(language_toml_dict, key_path):
-            logger.debug(
-                "Successfully retrieved '%s' with key '%s' from '%s'",
-                value,
-                key_path,
-                toml_file_path,
-            )
-            return value
+        if value := _load_catalog(toml_file_path).lookup(key_path):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Successfully retrieved %s with key '%s' from '%s'",
+                    describe_value(value),
+                    key_path,
+                    toml_file_path,
+                )
+            return cast(str | list[str] | list[dict[str, object]], value)
         logger.warning(
             "None retrieved with key '%s' from '%s'", key_path, toml_file_path
         )
         return [] if "*" in key_path else ""
-    except PathAccessError as pae:
-        logger.exception("Key '%s' does not exist in '%s'", key_path, toml_file_path)
-        raise KeyError(f"Key '{key_path}' does not exist in TOML file") from pae
+    except KeyError:
+        # Unknown keys are routine (e.g. stale clients), not worth a traceback
+        logger.debug("Key '%s' does not exist in '%s'", key_path, toml_file_path)
+        raise
     except Exception as e:
         logger.exception(
             "Could not get value with key '%s' from '%s' due to:",
@@ -1,18 +1,48 @@
 import logging
+from collections.abc import Iterable, Iterator, Mapping
 
-from pydantic import Field, validate_call
+from pydantic import Field
 
+from tl.utils.cache_utils import MissCache
+from tl.utils.catalog_utils import _MISSING, Catalog, ChainedCatalog
+from tl.utils.compile_utils import BinaryCatalog, share_compiled_catalog
 from tl.utils.config_utils import (
+    ConfigSnapshot,
     get_all_english_names,
-    get_all_language_codes,
     get_all_native_names,
-    get_fallback_language_code,
-    get_language_file_path,
+    get_config_snapshot,
+    is_supported_code,
 )
-from tl.utils.toml_utils import get_value_from_key
+from tl.utils.log_utils import describe_value
+from tl.utils.template_utils import compile_template
+from tl.utils.toml_utils import CATALOG_CACHE, _load_catalog
+from tl.utils.validation_utils import validate_boundary
 
 logger = logging.getLogger(__name__)
 
+# Lookups known to miss: key paths by the catalog they missed on, and
+# unsupported language codes and chain languages without a file by the config
+# snapshot they were checked against. Reloading a catalog or the config makes
+# its recorded misses stale.
+MISSING_KEYS: MissCache = MissCache()
+UNSUPPORTED_CODES: MissCache = MissCache()
+MISSING_FILES: MissCache = MissCache()
+
+# The default of lookups that raise `KeyError` for missing keys
+_RAISE: object = object()
+
+# Chained catalogs by fallback chain. A chain is rebuilt once any of its
+# catalogs is reloaded, so its recorded missing keys are forgotten.
+_chained: dict[tuple[str, ...], ChainedCatalog] = {}
+
+# Catalogs packed into shared memory by `share_catalogs()`, by language code.
+# They are snapshots: reloading files or the config does not replace them.
+_shared: dict[str, BinaryCatalog] = {}
+
+# Bumped by `refresh_translators()`. Each `Translator` re-resolves its catalog
+# on the next lookup after it changes.
+_generation: int = 0
+
 
 def get_languages(casefold: bool = False) -> list[str]:
     """
@@ -70,7 +100,7 @@ def get_languages_as_english_names(casefold: bool = False) -> list[str]:
     return languages
 
 
-@validate_call
+@validate_boundary
 def is_supported(language_code: str = Field(..., min_length=1)) -> bool:
     """
     Checks to see if a given language is supported.
@@ -83,77 +113,455 @@ def is_supported(language_code: str = Field(..., min_length=1)) -> bool:
     """
     logger.debug("'language_code'=%r", language_code)
 
-    supported: bool = language_code in get_all_language_codes()
-    logger.debug("'%s' is supported? '%s'", language_code, str(supported))
+    supported: bool = is_supported_code(language_code)
+    logger.debug("'%s' is supported? '%s'", language_code, supported)
     return supported
 
 
-@validate_call
+def _resolve_chain(language_code: str) -> tuple[ConfigSnapshot, tuple[str, ...]]:
+    """
+    Intended for internal use. Get the current config and a language code's
+    fallback chain, warning once per config if the code is not supported.
+    """
+    snapshot = get_config_snapshot()
+    chain = snapshot.chain_for(language_code)
+    if chain[0] != language_code and not UNSUPPORTED_CODES.has(language_code, snapshot):
+        # Only warned about once per config, however often it is requested
+        UNSUPPORTED_CODES.add(language_code, snapshot)
+        logger.warning("'%s' is not supported, using '%s'", language_code, chain[0])
+    return snapshot, chain
+
+
+def _resolve_catalog(
+    language_code: str,
+) -> tuple[str, Catalog | BinaryCatalog | ChainedCatalog]:
+    """
+    Intended for internal use. Resolve a language code into the code and
+    catalog that lookups should actually use. The catalog chains every
+    language in the code's fallback chain whose TOML file could be found, so
+    a key missing from the language is answered by the next language that
+    has it. Unsupported codes use their base language's chain, or the
+    fallback language's. Languages packed by `share_catalogs()` resolve to
+    their shared catalog.
+
+    Args:
+        language_code (str): the preferred language's code
+
+    Raises:
+        FileNotFoundError: if no TOML file of the language's chain could be found
+
+    Returns:
+        tuple[str, Catalog | BinaryCatalog | ChainedCatalog]: the resolved language code
+            and its catalog
+    """
+    snapshot, chain = _resolve_chain(language_code)
+    if (shared := _shared.get(chain[0])) is not None:
+        return chain[0], shared
+
+    codes: list[str] = []
+    catalogs: list[Catalog | BinaryCatalog] = []
+    for code in chain:
+        try:
+            catalogs.append(_load_catalog(snapshot.file_paths[code]))
+            codes.append(code)
+        except FileNotFoundError:
+            if not MISSING_FILES.has(code, snapshot):
+                MISSING_FILES.add(code, snapshot)
+                logger.warning("Could not find file for '%s', skipping it", code)
+    if not catalogs:
+        raise FileNotFoundError(
+            f"Could not find a language file for any of {list(chain)}"
+        )
+    if len(catalogs) == 1:
+        return codes[0], catalogs[0]
+
+    return codes[0], _chain(tuple(codes), catalogs)
+
+
+def _chain(
+    codes: tuple[str, ...], catalogs: list[Catalog | BinaryCatalog]
+) -> ChainedCatalog:
+    """
+    Intended for internal use. The chained catalog of a fallback chain's
+    loaded catalogs, reused for as long as none of them is reloaded.
+    """
+    chained = _chained.get(codes)
+    if chained is None or any(a is not b for a, b in zip(chained.catalogs, catalogs)):
+        logger.debug("Chaining the catalogs of %s", codes)
+        chained = _chained[codes] = ChainedCatalog(catalogs)
+    return chained
+
+
+def _resolve_cached_catalog(
+    language_code: str,
+) -> tuple[str, Catalog | BinaryCatalog | ChainedCatalog] | None:
+    """
+    Intended for internal use. `_resolve_catalog()`, but only if every catalog
+    of the language's chain is cached and fresh. Never loads anything, so it
+    only costs `stat()` calls.
+
+    Returns:
+        tuple[str, Catalog | BinaryCatalog | ChainedCatalog] | None: the resolved
+            language code and its catalog, or `None` if resolving it needs a load
+    """
+    snapshot, chain = _resolve_chain(language_code)
+    if (shared := _shared.get(chain[0])) is not None:
+        return chain[0], shared
+
+    catalogs: list[Catalog | BinaryCatalog] = []
+    for code in chain:
+        try:
+            catalog = CATALOG_CACHE.peek(snapshot.file_paths[code])
+        except FileNotFoundError:
+            return None  # left to `_resolve_catalog()` to skip and log
+        if catalog is None:
+            return None
+        catalogs.append(catalog)  # type: ignore[arg-type]
+    if len(catalogs) == 1:
+        return chain[0], catalogs[0]
+
+    return chain[0], _chain(chain, catalogs)
+
+
+def _lookup_i18n_obj(
+    language_code: str,
+    catalog: Catalog | BinaryCatalog | ChainedCatalog,
+    key_path: str,
+    default: object = _RAISE,
+) -> object:
+    """
+    Intended for internal use. Get the value of a specific key from an
+    already resolved language catalog. Keys that do not exist are recorded in
+    `MISSING_KEYS`, so asking for them again skips the catalog.
+
+    Args:
+        language_code (str): the code of the language the catalog belongs to
+        catalog (Catalog | BinaryCatalog | ChainedCatalog): the language's catalog
+        key_path (str): the key's path in the language catalog. supports globbing.
+        default (object, optional): returned if the key path does not exist, instead of
+            raising
+
+    Raises:
+        KeyError: if the key path does not exist in the catalog and there is no default
+
+    Returns:
+        object: the value (as an object) of associated with the given key, or None if empty
+    """
+    miss = (id(catalog), key_path)
+    if MISSING_KEYS.has(miss, catalog):
+        value = _MISSING
+    elif (value := catalog.get(key_path, _MISSING)) is _MISSING:
+        MISSING_KEYS.add(miss, catalog)
+    if value is _MISSING:
+        if default is _RAISE:
+            raise KeyError(f"Key '{key_path}' does not exist in TOML file")
+        return default
+
+    if value:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Successfully retrieved %s with key '%s' from '%s' TOML file",
+                describe_value(value),
+                key_path,
+                language_code,
+            )
+        return value
+    logger.warning(
+        "None value retrieved with key '%s' from '%s' TOML file",
+        key_path,
+        language_code,
+    )
+    return None
+
+
+@validate_boundary
 def get_i18n_obj(
     language_code: str = Field(..., min_length=1),
     key_path: str = Field(..., min_length=1),
+    default: object = _RAISE,
 ) -> object:
     """
     Get the value of a specific key from a given language TOML file. Uses the
     fallback language if a preferred language TOML file could not be found or
-    if the language is not supported.
+    if the language is not supported. With a default, missing keys return it
+    without raising (or creating) any exception:
+
+    >>> get_i18n_obj("de", "no.such.key", default=None)
 
     Args:
         language_code (str): the language's code from which to retrieve the i18n object
         key_path (str): the key's path in the specified language TOML file. supports globbing.
+        default (Optional[object]): returned if the key path does not exist, instead of
+            raising
+
+    Raises:
+        KeyError: if the key path does not exist and there is no default
 
     Returns:
         object: the value (as an object) of associated with the given key
     """
-    if not is_supported(language_code):
-        logger.warning("'%s' is not supported, using fallback", language_code)
-        try:
-            return _get_i18n_obj(get_fallback_language_code(), key_path)
-        except FileNotFoundError as fnfe:
-            logger.exception("Could not find file for fallback: '%s'")
-            raise fnfe
-
-    logger.debug(
-        "'%s' is supported. Getting value with '%s' from TOML file"
-        % (language_code, key_path)
-    )
-    try:
-        return _get_i18n_obj(language_code, key_path)
-    except FileNotFoundError:
-        logger.exception("Could not find file for '%s', using fallback", language_code)
-        try:
-            return _get_i18n_obj(get_fallback_language_code(), key_path)
-        except FileNotFoundError as fnfe:
-            logger.exception("Could not find file for fallback: '%s'", language_code)
-            raise fnfe
+    return _lookup_i18n_obj(*_resolve_catalog(language_code), key_path, default)
 
 
-def _get_i18n_obj(
+@validate_boundary
+def get_i18n_objs(
     language_code: str = Field(..., min_length=1),
-    key_path: str = Field(..., min_length=1),
-) -> object:
+    key_paths: Iterable[str] = Field(...),
+) -> Iterator[object]:
     """
-    Intended for internal use. Get the value of a specific key from a given
-    language TOML file.
+    Get the values of many keys from a given language TOML file. The language
+    is resolved (with the same fallback rules as `get_i18n_obj()`) and its
+    catalog loaded once, then the keys are looked up lazily as the returned
+    iterator is consumed.
 
     Args:
-        language_code (str): the language's code from which to retrieve the i18n object
-        key_path (str): the key's path in the specified language TOML file. supports globbing.
+        language_code (str): the language's code from which to retrieve the i18n objects
+        key_paths (Iterable[str]): the keys' paths in the language TOML file. supports globbing.
+
+    Raises:
+        KeyError: while iterating, if a key path does not exist in the language TOML file
 
     Returns:
-        object: the value (as an object) of associated with the given key
+        Iterator[object]: the value of each key, in the order of `key_paths`
     """
-    if value := get_value_from_key(get_language_file_path(language_code), key_path):
-        logger.info(
-            "Successfully retrieved '%s' with key '%s' from '%s' TOML file",
-            value,
-            key_path,
-            language_code,
-        )
-        return value
-    logger.warning(
-        "None value retrieved with key '%s' from '%s' TOML file",
-        key_path,
-        language_code,
+    resolved_code, catalog = _resolve_catalog(language_code)
+    return (
+        _lookup_i18n_obj(resolved_code, catalog, key_path) for key_path in key_paths
     )
-    return None
+
+
+class Translator:
+    """
+    A translator bound to a single language. Language support and fallback are
+    resolved once when the translator is created and the language's catalog is
+    kept resident, so each lookup is only an index hit:
+
+    >>> translator = Translator("de")
+    >>> translator.t("start.welcome", name="Blake")
+    'Willkommen Blake!'
+
+    The resident catalog is only replaced after `refresh_translators()` is
+    called, e.g. by a running `watch_utils.CatalogWatcher`.
+
+    A translator can be shared between threads. Lookups take no locks, and a
+    lookup that races a refresh uses either the old or the new catalog.
+
+    Attributes:
+        requested_code (str): the language code the translator was created with
+        language_code (str): the language code lookups actually use, after fallback
+        catalog (Catalog | BinaryCatalog | ChainedCatalog): the resident catalog of
+            `language_code`
+    """
+
+    __slots__ = ("requested_code", "language_code", "catalog", "_generation")
+
+    @validate_boundary
+    def __init__(self, language_code: str = Field(..., min_length=1)) -> None:
+        """
+        Args:
+            language_code (str): the code of the preferred language
+
+        Raises:
+            FileNotFoundError: if the fallback language's TOML file could not be found
+        """
+        self.requested_code: str = language_code
+        self.language_code: str
+        self.catalog: Catalog | BinaryCatalog | ChainedCatalog
+        self._refresh()
+
+    def _refresh(self) -> None:
+        # Read the generation first, so a refresh that happens while resolving
+        # is picked up by the next lookup
+        self._generation: int = _generation
+        self.language_code, self.catalog = _resolve_catalog(self.requested_code)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.language_code!r})"
+
+    def get(self, key_path: str, default: object = _RAISE) -> object:
+        """
+        Get the value of a specific key from the bound language.
+
+        Args:
+            key_path (str): the key's path in the language TOML file. supports globbing.
+            default (Optional[object]): returned if the key path does not exist, instead
+                of raising
+
+        Raises:
+            KeyError: if the key path does not exist and there is no default
+
+        Returns:
+            object: the value (as an object) of associated with the given key
+        """
+        if self._generation != _generation:
+            self._refresh()
+        return _lookup_i18n_obj(self.language_code, self.catalog, key_path, default)
+
+    def keys(self, prefix: str = "", recursive: bool = True) -> Iterator[str]:
+        """
+        Lazily yield the dotted key paths below a table of the bound language,
+        including the keys only its fallbacks have. Only the keys below the
+        table are visited, however large the catalog:
+
+        >>> list(Translator("de").keys("start"))
+        ['start.welcome', 'start.title']
+
+        Args:
+            prefix (str, optional): the dotted path of the table. Defaults to the root.
+            recursive (bool, optional): descend into nested tables, yielding only the
+                keys of values. Defaults to True.
+
+        Returns:
+            Iterator[str]: the key path of each key, in document order
+        """
+        if self._generation != _generation:
+            self._refresh()
+        return self.catalog.keys(prefix, recursive)
+
+    def t(self, key_path: str, **args: object) -> str:
+        """
+        Translate a key from the bound language, formatting any given args into
+        the i18n string's placeholder variables through its compiled template.
+
+        Args:
+            key_path (str): the key's path in the language TOML file
+            **args (object): values for the i18n string's placeholder variables
+
+        Raises:
+            KeyError: if the key path or an arg for a placeholder variable does not exist
+            TypeError: if an arg does not match any of the placeholder variables
+
+        Returns:
+            str: the translated and formatted i18n string
+        """
+        value = self.get(key_path)
+        if not isinstance(value, str):
+            return str(value)
+        return compile_template(value).render(**args)
+
+
+def refresh_translators() -> None:
+    """
+    Make every `Translator` re-resolve its language and catalog on its next
+    lookup, e.g. after the config or a language file was reloaded, and forget
+    the recorded misses.
+    """
+    global _generation
+    _generation += 1
+    _chained.clear()
+    MISSING_KEYS.clear()
+    UNSUPPORTED_CODES.clear()
+    MISSING_FILES.clear()
+    logger.debug("Translators will refresh, generation %d", _generation)
+
+
+def share_catalogs(language_codes: Iterable[str] | None = None) -> int:
+    """
+    Pack the resolved catalogs of languages, fallback chains merged in, into
+    read-only shared memory, for servers that fork their workers after
+    loading. Every worker forked afterwards maps the same physical pages, so
+    a host pays for the catalogs once instead of once per worker: lookups
+    binary search the shared buffer and decode only the strings they return,
+    leaving nothing behind that copy-on-write would duplicate.
+
+    >>> share_catalogs()
+    >>> # e.g. then start gunicorn workers or a multiprocessing fork pool
+
+    The shared catalogs are snapshots. Changed files or config are not picked
+    up by them until this is called again, which only reaches processes forked
+    after the call. The catalogs they were packed from are dropped from
+    `CATALOG_CACHE`, so forked workers do not inherit those either.
+
+    Args:
+        language_codes (Iterable[str] | None, optional): the languages to share.
+            Defaults to every language in the config file.
+
+    Raises:
+        FileNotFoundError: if no TOML file of a language's chain could be found
+
+    Returns:
+        int: the total size of the shared catalogs in bytes
+    """
+    snapshot = get_config_snapshot()
+    if language_codes is None:
+        language_codes = snapshot.file_paths
+    total = 0
+    for code in language_codes:
+        _ = _shared.pop(code, None)
+        resolved_code, catalog = _resolve_catalog(code)
+        if resolved_code != code:
+            logger.warning("Not sharing '%s', it resolves to '%s'", code, resolved_code)
+            continue
+        shared = _shared[code] = share_compiled_catalog(catalog.tree)
+        total += shared.nbytes
+    for path in snapshot.file_paths.values():
+        _ = CATALOG_CACHE.invalidate(path)
+    refresh_translators()
+    logger.info("Shared %d catalogs in %d bytes", len(_shared), total)
+    return total
+
+
+def unshare_catalogs() -> None:
+    """
+    Drop the catalogs packed by `share_catalogs()`. Lookups load each
+    language's files again, and the shared memory is released once no
+    process maps it anymore.
+    """
+    _shared.clear()
+    refresh_translators()
+
+
+def translate_records(
+    records: Iterable[Mapping[str, object]],
+    translators: dict[str, Translator] | None = None,
+) -> Iterator[dict[str, object]]:
+    """
+    Translate a stream of `{"lang": ..., "key": ..., "args": {...}}` records,
+    where "args" is optional. A record with `"op": "lookup"` gets the key's raw
+    value instead of the rendered string. A `Translator` is created once per
+    language the records' codes resolve to, and reused for every record in
+    that language. A record that cannot be translated yields an "error"
+    instead of a "value" and does not stop the stream. Records that already
+    carry an "error" (e.g. unparsable input) are passed through as errors.
+
+    Args:
+        records (Iterable[Mapping[str, object]]): the records to translate
+        translators (dict[str, Translator] | None, optional): translators by resolved
+            language code to reuse and fill, e.g. across the requests of a long running server
+
+    Returns:
+        Iterator[dict[str, object]]: `{"lang", "key", "value"}` or `{"lang", "key", "error"}`
+            for each record, in order
+    """
+    if translators is None:
+        translators = {}
+    for record in records:
+        language_code = str(record.get("lang", "")).lower()
+        key_path = str(record.get("key", ""))
+        result: dict[str, object] = {"lang": language_code, "key": key_path}
+        if "error" in record:
+            result["error"] = record["error"]
+            yield result
+            continue
+        try:
+            if not language_code or not key_path:
+                raise ValueError("record requires a 'lang' and a 'key'")
+            # Keyed by the code it resolves to, so arbitrary client codes add
+            # no more translators than there are configured languages
+            _, chain = _resolve_chain(language_code)
+            if (translator := translators.get(chain[0])) is None:
+                translator = translators[chain[0]] = Translator(chain[0])
+            match record.get("op", "render"):
+                case "render":
+                    args = record.get("args") or {}
+                    if not isinstance(args, Mapping):
+                        raise TypeError("record 'args' must be an object")
+                    result["value"] = translator.t(key_path, **args)
+                case "lookup":
+                    result["value"] = translator.get(key_path)
+                case op:
+                    raise ValueError(f"unknown record op {op!r}")
+        except (KeyError, TypeError, ValueError, FileNotFoundError) as e:
+            logger.debug("Could not translate %r: %s", record, e)
+            result["error"] = e.args[0] if e.args else type(e).__name__
+        yield result
@@ -0,0 +1,88 @@
+import functools
+import inspect
+import logging
+import os
+from collections.abc import Callable
+from typing import Literal, ParamSpec, TypeVar, get_args
+
+from pydantic import validate_call
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+ValidationMode = Literal["strict", "fast"]
+
+VALIDATION_MODE_ENV: str = "TL_VALIDATION"
+
+
+def _mode_from_env() -> ValidationMode:
+    mode = os.environ.get(VALIDATION_MODE_ENV, "strict").lower()
+    if mode not in get_args(ValidationMode):
+        logger.warning("Ignoring unknown %s=%r", VALIDATION_MODE_ENV, mode)
+        return "strict"
+    return mode  # type: ignore[return-value]
+
+
+# Read by every boundary call, so it is kept as a plain bool
+_strict: bool = _mode_from_env() == "strict"
+
+
+def get_validation_mode() -> ValidationMode:
+    """
+    Returns:
+        ValidationMode: "strict" if public functions validate their args, "fast" otherwise
+    """
+    return "strict" if _strict else "fast"
+
+
+def set_validation_mode(mode: ValidationMode) -> None:
+    """
+    Choose whether public functions validate their args. "strict" (the default,
+    or whatever `TL_VALIDATION` is set to) runs pydantic validation, including
+    path existence checks, once per public call. "fast" skips it entirely and
+    is meant for trusted callers that already validated their input, e.g. a
+    server looking up keys it has checked itself.
+
+    Args:
+        mode (ValidationMode): "strict" or "fast"
+
+    Raises:
+        ValueError: if the mode is neither "strict" nor "fast"
+    """
+    global _strict
+    if mode not in get_args(ValidationMode):
+        raise ValueError(f"Unknown validation mode {mode!r}")
+    _strict = mode == "strict"
+    logger.debug("Validation mode set to %r", mode)
+
+
+def validate_boundary(func: Callable[P, R]) -> Callable[P, R]:
+    """
+    Decorate a public entry point of the package. Like pydantic's
+    `validate_call`, but validation only runs in "strict" mode. Internal code
+    must call the unvalidated implementation (e.g. `_load_catalog()`) instead
+    of another decorated function, so a call is validated once at the
+    boundary rather than at every layer below it. A decorated coroutine
+    function is still one, so `inspect.iscoroutinefunction()` and frameworks
+    relying on it keep working.
+
+    Args:
+        func (Callable[P, R]): the function to decorate
+
+    Returns:
+        Callable[P, R]: the decorated function
+    """
+    validated = validate_call(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if _strict:
+            return validated(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    if inspect.iscoroutinefunction(func):
+        # The wrapper only hands back the coroutine, without awaiting it
+        return inspect.markcoroutinefunction(wrapper)
+    return wrapper
@@ -0,0 +1,347 @@
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Literal, NamedTuple, Protocol
+
+from tl.utils.config_utils import ConfigSnapshot, get_config_snapshot, reload
+from tl.utils.toml_utils import CATALOG_CACHE
+from tl.utils.translation_utils import refresh_translators
+
+logger = logging.getLogger(__name__)
+
+WatchBackend = Literal["inotify", "polling"]
+
+DEFAULT_INTERVAL: float = 1.0
+
+# Editors often save a file in several writes, so changes are collected for a
+# moment after the first one before anything is reloaded
+DEBOUNCE_SECONDS: float = 0.05
+
+
+class ReloadStats(NamedTuple):
+    """
+    A point-in-time snapshot of a `CatalogWatcher`'s counters.
+    """
+
+    backend: WatchBackend
+    reloads: int
+    failures: int
+    last_duration: float
+    total_duration: float
+
+
+def _watched_files(snapshot: ConfigSnapshot) -> set[Path]:
+    return {snapshot.config_file_path, *snapshot.file_paths.values()}
+
+
+class _Backend(Protocol):
+    def watch(self, paths: set[Path]) -> None: ...
+
+    def wait(self, timeout: float) -> set[Path]: ...
+
+    def close(self) -> None: ...
+
+
+class _PollingBackend:
+    """
+    Detects changes by comparing each watched file's mtime and size with the
+    previous poll, so a poll costs one `stat()` per file.
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[Path, tuple[int, int] | None] = {}
+
+    @staticmethod
+    def _stat(path: Path) -> tuple[int, int] | None:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def watch(self, paths: set[Path]) -> None:
+        self._stats = {path: self._stat(path) for path in paths}
+
+    def _poll(self) -> set[Path]:
+        changed: set[Path] = set()
+        for path, previous in self._stats.items():
+            if (current := self._stat(path)) != previous:
+                self._stats[path] = current
+                changed.add(path)
+        return changed
+
+    def wait(self, timeout: float) -> set[Path]:
+        time.sleep(timeout)
+        if changed := self._poll():
+            time.sleep(DEBOUNCE_SECONDS)
+            changed |= self._poll()
+        return changed
+
+    def close(self) -> None:
+        self._stats.clear()
+
+
+class _InotifyBackend:
+    """
+    Detects changes with Linux inotify watches on the dirs holding the watched
+    files, so files that are replaced (e.g. saved through a rename) are seen too.
+    """
+
+    # IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _MASK = 0x002 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self) -> None:
+        """
+        Raises:
+            OSError: if inotify is not available
+        """
+        import ctypes
+        import ctypes.util
+
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd: int = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        self._paths: set[Path] = set()
+
+    def watch(self, paths: set[Path]) -> None:
+        for wd in self._dirs:
+            _ = self._libc.inotify_rm_watch(self._fd, wd)
+        self._dirs.clear()
+        self._paths = paths
+        for dir_path in {path.parent for path in paths}:
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(dir_path), self._MASK
+            )
+            if wd < 0:
+                logger.warning("Could not watch '%s'", dir_path)
+                continue
+            self._dirs[wd] = dir_path
+
+    def wait(self, timeout: float) -> set[Path]:
+        changed: set[Path] = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        while ready:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, _, _, name_len = self._EVENT.unpack_from(data, offset)
+                offset += self._EVENT.size
+                name = data[offset : offset + name_len].rstrip(b"\0")
+                offset += name_len
+                if (dir_path := self._dirs.get(wd)) is not None and name:
+                    if (path := dir_path / os.fsdecode(name)) in self._paths:
+                        changed.add(path)
+            ready, _, _ = select.select([self._fd], [], [], DEBOUNCE_SECONDS)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class CatalogWatcher:
+    """
+    Watches the config file and every configured language file from a
+    background thread, for long running processes whose catalogs change
+    without a restart:
+
+    >>> with CatalogWatcher(), TranslationServer() as server:
+    ...     server.serve_forever()
+
+    Only files that changed are re-parsed, and only if their catalog was
+    already loaded; the rest stay lazy. The new config snapshot and catalogs
+    are built off to the side and swapped in whole, so a lookup in flight
+    keeps the consistent catalog it started with. Resident `Translator`s
+    switch over on their next lookup. While the watcher runs, lookups never
+    check or re-parse loaded files themselves, so a file being saved, or
+    saved broken, is never read by a request. If a changed file fails to load, the
+    error is logged and counted, and its previous catalog keeps being served
+    until the file changes again. If the config file fails to load, the
+    previous config and catalogs stay in place.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        backend: WatchBackend | None = None,
+    ) -> None:
+        """
+        Args:
+            interval (float, optional): max seconds between checks (and to stop). Defaults to 1.
+            backend (WatchBackend | None, optional): "inotify" or "polling". Defaults to
+                inotify where available, polling otherwise.
+
+        Raises:
+            OSError: if the "inotify" backend was requested but is not available
+        """
+        self.interval = interval
+        self._backend: _Backend
+        if backend in (None, "inotify"):
+            try:
+                self._backend = _InotifyBackend()
+                self.backend: WatchBackend = "inotify"
+            except (OSError, AttributeError):
+                if backend == "inotify":
+                    raise
+                logger.info("inotify is not available, polling for changes")
+                self._backend = _PollingBackend()
+                self.backend = "polling"
+        else:
+            self._backend = _PollingBackend()
+            self.backend = "polling"
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.reloads = 0
+        self.failures = 0
+        self.last_duration = 0.0
+        self.total_duration = 0.0
+
+    def start(self) -> "CatalogWatcher":
+        """
+        Start watching from a daemon thread.
+
+        Returns:
+            CatalogWatcher: the watcher itself
+        """
+        self._backend.watch(_watched_files(get_config_snapshot()))
+        # Lookups now serve the loaded catalogs as they are, so only this
+        # thread ever parses a changed file
+        CATALOG_CACHE.attach_watcher()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="tl-catalog-watcher", daemon=True
+        )
+        self._thread.start()
+        logger.info("Watching catalogs with %s", self.backend)
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop watching, waiting up to `interval` seconds for the thread to exit.
+        A thread still reloading by then finishes that reload in the
+        background, then exits.
+        """
+        self._stop.set()
+        if self._thread is None:
+            self._backend.close()
+            return
+        CATALOG_CACHE.detach_watcher()
+        self._thread.join(timeout=self.interval)
+        if self._thread.is_alive():
+            logger.warning("Watcher thread still busy, leaving it to exit")
+        self._thread = None
+
+    def __enter__(self) -> "CatalogWatcher":
+        return self.start()
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                if changed := self._backend.wait(self.interval):
+                    self.reload(changed)
+        finally:
+            self._backend.close()
+
+    def reload(self, changed: Iterable[Path]) -> bool:
+        """
+        Reload the config file and the already loaded catalogs among the
+        changed files, then make resident translators pick them up. Called by
+        the watcher thread, but can be called directly too.
+
+        Args:
+            changed (Iterable[Path]): the paths of the files that changed
+
+        Returns:
+            bool: `True` if everything reloaded, `False` if a file failed to load
+        """
+        changed = set(changed)
+        start = time.perf_counter()
+        try:
+            snapshot = get_config_snapshot()
+            if snapshot.config_file_path in changed:
+                snapshot = reload()
+                self._backend.watch(_watched_files(snapshot))
+        except Exception:
+            logger.exception("Could not reload %s", sorted(map(str, changed)))
+            with self._lock:
+                self.failures += 1
+            return False
+
+        failed = False
+        for path in changed & set(snapshot.file_paths.values()):
+            if not path.exists():
+                _ = CATALOG_CACHE.invalidate(path)
+            elif path in CATALOG_CACHE:
+                try:
+                    _ = CATALOG_CACHE.refresh(path)
+                except Exception:
+                    logger.exception("Could not reload '%s'", path)
+                    failed = True
+                    # Serve the last good catalog until the file changes again,
+                    # rather than have every lookup re-parse the broken file
+                    try:
+                        _ = CATALOG_CACHE.pin(path)
+                    except FileNotFoundError:
+                        _ = CATALOG_CACHE.invalidate(path)
+        refresh_translators()
+        if failed:
+            with self._lock:
+                self.failures += 1
+            return False
+
+        duration = time.perf_counter() - start
+        with self._lock:
+            self.reloads += 1
+            self.last_duration = duration
+            self.total_duration += duration
+        logger.info(
+            "Reloaded %d changed files in %.3f ms", len(changed), duration * 1000
+        )
+        return True
+
+    def report(self) -> str:
+        """
+        Returns:
+            str: a one line, human readable summary of `stats()`
+        """
+        stats = self.stats()
+        return (
+            f"{stats.reloads} reloads ({stats.failures} failed) with {stats.backend}, "
+            f"last {stats.last_duration * 1000:.3f} ms, "
+            f"total {stats.total_duration * 1000:.3f} ms"
+        )
+
+    def stats(self) -> ReloadStats:
+        """
+        Get the watcher's current counters.
+
+        Returns:
+            ReloadStats: the backend, reload and failure counts, and reload durations in seconds
+        """
+        with self._lock:
+            return ReloadStats(
+                self.backend,
+                self.reloads,
+                self.failures,
+                self.last_duration,
+                self.total_duration,
+            )